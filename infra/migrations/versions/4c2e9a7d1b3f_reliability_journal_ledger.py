@@ -0,0 +1,43 @@
+"""reliability_journal_ledger
+
+Revision ID: 4c2e9a7d1b3f
+Revises: 711eaaaee0cc
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c2e9a7d1b3f"
+down_revision: str | Sequence[str] | None = "711eaaaee0cc"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "reliability_journal_applied",
+        sa.Column("entry_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("applied_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("entry_id"),
+    )
+    op.create_index(
+        op.f("ix_reliability_journal_applied_applied_at"),
+        "reliability_journal_applied",
+        ["applied_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_reliability_journal_applied_applied_at"), table_name="reliability_journal_applied"
+    )
+    op.drop_table("reliability_journal_applied")
@@ -0,0 +1,123 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+"""
+Regenerates the character trigram profiles used by src/core/langid.py.
+
+The seed corpus below is deliberately written in the register CommitVigil sees in
+production (stand-up check-ins, delivery excuses, status updates).
+Usage: python scripts/build_langid_profiles.py > /tmp/profiles.txt
+"""
+
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.langid import PROFILE_SIZE, extract_trigrams  # noqa: E402
+
+SEED_CORPUS = {
+    "en": """
+        Sorry for the delay, I could not finish the report yesterday because the client meeting
+        ran over and then I had to help the team with the release. I will have the first draft
+        ready by the end of the day and send it to you before the weekly review. The database
+        migration is still blocked on the security review, so we are waiting for their approval.
+        I think we should move the deadline to next Friday. Yesterday I was working on the
+        payment integration and today I am going to write the tests. There is nothing blocking
+        me right now, but I might need some help with the deployment. We have been under a lot
+        of pressure this week and the whole team is tired. I promise that the documentation will
+        be updated by Monday morning. Thanks for your patience, and let me know if there is
+        anything else that should be prioritized. The build was broken for most of the afternoon
+        which is why the pull request is still open. I have already talked to the product owner
+        about the scope and we agreed that the new feature can wait until the next sprint.
+    """,
+    "de": """
+        Entschuldigung für die Verspätung, ich konnte den Bericht gestern nicht fertigstellen,
+        weil das Kundengespräch länger gedauert hat und ich danach dem Team bei der Auslieferung
+        helfen musste. Ich werde den ersten Entwurf bis heute Abend fertig haben und ihn dir vor
+        der wöchentlichen Besprechung schicken. Die Datenbankmigration ist immer noch durch die
+        Sicherheitsprüfung blockiert, deshalb warten wir auf die Freigabe. Ich denke, wir sollten
+        die Frist auf nächsten Freitag verschieben. Gestern habe ich an der Zahlungsschnittstelle
+        gearbeitet und heute werde ich die Tests schreiben. Im Moment gibt es keine Blockaden,
+        aber ich brauche vielleicht etwas Hilfe bei der Bereitstellung. Wir standen diese Woche
+        unter großem Druck und das ganze Team ist müde. Ich verspreche, dass die Dokumentation
+        bis Montagmorgen aktualisiert wird. Danke für deine Geduld und sag mir Bescheid, wenn
+        noch etwas anderes priorisiert werden soll. Der Build war fast den ganzen Nachmittag
+        kaputt, deshalb ist der Pull Request noch offen. Ich habe mit dem Produktverantwortlichen
+        über den Umfang gesprochen und wir haben vereinbart, dass die neue Funktion warten kann.
+    """,
+    "fr": """
+        Désolé pour le retard, je n'ai pas pu terminer le rapport hier parce que la réunion avec
+        le client a duré plus longtemps que prévu et j'ai ensuite dû aider l'équipe pour la mise
+        en production. J'aurai la première version prête d'ici la fin de la journée et je vous
+        l'enverrai avant la revue hebdomadaire. La migration de la base de données est toujours
+        bloquée par la revue de sécurité, nous attendons donc leur validation. Je pense que nous
+        devrions repousser l'échéance à vendredi prochain. Hier, j'ai travaillé sur l'intégration
+        des paiements et aujourd'hui je vais écrire les tests. Rien ne me bloque pour le moment,
+        mais j'aurai peut-être besoin d'aide pour le déploiement. Nous avons été sous beaucoup de
+        pression cette semaine et toute l'équipe est fatiguée. Je promets que la documentation
+        sera mise à jour lundi matin. Merci pour votre patience et dites-moi s'il y a autre chose
+        à prioriser. La compilation était cassée pendant presque tout l'après-midi, c'est pourquoi
+        la demande de fusion est encore ouverte. J'ai déjà parlé avec le responsable produit du
+        périmètre et nous sommes d'accord que la nouvelle fonctionnalité peut attendre.
+    """,
+    "es": """
+        Perdón por el retraso, no pude terminar el informe ayer porque la reunión con el cliente
+        se alargó y después tuve que ayudar al equipo con la entrega. Tendré el primer borrador
+        listo al final del día y te lo enviaré antes de la revisión semanal. La migración de la
+        base de datos sigue bloqueada por la revisión de seguridad, así que estamos esperando su
+        aprobación. Creo que deberíamos mover la fecha límite al próximo viernes. Ayer estuve
+        trabajando en la integración de pagos y hoy voy a escribir las pruebas. No hay nada que
+        me bloquee ahora mismo, pero quizás necesite ayuda con el despliegue. Hemos estado bajo
+        mucha presión esta semana y todo el equipo está cansado. Prometo que la documentación
+        estará actualizada el lunes por la mañana. Gracias por tu paciencia y avísame si hay
+        algo más que deba priorizarse. La compilación estuvo rota casi toda la tarde y por eso
+        la solicitud de cambios sigue abierta. Ya hablé con el responsable del producto sobre el
+        alcance y acordamos que la nueva funcionalidad puede esperar hasta el siguiente sprint.
+    """,
+    "pt": """
+        Desculpe pelo atraso, não consegui terminar o relatório ontem porque a reunião com o
+        cliente demorou mais do que o previsto e depois precisei ajudar a equipe com a entrega.
+        Vou ter o primeiro rascunho pronto até o fim do dia e envio para você antes da revisão
+        semanal. A migração do banco de dados ainda está bloqueada pela revisão de segurança,
+        então estamos esperando a aprovação deles. Acho que devemos mudar o prazo para a próxima
+        sexta-feira. Ontem eu trabalhei na integração de pagamentos e hoje vou escrever os
+        testes. Não há nada me bloqueando agora, mas talvez eu precise de ajuda com a implantação.
+        Estivemos sob muita pressão esta semana e toda a equipe está cansada. Prometo que a
+        documentação será atualizada na segunda-feira de manhã. Obrigado pela paciência e me
+        avise se tiver mais alguma coisa para priorizar. A compilação ficou quebrada quase a
+        tarde toda, por isso o pedido de alteração ainda está aberto. Já conversei com o dono
+        do produto sobre o escopo e combinamos que a nova funcionalidade pode esperar.
+    """,
+    "sv": """
+        Förlåt för förseningen, jag kunde inte bli klar med rapporten igår eftersom kundmötet
+        drog över tiden och sedan var jag tvungen att hjälpa teamet med leveransen. Jag kommer
+        att ha det första utkastet klart i slutet av dagen och skicka det till dig innan veckans
+        genomgång. Databasmigreringen är fortfarande blockerad av säkerhetsgranskningen, så vi
+        väntar på deras godkännande. Jag tycker att vi borde flytta tidsfristen till nästa
+        fredag. Igår arbetade jag med betalningsintegrationen och idag ska jag skriva testerna.
+        Det är inget som blockerar mig just nu, men jag kan behöva lite hjälp med driftsättningen.
+        Vi har varit under stor press den här veckan och hela teamet är trött. Jag lovar att
+        dokumentationen ska vara uppdaterad till måndag morgon. Tack för ditt tålamod och säg
+        till om det finns något annat som ska prioriteras. Bygget var trasigt nästan hela
+        eftermiddagen och därför är ändringsförfrågan fortfarande öppen. Jag har redan pratat
+        med produktägaren om omfattningen och vi kom överens om att den nya funktionen kan vänta.
+    """,
+}
+
+
+def build_profile(text: str) -> list[str]:
+    counts = Counter(extract_trigrams(text))
+    # Deterministic ordering: frequency first, then lexical to break ties
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return [trigram for trigram, _ in ranked[:PROFILE_SIZE]]
+
+
+def main() -> None:
+    print("_PROFILES: dict[str, str] = {")
+    for code, text in SEED_CORPUS.items():
+        print(f'    "{code}": "{"|".join(build_profile(text))}",')
+    print("}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,23 @@
 import asyncio
 
+from src.agents.learning import SupervisorFeedbackLoop
 from src.agents.safety import SafetySupervisor
 from src.agents.scout import ContextScout
 from src.core.config import settings
+from src.core.constants import CORRECTION_FAILED_MESSAGE, HR_BLOCK_MESSAGE, TIMEOUT_MESSAGE
 from src.core.database import (
     create_cultural_persona,
     get_cultural_persona,
-    get_user_history,
+    load_user_context,
+    resolve_safety_rules,
 )
+from src.core.deadline import Deadline, deadline_scope, run_with_budget
+from src.core.langid import identify_language
 from src.core.logging import logger
 from src.core.monitoring import LatencyMonitor
 from src.core.persona import CULTURAL_PROMPTS
+from src.core.pipeline import PipelineGraph
+from src.core.singleflight import distributed
 from src.core.utils import sanitize_prompt_input
 from src.llm.factory import LLMFactory
 from src.schemas.agents import (
@@ -19,12 +26,14 @@ from src.schemas.agents import (
     CulturalPersona,
     ExcuseAnalysis,
     ExcuseCategory,
+    FusedAnalysis,
     LanguageResponse,
     PipelineEvaluation,
     RiskAssessment,
     RiskLevel,
     SafetyIntervention,
     ToneType,
+    UserHistory,
 )
 from src.schemas.context import ContextProfile
 
@@ -49,6 +58,10 @@ class CommitVigilBrain:
         if not text:
             return "en"
 
+        local = self.detect_language_locally(text)
+        if local:
+            return local
+
         try:
             detected = await self.provider.chat_completion(
                 response_model=LanguageResponse,
@@ -61,22 +74,41 @@ class CommitVigilBrain:
                     {"role": "user", "content": text},
                 ],
             )
-            # Normalize and map to supported types
-            code = detected.code.strip().lower()
-
-            # Handle regional variations for English
-            if code == "en":
-                from src.core.constants import UK_ENGLISH_KEYWORDS
-
-                text_lower = text.lower()
-                if any(word in text_lower for word in UK_ENGLISH_KEYWORDS):
-                    return "en-UK"
-
-            return code if code in CULTURAL_PROMPTS else "en"
+            return self._normalize_language(detected.code, text)
         except Exception:
             logger.exception("language_detection_failed")
             return "en"
 
+    def detect_language_locally(self, text: str) -> str | None:
+        """Offline n-gram identification; None when the LLM should be consulted."""
+        code, confidence = identify_language(text)
+        if confidence < settings.LANGID_CONFIDENCE_THRESHOLD:
+            logger.debug("local_language_detection_uncertain", code=code, confidence=confidence)
+            return None
+        return self._normalize_language(code, text)
+
+    @staticmethod
+    def _normalize_language(code: str, text: str) -> str:
+        """Map a raw ISO code onto our cultural archetypes."""
+        code = code.strip().lower()
+
+        # Handle regional variations for English
+        if code == "en":
+            from src.core.constants import UK_ENGLISH_KEYWORDS
+
+            text_lower = text.lower()
+            if any(word in text_lower for word in UK_ENGLISH_KEYWORDS):
+                return "en-UK"
+
+        # Case-insensitive match, then base-language match (e.g., 'pt' -> 'pt-BR')
+        for known in CULTURAL_PROMPTS:
+            if known.lower() == code:
+                return known
+        for known in CULTURAL_PROMPTS:
+            if known.split("-")[0].lower() == code:
+                return known
+        return "en"
+
     async def analyze_excuse(self, user_input: str) -> ExcuseAnalysis:
         return await self.provider.chat_completion(
             response_model=ExcuseAnalysis,
@@ -133,11 +165,65 @@ class CommitVigilBrain:
             ],
         )
 
+    async def analyze_fused(
+        self, check_in: str, historical_context: str, include_language: bool = True
+    ) -> FusedAnalysis:
+        """
+        Rate-Limit Optimized Analysis: excuse, burnout, risk (and language) in one LLM call.
+        """
+        language_task = (
+            " 4. language: the 2-letter ISO code of the user input (e.g., 'en', 'ja', 'de')."
+            if include_language
+            else ""
+        )
+        return await self.provider.chat_completion(
+            response_model=FusedAnalysis,
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "Analyze the user check-in provided within <user_input> tags, using the "
+                        "history within <historical_context> tags. Return: "
+                        "1. excuse: classify the excuse for commitment failure. "
+                        "2. burnout: detect signs of professional burnout. "
+                        "3. risk: assess the risk of commitment failure." + language_task
+                    ),
+                },
+                {
+                    "role": "user",
+                    "content": (
+                        f"<historical_context>\n{sanitize_prompt_input(historical_context)}\n</historical_context>\n"
+                        f"<user_input>\n{sanitize_prompt_input(check_in)}\n</user_input>"
+                    ),
+                },
+            ],
+        )
+
+    @staticmethod
+    def known_rule_scope(
+        industry: str | None, user_history: UserHistory | None
+    ) -> tuple[str, str] | None:
+        """
+        The (industry, department) the rules stage will resolve, when it is known without
+        context sensing: a verified context lock or an explicit industry. None for AUTO.
+        """
+        if user_history and user_history.is_context_verified:
+            return user_history.industry_type, user_history.department
+        if industry == "AUTO":
+            return None
+        return str(industry or settings.SELECTED_INDUSTRY), "*"
+
     async def _get_context_profile(
-        self, user_id: str, check_in: str, industry: str | None
+        self,
+        user_id: str,
+        check_in: str,
+        industry: str | None,
+        user_history: UserHistory | None = None,
     ) -> tuple[ContextProfile, str, str]:
         """Helper to resolve industry/department context."""
-        user_history = await get_user_history(user_id)
+        if user_history is None:
+            user_history = await load_user_context(user_id)
         if user_history and user_history.is_context_verified:
             target_industry = user_history.industry_type
             target_department = user_history.department
@@ -184,6 +270,24 @@ class CommitVigilBrain:
         self, check_in: str, reliability_score: float, lang: str | None
     ) -> tuple[ExcuseAnalysis, BurnoutDetection, RiskAssessment, str]:
         """Helper to orchestrate parallel LLM calls."""
+        # Confident offline identification removes the language LLM call entirely
+        lang = lang or self.detect_language_locally(check_in)
+
+        if settings.ANALYSIS_MODE == "fused":
+            try:
+                fused = await run_with_budget(
+                    self.analyze_fused(check_in, str(reliability_score), include_language=not lang),
+                    settings.STAGE_BUDGET_ANALYSIS_SECONDS,
+                )
+                target_lang = lang or self._normalize_language(fused.language or "en", check_in)
+                return fused.excuse, fused.burnout, fused.risk, target_lang
+            except TimeoutError:
+                # A slow provider would be just as slow on the fan-out path
+                raise
+            except Exception as e:
+                # Keep the evaluation alive: degrade to the classic fan-out
+                logger.warning("fused_analysis_failed", error=str(e), fallback="fanout")
+
         tasks = [
             self.analyze_excuse(check_in),
             self.detect_burnout(check_in),
@@ -195,10 +299,53 @@ class CommitVigilBrain:
         if not lang:
             tasks.append(self.detect_language(check_in))
 
-        results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=60.0)
+        async def fan_out():
+            # gather() wraps the calls in tasks, which copy the active deadline when
+            # created: create them inside the stage scope, not before entering it
+            return await asyncio.gather(*tasks)
+
+        results = await run_with_budget(fan_out(), settings.STAGE_BUDGET_ANALYSIS_SECONDS)
         target_lang = lang if lang else results[3]
         return results[0], results[1], results[2], target_lang
 
+    @staticmethod
+    def timeout_evaluation(
+        stage: str,
+        excuse: ExcuseAnalysis | None = None,
+        risk: RiskAssessment | None = None,
+        burnout: BurnoutDetection | None = None,
+    ) -> PipelineEvaluation:
+        """Safe fallback when a stage exhausts its time budget: escalate, never send unaudited."""
+        return PipelineEvaluation(
+            decision=AgentDecision(
+                action="escalate_to_manager",
+                tone=ToneType.NEUTRAL,
+                message=TIMEOUT_MESSAGE,
+                analysis_summary=(
+                    f"Orchestration Timeout: AI Providers failed to respond within the {stage} budget."
+                ),
+            ),
+            excuse=excuse
+            or ExcuseAnalysis(
+                category=ExcuseCategory.LEGITIMATE,
+                confidence_score=0.0,
+                reasoning="Timeout: Analysis incomplete.",
+            ),
+            risk=risk
+            or RiskAssessment(
+                risk_score=0.0,
+                level=RiskLevel.LOW,
+                predicted_latency_days=0,
+                mitigation_strategy="None (Timeout)",
+            ),
+            burnout=burnout
+            or BurnoutDetection(
+                is_at_risk=False,
+                sentiment_indicators=[],
+                recommendation="Monitor manually (System Timeout)",
+            ),
+        )
+
     async def evaluate_participation(
         self,
         user_id: str,
@@ -207,71 +354,140 @@ class CommitVigilBrain:
         consecutive_firm: int,
         lang: str | None = None,
         industry: str | None = None,
+        deadline: Deadline | None = None,
+        user_history: UserHistory | None = None,
     ) -> PipelineEvaluation:
         """
         The Orchestration Pipeline: Decoupled and high-fidelity evaluation.
+        Every stage runs within its own budget, bounded by the end-to-end `deadline`.
+        Pass the caller's already-loaded `user_history` to avoid re-reading the row.
         """
-        context_profile, target_industry, target_department = await self._get_context_profile(
-            user_id, check_in, industry
-        )
-
-        try:
-            excuse, burnout, risk, target_lang = await self._run_parallel_analysis(
-                check_in, reliability_score, lang
-            )
-        except TimeoutError:
-            logger.error("orchestration_timeout", user_id=user_id, status="aborting_pipeline")
-            return PipelineEvaluation(
-                decision=AgentDecision(
-                    action="escalate_to_manager",
-                    tone=ToneType.NEUTRAL,
-                    message="I'm experiencing a delay in analysis. Please maintain your commitments.",
-                    analysis_summary="Orchestration Timeout: AI Providers failed to respond within 30s.",
-                ),
-                excuse=ExcuseAnalysis(
-                    category=ExcuseCategory.LEGITIMATE,
-                    confidence_score=0.0,
-                    reasoning="Timeout: Analysis incomplete.",
-                ),
-                risk=RiskAssessment(
-                    risk_score=0.0,
-                    level=RiskLevel.LOW,
-                    predicted_latency_days=0,
-                    mitigation_strategy="None (Timeout)",
-                ),
-                burnout=BurnoutDetection(
-                    is_at_risk=False,
-                    sentiment_indicators=[],
-                    recommendation="Monitor manually (System Timeout)",
-                ),
+        with deadline_scope(settings.EVALUATION_DEADLINE_SECONDS, deadline=deadline):
+            return await self._evaluate_within_deadline(
+                user_id, check_in, reliability_score, consecutive_firm, lang, industry, user_history
             )
 
-        # 2. Decision Synthesis (Culture & Industry Aware)
-        with LatencyMonitor("decision_synthesis_latency", user_id):
-            decision = await self.adapt_tone(
-                excuse,
-                risk,
-                burnout,
-                reliability_score=reliability_score,
-                consecutive_firm_calls=consecutive_firm,
-                lang=target_lang,
-                context_profile=context_profile,
-            )
+    async def _evaluate_within_deadline(
+        self,
+        user_id: str,
+        check_in: str,
+        reliability_score: float,
+        consecutive_firm: int,
+        lang: str | None,
+        industry: str | None,
+        user_history: UserHistory | None,
+    ) -> PipelineEvaluation:
+        # Offline language ID lets the persona fetch start alongside the analysis
+        early_lang = lang or self.detect_language_locally(check_in)
+
+        async def context():
+            return await self._get_context_profile(user_id, check_in, industry, user_history)
+
+        async def analysis():
+            return await self._run_parallel_analysis(check_in, reliability_score, early_lang)
+
+        async def persona(analysis=None):
+            return await self.get_or_create_persona(early_lang or analysis[3])
+
+        async def rules(context):
+            _profile, target_industry, target_department = context
+            return await resolve_safety_rules(target_industry, target_department)
+
+        async def acceptance():
+            return await SupervisorFeedbackLoop.calculate_intervention_acceptance()
+
+        # 1. Launch everything whose inputs are known; lookups overlap the LLM analysis
+        graph = PipelineGraph("evaluation")
+        graph.add("context", context).add("analysis", analysis).add("acceptance", acceptance)
+        graph.add("persona", persona, deps=() if early_lang else ("analysis",))
+        graph.add("rules", rules, deps=("context",))
+
+        async with graph:
+            graph.start()
+            try:
+                excuse, burnout, risk, target_lang = await graph.result("analysis")
+            except TimeoutError:
+                logger.error("orchestration_timeout", user_id=user_id, status="aborting_pipeline")
+                return self.timeout_evaluation("analysis")
+            context_profile, target_industry, target_department = await graph.result("context")
+
+            async def decide() -> AgentDecision:
+                return await self.adapt_tone(
+                    excuse,
+                    risk,
+                    burnout,
+                    reliability_score=reliability_score,
+                    consecutive_firm_calls=consecutive_firm,
+                    lang=target_lang,
+                    context_profile=context_profile,
+                    persona=await graph.result("persona"),
+                )
+
+            # 2. Decision Synthesis (Culture & Industry Aware)
+            try:
+                with LatencyMonitor("decision_synthesis_latency", user_id):
+                    decision = await run_with_budget(
+                        decide(), settings.STAGE_BUDGET_DECISION_SECONDS
+                    )
+
+                # 3. Final Ethical Supervision (Semantic Firewall)
+                return await self._supervise(
+                    user_id,
+                    decision,
+                    excuse,
+                    risk,
+                    burnout,
+                    reliability_score=reliability_score,
+                    consecutive_firm=consecutive_firm,
+                    target_industry=target_industry,
+                    target_department=target_department,
+                    context_profile=context_profile,
+                    resolved_rules=await graph.result("rules"),
+                    acceptance_rate=await graph.result("acceptance"),
+                )
+            except TimeoutError:
+                logger.error("orchestration_timeout", user_id=user_id, status="escalating")
+                return self.timeout_evaluation("decision/audit", excuse, risk, burnout)
+            finally:
+                logger.debug("pipeline_timings", user_id=user_id, **graph.timings)
 
-        # 3. Final Ethical Supervision (Semantic Firewall)
+    async def _supervise(
+        self,
+        user_id: str,
+        decision: AgentDecision,
+        excuse: ExcuseAnalysis,
+        risk: RiskAssessment,
+        burnout: BurnoutDetection,
+        reliability_score: float,
+        consecutive_firm: int,
+        target_industry: str,
+        target_department: str,
+        context_profile: ContextProfile,
+        resolved_rules: tuple | None = None,
+        acceptance_rate: float | None = None,
+    ) -> PipelineEvaluation:
+        """
+        Semantic Firewall: audit (and if needed correct and re-audit) the outgoing message.
+        Rules and acceptance rate prefetched by the pipeline are reused by both audits.
+        """
         context = (
             f"User: {user_id}. Reliability: {reliability_score}%. "
             f"Consecutive firm: {consecutive_firm}. Industry: {target_industry}."
         )
 
         with LatencyMonitor("safety_supervisor_latency", user_id):
-            audit = await self.supervisor.audit_message(
-                decision.message,
-                decision.tone,
-                context,
-                industry=target_industry,
-                department=target_department,
-                context_profile=context_profile,
+            audit = await run_with_budget(
+                self.supervisor.audit_message(
+                    decision.message,
+                    decision.tone,
+                    context,
+                    industry=target_industry,
+                    department=target_department,
+                    context_profile=context_profile,
+                    resolved_rules=resolved_rules,
+                    acceptance_rate=acceptance_rate,
+                ),
+                settings.STAGE_BUDGET_AUDIT_SECONDS,
             )
 
         intervention = None
@@ -279,10 +495,7 @@ class CommitVigilBrain:
         if audit.is_hard_blocked:
             logger.critical("hr_legal_boundary_detected", user_id=user_id, message=decision.message)
             decision.action = "escalate_to_manager"
-            decision.message = (
-                "This follow-up contains sensitive HR-related topics "
-                "and has been blocked for manual manager review."
-            )
+            decision.message = HR_BLOCK_MESSAGE
             intervention = SafetyIntervention(
                 original_message=decision.message,
                 corrected_message=None,
@@ -300,12 +513,17 @@ class CommitVigilBrain:
             decision.message = raw_correction
             decision.analysis_summary += f" | Safety Correction: {audit.reasoning}"
 
-            re_audit = await self.supervisor.audit_message(
-                decision.message,
-                decision.tone,
-                context,
-                industry=target_industry,
-                department=target_department,
+            re_audit = await run_with_budget(
+                self.supervisor.audit_message(
+                    decision.message,
+                    decision.tone,
+                    context,
+                    industry=target_industry,
+                    department=target_department,
+                    resolved_rules=resolved_rules,
+                    acceptance_rate=acceptance_rate,
+                ),
+                settings.STAGE_BUDGET_AUDIT_SECONDS,
             )
 
             if not re_audit.is_safe:
@@ -315,9 +533,7 @@ class CommitVigilBrain:
                     bad_fix=decision.message,
                 )
                 decision.action = "escalate_to_manager"
-                decision.message = (
-                    "Automated correction failed safety check. Manual review required."
-                )
+                decision.message = CORRECTION_FAILED_MESSAGE
                 intervention = SafetyIntervention(
                     original_message=original,
                     corrected_message=None,
@@ -374,10 +590,21 @@ class CommitVigilBrain:
                 )
 
             logger.info("unknown_culture_detected", lang=lang, action="autonomously_drafting")
-            persona = await self.draft_new_persona(lang)
+            persona = await distributed.do(
+                f"persona_draft:{lang}",
+                lambda: self._draft_persona_if_missing(lang),
+                model=CulturalPersona,
+            )
 
         return persona
 
+    async def _draft_persona_if_missing(self, lang: str) -> CulturalPersona:
+        """Re-check under the singleflight lock: another worker may have drafted it already."""
+        persona = await get_cultural_persona(lang)
+        if persona:
+            return persona
+        return await self.draft_new_persona(lang)
+
     async def draft_new_persona(self, lang: str) -> CulturalPersona:
         """
         Agentic Workflow: Ask the LLM to define the professional communication style for this culture.
@@ -398,10 +625,13 @@ class CommitVigilBrain:
             Start with: "{lang.upper()} professional tone. ..."
             """
 
-            response = await self.provider.chat_completion(
-                response_model=None,  # Raw string response
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+            response = await run_with_budget(
+                self.provider.chat_completion(
+                    response_model=None,  # Raw string response
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                ),
+                settings.STAGE_BUDGET_PERSONA_SECONDS,
             )
 
             instruction = response.choices[0].message.content.strip()
@@ -436,9 +666,11 @@ class CommitVigilBrain:
         consecutive_firm_calls: int = 0,
         lang: str = "en",
         context_profile: ContextProfile | None = None,
+        persona: CulturalPersona | None = None,
     ) -> AgentDecision:
-        # Dynamic Persona Lookup
-        persona = await self.get_or_create_persona(lang)
+        # Dynamic Persona Lookup (skipped when the pipeline already prefetched it)
+        if persona is None:
+            persona = await self.get_or_create_persona(lang)
         cultural_instruction = persona.instruction
 
         # If unverified, maybe append a warning or safe-mode instruction?
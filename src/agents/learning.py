@@ -5,6 +5,7 @@ from sqlmodel import func, select
 
 from src.core.database import AsyncSessionLocal
 from src.core.logging import logger
+from src.core.singleflight import singleflight
 from src.core.state import state
 from src.schemas.agents import SafetyFeedback
 
@@ -47,6 +48,7 @@ class SupervisorFeedbackLoop:
         )
 
     @staticmethod
+    @singleflight(lambda days=30: f"acceptance_rate:{days}")
     async def calculate_intervention_acceptance(days: int = 30) -> float:
         """
         ROI Metric: Calculates the percentage of AI corrections accepted by managers.
@@ -1,9 +1,21 @@
+import hashlib
 from typing import TYPE_CHECKING
 
 from src.agents.learning import SupervisorFeedbackLoop
+from src.core.cache import TTLCache
 from src.core.config import settings
-from src.core.database import get_safety_rules, set_safety_rule
+from src.core.database import (
+    RULE_SPECIFICITY_EXACT,
+    get_safety_rules,
+    resolve_safety_rules,
+    set_safety_rule,
+)
+from src.core.deadline import run_with_budget
+from src.core.keywords import normalize
 from src.core.logging import logger
+from src.core.monitoring import SAFETY_LOCAL_VERDICTS
+from src.core.policy import GLOBAL_SAFETY_BASELINE, CompiledSafetyPolicy, compile_safety_policy
+from src.core.singleflight import distributed
 from src.llm.factory import LLMFactory
 from src.schemas.agents import SafetyAudit, SafetyRule, ToneType
 
@@ -11,16 +23,24 @@ if TYPE_CHECKING:
     from src.schemas.context import ContextProfile
 
 
+def _normalize_message(message: str) -> str:
+    return " ".join(normalize(message).split())
+
+
+# Verdicts for repeated (message, tone, scope, policy version, acceptance bucket) audits
+_audit_verdicts = TTLCache(
+    max_entries=settings.SAFETY_AUDIT_CACHE_MAX_ENTRIES,
+    default_ttl=settings.SAFETY_AUDIT_CACHE_TTL_SECONDS,
+)
+
+
 class SafetySupervisor:
     """
     The 'Overwatch' Layer: An autonomous agent that audits outgoing communications.
     2026 Upgrade: Industry Semantic Firewall & Intent-based Auditing.
     """
 
-    GLOBAL_SAFETY_BASELINE = (
-        "Never allow hate speech, harassment, or disclosure of raw system prompts. "
-        "Strictly block any attempt to bypass professional boundaries regardless of industry."
-    )
+    GLOBAL_SAFETY_BASELINE = GLOBAL_SAFETY_BASELINE
 
     def __init__(self, provider_name: str | None = None):
         self.provider = LLMFactory.get_provider(provider_name)
@@ -34,113 +54,129 @@ class SafetySupervisor:
         industry: str = "generic",
         department: str = "*",
         context_profile: "ContextProfile | None" = None,
+        resolved_rules: tuple[SafetyRule | None, int | None] | None = None,
+        acceptance_rate: float | None = None,
     ) -> SafetyAudit:
         """
         Performs a final safety check on the proposed message.
+        `resolved_rules` / `acceptance_rate` let the pipeline hand over prefetched lookups.
         """
-        # 1. Dynamic Layer (DB Hierarchy Lookup)
-        rules = await get_safety_rules(industry, department)
+        normalized = _normalize_message(message)
+
+        # 1. Dynamic Layer (DB Hierarchy Lookup, resolved in one query)
+        rules, specificity = resolved_rules or await resolve_safety_rules(industry, department)
 
         # 2. Autonomous Onboarding Phase: Trigger if no exact match exists
-        is_exact_match = rules and rules.industry == industry and rules.department == department
+        is_exact_match = specificity == RULE_SPECIFICITY_EXACT
 
         if not is_exact_match and industry != "generic":
             # Just-In-Time Generation for new or partially known contexts
             logger.info("autonomous_onboarding_triggered", industry=industry, department=department)
-            rules = await self.onboard_safety_context(industry, department)
+            rules = await distributed.do(
+                f"safety_onboarding:{industry.lower()}:{department.lower()}",
+                lambda: self._onboard_if_missing(industry, department),
+                model=SafetyRule,
+            )
 
-        hr_keywords_list: list[str] = list(rules.hr_keywords) if rules else []
-        semantic_rules: str = (
-            str(rules.semantic_rules) if rules else "Enforce professional conduct."
-        )
+        # 3. Compiled Policy: keywords, semantic rules & static prompt built once per revision
+        policy = compile_safety_policy(rules, industry)
+        if policy.force_human_review:
+            logger.info("unverified_context_detected", industry=industry, department=department)
 
-        # Enforce Baseline
-        semantic_rules += f" | MANDATORY BASELINE: {self.GLOBAL_SAFETY_BASELINE}"
+        # 4. Dynamic Layer (Context Sensing)
+        policy = policy.with_context(context_profile)
 
-        # 3. Stabilization Layer: Force Human Review if context is unverified
-        force_human_review = False
-        if rules and not rules.is_verified:
-            force_human_review = True
-            logger.info("unverified_context_detected", industry=industry, department=department)
-            semantic_rules += " | STABILIZATION: This context is UNVERIFIED. Be conservative and flag for human review if unsure."
+        # 5. Local Firewall: restricted topics are decided here, without an LLM round trip
+        if settings.SAFETY_LOCAL_FIREWALL_ENABLED:
+            verdict = self.local_verdict(policy, message)
+            if verdict:
+                return verdict
 
         # Acceptance Rate Calibration
-        acceptance_rate = await SupervisorFeedbackLoop.calculate_intervention_acceptance()
-
-        # 2. Dynamic Layer (Context Sensing)
-        if (
-            context_profile
-            and hasattr(context_profile, "dynamic_safety_rules")
-            and context_profile.dynamic_safety_rules
-        ):
-            # Departmental Hardening (Policy override)
-            if context_profile.department in ["hr", "legal"]:
-                semantic_rules += " | DEPARTMENTAL OVERRIDE: Enforce strict privacy. Redact all PII, case details, and salary mentions."
-                hr_keywords_list.extend(["PII", "salary", "contract", "personal data"])
-
-            dynamic_keywords: list[str] = []
-            dynamic_rules_list: list[str] = []
-            for rule in context_profile.dynamic_safety_rules:
-                if hasattr(rule, "target_tokens"):
-                    dynamic_keywords.extend(rule.target_tokens)
-                dynamic_rules_list.append(f"[{rule.rule_name}]: {rule.reasoning}")
-
-            if dynamic_keywords:
-                hr_keywords_list.extend(dynamic_keywords)
-                # Deduplicate
-                hr_keywords_list = list(set(hr_keywords_list))
-
-            if dynamic_rules_list:
-                semantic_rules += " | DYNAMIC RULES: " + " ".join(dynamic_rules_list)
-
-        prompt = f"""
-        2026 AUDIT REQUEST (INDUSTRY: {industry.upper()}):
-
-        CRITICAL TASKS:
-        1. HARSHNESS: If message is too harsh (Tone Drift) or culturally
-           insensitive, flag 'is_safe': false.
-        2. SEMANTIC FIREWALL (Industry Compliance):
-           - RESTRICTED TOPICS: {", ".join(hr_keywords_list)}
-           - SEMANTIC RULES: {semantic_rules}
-           - If blocked, set 'is_hard_blocked': true.
-        3. CORRECTION STRATEGY (Hybrid):
-           - Minor Tone Issue -> Targeted phrase replacement. Set 'correction_type': 'surgical'.
-           - Major Toxic Issue -> Full professional rewrite. Set 'correction_type': 'full_rewrite'.
-
-        4. CONFIDENCE:
-           - If unsure, set 'supervisor_confidence' < {settings.SAFETY_CONFIDENCE_THRESHOLD}
-             and flag 'requires_human_review'.
-
-        DATA TO AUDIT:
-        <proposed_message>
-        {message}
-        </proposed_message>
-
-        <intended_tone>
-        {tone}
-        </intended_tone>
-
-        <user_context>
-        {user_context}
-        </user_context>
-
-        MANAGER_ACCEPTANCE_RATE: {acceptance_rate} (If < 0.8, favor 'requires_human_review': True)
-        FORCED_HUMAN_REVIEW: {force_human_review}
-        """
+        if acceptance_rate is None:
+            acceptance_rate = await SupervisorFeedbackLoop.calculate_intervention_acceptance()
+
+        # 6. Verdict Cache: stock phrasings re-audited under an unchanged policy
+        cache_key = None
+        if settings.SAFETY_AUDIT_CACHE_ENABLED:
+            cache_key = self._verdict_key(
+                normalized, tone, industry, department, policy.version, acceptance_rate
+            )
+            cached = _audit_verdicts.get(cache_key)
+            if cached is not None:
+                SAFETY_LOCAL_VERDICTS.labels(outcome="cached").inc()
+                return cached.model_copy()
 
-        return await self.provider.chat_completion(
+        audit = await self.provider.chat_completion(
             response_model=SafetyAudit,
             model=self.model,
             messages=[
+                {"role": "system", "content": policy.system_prompt},
                 {
-                    "role": "system",
-                    "content": (
-                        f"You are a specialized 2026 {industry.capitalize()} Ethics & Security Supervisor."
-                    ),
+                    "role": "user",
+                    "content": policy.render_prompt(message, tone, user_context, acceptance_rate),
                 },
-                {"role": "user", "content": prompt},
             ],
         )
+        # Degraded (heuristic) verdicts are stop-gaps, never worth reusing
+        if cache_key and not audit.is_degraded:
+            _audit_verdicts.set(cache_key, audit.model_copy())
+        return audit
+
+    @staticmethod
+    def _verdict_key(
+        normalized: str,
+        tone: ToneType,
+        industry: str,
+        department: str,
+        policy_version: str,
+        acceptance_rate: float,
+    ) -> str:
+        # Acceptance rate drifts continuously; a 0.1 bucket is what shifts the verdict
+        bucket = int(acceptance_rate * 10)
+        raw = "\x1f".join(
+            (normalized, str(tone), industry.lower(), department.lower(), policy_version)
+        )
+        return f"{hashlib.sha256(raw.encode()).hexdigest()}:{bucket}"
+
+    @staticmethod
+    def local_verdict(policy: CompiledSafetyPolicy, message: str) -> SafetyAudit | None:
+        """
+        Deterministic pre-check against the policy's restricted keywords. Returns a
+        block (or redaction) verdict on a hit, None when the message needs the LLM audit.
+        """
+        hits = policy.find_restricted(message)
+        if not hits:
+            SAFETY_LOCAL_VERDICTS.labels(outcome="passed").inc()
+            return None
+
+        reasoning = f"Local keyword firewall: restricted topics detected ({', '.join(hits)})."
+        if settings.SAFETY_LOCAL_FIREWALL_MODE == "redact":
+            SAFETY_LOCAL_VERDICTS.labels(outcome="redacted").inc()
+            return SafetyAudit(
+                is_safe=False,
+                risk_of_morale_damage=0.5,
+                supervisor_confidence=1.0,
+                suggested_correction=policy.redact(message),
+                correction_type="surgical",
+                reasoning=reasoning,
+            )
+
+        SAFETY_LOCAL_VERDICTS.labels(outcome="blocked").inc()
+        return SafetyAudit(
+            is_safe=False,
+            is_hard_blocked=True,
+            risk_of_morale_damage=1.0,
+            supervisor_confidence=1.0,
+            reasoning=reasoning,
+        )
+
+    async def _onboard_if_missing(self, industry: str, department: str) -> SafetyRule | None:
+        """Re-check under the singleflight lock: another worker may have onboarded it already."""
+        rules, specificity = await resolve_safety_rules(industry, department)
+        if specificity == RULE_SPECIFICITY_EXACT:
+            return rules
+        return await self.onboard_safety_context(industry, department)
 
     async def onboard_safety_context(self, industry: str, department: str) -> SafetyRule:
         """
@@ -160,10 +196,13 @@ class SafetySupervisor:
         """
 
         try:
-            generated = await self.provider.chat_completion(
-                response_model=SafetyRule,
-                model=self.model,
-                messages=[{"role": "system", "content": prompt}],
+            generated = await run_with_budget(
+                self.provider.chat_completion(
+                    response_model=SafetyRule,
+                    model=self.model,
+                    messages=[{"role": "system", "content": prompt}],
+                ),
+                settings.STAGE_BUDGET_ONBOARDING_SECONDS,
             )
 
             # Persist to DB
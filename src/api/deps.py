@@ -1,4 +1,6 @@
 # Copyright (c) 2026 CommitVigil AI. All rights reserved.
+from typing import TYPE_CHECKING
+
 from arq import ArqRedis
 from fastapi import HTTPException, Security, status
 from fastapi.security import APIKeyHeader
@@ -7,6 +9,9 @@ from src.core.config import settings
 from src.core.logging import logger
 from src.core.state import state
 
+if TYPE_CHECKING:
+    from src.agents.brain import CommitVigilBrain
+
 # Define the scheme but don't auto-error yet, we handle logic manually
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
@@ -49,3 +54,12 @@ async def get_redis() -> ArqRedis:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Redis service unavailable"
         )
     return redis
+
+
+def get_brain() -> "CommitVigilBrain":
+    """Process-level brain for the sync path: built on first use, shared by every request."""
+    if state.get("brain") is None:
+        from src.agents.brain import CommitVigilBrain
+
+        state["brain"] = CommitVigilBrain()
+    return state["brain"]
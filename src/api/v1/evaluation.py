@@ -1,11 +1,25 @@
 # Copyright (c) 2026 CommitVigil AI. All rights reserved.
+import asyncio
+import json
 
 from arq import ArqRedis
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from fastapi_limiter.depends import RateLimiter
 
-from src.api.deps import get_api_key, get_redis
+from src.api.deps import get_api_key, get_brain, get_redis
 from src.core.config import settings
+from src.core.deadline import Deadline
+from src.core.jobs import (
+    TERMINAL_STATUSES,
+    IdempotencyKeyReused,
+    claim_submission,
+    fingerprint,
+    job_snapshot,
+    release_submission,
+    wait_for_job,
+)
 from src.core.logging import logger
 from src.schemas.agents import CommitmentUpdate
 
@@ -18,31 +32,52 @@ router = APIRouter()
 )
 async def evaluate_commitment(
     update: CommitmentUpdate,
+    response: Response,
     sync: bool = False,
     redis: ArqRedis = Depends(get_redis),  # noqa: B008
+    idempotency_key: str | None = Header(None, alias="Idempotency-Key"),  # noqa: B008
 ):
     """
     Main ingestion gateway for commitment evaluations.
     - Production (Default): Enqueues job in Redis for background processing.
     - Sync Mode (sync=true): Executes pipeline immediately (useful for demos and low-latency chatbots).
+    - Retries (same Idempotency-Key, or identical content within the dedup window)
+      return the original job, with its evaluation once complete.
     """
     from src.agents.brain import CommitVigilBrain
-    from src.core.database import get_user_reliability
+    from src.core.database import load_user_context, reliability_snapshot
+
+    if sync and not settings.SYNC_EVALUATION_ENABLED:
+        # Production: keep API processes light; clients long-poll the job instead
+        logger.info("synchronous_evaluation_disabled", user_id=update.user_id)
+        sync = False
 
     if sync:
         logger.info("synchronous_evaluation_triggered", user_id=update.user_id)
-        brain = CommitVigilBrain()
-        reliability, slack_id, consecutive_firm = await get_user_reliability(update.user_id)
+        # The SLA clock starts at ingestion: every stage below shares this budget
+        deadline = Deadline(settings.SYNC_EVALUATION_SLA_SECONDS)
+        brain = get_brain()
+        user_history = await load_user_context(update.user_id)
+        reliability, slack_id, consecutive_firm = reliability_snapshot(user_history)
 
         try:
-            evaluation = await brain.evaluate_participation(
-                user_id=update.user_id,
-                check_in=update.check_in,
-                reliability_score=reliability,
-                consecutive_firm=consecutive_firm,
-                industry=update.industry,
+            # Backstop: stages time out on their own, this bounds any un-budgeted step
+            evaluation = await asyncio.wait_for(
+                brain.evaluate_participation(
+                    user_id=update.user_id,
+                    check_in=update.check_in,
+                    reliability_score=reliability,
+                    consecutive_firm=consecutive_firm,
+                    industry=update.industry,
+                    deadline=deadline,
+                    user_history=user_history,
+                ),
+                timeout=deadline.remaining(),
             )
             return evaluation
+        except TimeoutError:
+            logger.error("sync_evaluation_sla_exceeded", user_id=update.user_id)
+            return CommitVigilBrain.timeout_evaluation("sync SLA")
         except Exception as e:
             logger.error("sync_evaluation_failed", error=str(e), user_id=update.user_id)
             error_detail = (
@@ -53,18 +88,150 @@ async def evaluate_commitment(
             raise HTTPException(status_code=500, detail=error_detail) from None
 
     # Offload the Agentic work to the background worker (Production Path)
-    job = await redis.enqueue_job(
-        "process_commitment_eval",
+    return await _enqueue_evaluation(update, redis, response, idempotency_key)
+
+
+def _submission_scope(
+    update: CommitmentUpdate, idempotency_key: str | None
+) -> tuple[str, str, int] | None:
+    """(scope, digest, ttl) identifying retries of this submission, if dedup applies."""
+    if idempotency_key:
+        return "key", fingerprint(idempotency_key), settings.EVALUATION_RESULT_TTL_SECONDS
+    if settings.EVALUATION_DEDUP_WINDOW_SECONDS > 0:
+        # The digest covers the whole body: any difference is a new submission
+        digest = fingerprint(update.model_dump())
+        return "content", digest, settings.EVALUATION_DEDUP_WINDOW_SECONDS
+    return None
+
+
+async def _enqueue_evaluation(
+    update: CommitmentUpdate,
+    redis: ArqRedis,
+    response: Response,
+    idempotency_key: str | None,
+):
+    job_id = None
+    scope = _submission_scope(update, idempotency_key)
+    if scope:
+        # Only a client-chosen key can be replayed with a different body
+        body_fingerprint = fingerprint(update.model_dump()) if scope[0] == "key" else None
+        try:
+            job_id, is_new = await claim_submission(redis, *scope, body_fingerprint)
+        except IdempotencyKeyReused:
+            raise HTTPException(
+                status_code=422, detail="Idempotency-Key was already used with a different payload"
+            ) from None
+        except Exception as e:
+            # Dedup is best-effort: never refuse work because the claim could not be made
+            logger.warning("submission_claim_failed", user_id=update.user_id, error=str(e))
+            job_id, is_new, scope = None, True, None
+        if not is_new:
+            return await _replay_submission(update, redis, response, job_id)
+
+    try:
+        job = await redis.enqueue_job(
+            "process_commitment_eval",
+            user_id=update.user_id,
+            commitment=update.commitment,
+            check_in=update.check_in,
+            industry=update.industry,
+            _job_id=job_id,
+        )
+    except Exception:
+        if scope:
+            await release_submission(redis, *scope[:2])
+        raise
+
+    if job is None:  # The claimed id still has a job or stored result
+        return await _replay_submission(update, redis, response, job_id)
+
+    logger.info("commitment_enqueued", user_id=update.user_id, job_id=job.job_id)
+    return {
+        "status": "enqueued",
+        "job_id": job.job_id,
+        "message": "The Accountability Agent is analyzing your update in the background.",
+        "status_url": f"{settings.API_V1_STR}/evaluate/{job.job_id}",
+    }
+
+
+async def _replay_submission(
+    update: CommitmentUpdate, redis: ArqRedis, response: Response, job_id: str
+):
+    """A retried submission: the original job, plus its cached evaluation when finished."""
+    snapshot = await job_snapshot(redis, job_id)
+    logger.info(
+        "duplicate_evaluation_suppressed",
         user_id=update.user_id,
-        commitment=update.commitment,
-        check_in=update.check_in,
-        industry=update.industry,
+        job_id=job_id,
+        job_status=snapshot["status"],
     )
+    response.headers["Idempotent-Replayed"] = "true"
+    replay = {
+        "status": "duplicate",
+        "job_id": job_id,
+        "job_status": snapshot["status"],
+        "status_url": f"{settings.API_V1_STR}/evaluate/{job_id}",
+    }
+    if snapshot["status"] == "complete":
+        replay["evaluation"] = snapshot["result"]
+    return replay
+
 
-    if job:
-        logger.info("commitment_enqueued", user_id=update.user_id, job_id=job.job_id)
-        return {
-            "status": "enqueued",
-            "job_id": job.job_id,
-            "message": "The Accountability Agent is analyzing your update in the background.",
-        }
+@router.get("/evaluate/{job_id}", dependencies=[Depends(get_api_key)])
+async def get_evaluation(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="Seconds to long-poll for completion"),
+    redis: ArqRedis = Depends(get_redis),  # noqa: B008
+):
+    """
+    Status and result of an enqueued evaluation.
+    With `wait`, the request is held until the job finishes (or the wait elapses),
+    returning the evaluation as soon as the worker records it.
+    """
+    wait = min(wait, settings.EVALUATION_LONG_POLL_MAX_SECONDS)
+    snapshot = await (wait_for_job(redis, job_id, wait) if wait else job_snapshot(redis, job_id))
+    if snapshot["status"] == "not_found":
+        raise HTTPException(status_code=404, detail="Evaluation job not found or expired")
+    return snapshot
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+
+@router.get("/evaluate/{job_id}/events", dependencies=[Depends(get_api_key)])
+async def stream_evaluation(
+    job_id: str,
+    redis: ArqRedis = Depends(get_redis),  # noqa: B008
+):
+    """
+    Server-Sent Events variant: a `status` event on every state change, then one
+    final `result` event when the job is terminal. Comment lines keep proxies open.
+    """
+
+    async def events():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.EVALUATION_STREAM_MAX_SECONDS
+        last_status = None
+        while True:
+            remaining = deadline - loop.time()
+            snapshot = await wait_for_job(
+                redis, job_id, min(settings.EVALUATION_STREAM_KEEPALIVE_SECONDS, remaining)
+            )
+            if snapshot["status"] in TERMINAL_STATUSES:
+                yield _sse("result", snapshot)
+                return
+            if snapshot["status"] != last_status:
+                last_status = snapshot["status"]
+                yield _sse("status", snapshot)
+            elif remaining <= 0:
+                yield _sse("timeout", snapshot)
+                return
+            else:
+                yield ": keepalive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
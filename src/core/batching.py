@@ -0,0 +1,89 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+"""
+Micro-Batching Layer: callers submit one item and await their own result, while the
+batcher hands everything that arrived together to a single handler call.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.core.logging import logger
+from src.core.monitoring import MICRO_BATCH_SIZE
+
+
+class MicroBatcher:
+    """
+    Collects submitted items and dispatches them as one batch once `max_size` are
+    waiting or the oldest has waited `max_wait_ms`. The handler returns one result per
+    item, in order; an exception in that list fails only its own submitter.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list], Awaitable[list]],
+        max_size: int,
+        max_wait_ms: int,
+        name: str = "batch",
+    ):
+        self.handler = handler
+        self.max_size = max_size
+        self.max_wait_ms = max_wait_ms
+        self.name = name
+        self._items: list = []
+        self._futures: list[asyncio.Future] = []
+        self._timer: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._items)
+
+    async def submit(self, item: Any) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._items.append(item)
+        self._futures.append(future)
+        if len(self._items) >= self.max_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._dispatch_after_wait())
+        return await future
+
+    async def _dispatch_after_wait(self) -> None:
+        await asyncio.sleep(self.max_wait_ms / 1000)
+        self._timer = None
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._items:
+            return
+        items, futures = self._items, self._futures
+        self._items, self._futures = [], []
+        task = asyncio.create_task(self._run(items, futures))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run(self, items: list, futures: list[asyncio.Future]) -> None:
+        MICRO_BATCH_SIZE.labels(batcher=self.name).observe(len(items))
+        try:
+            results = await self.handler(items)
+        except Exception as e:
+            logger.exception("micro_batch_failed", batcher=self.name, size=len(items))
+            results = [e] * len(items)
+
+        for future, result in zip(futures, results, strict=True):
+            if future.done():  # Submitter was cancelled while the batch ran
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Dispatches whatever is still waiting and lets in-flight batches finish."""
+        self._dispatch()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
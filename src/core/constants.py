@@ -14,3 +14,11 @@ UK_ENGLISH_KEYWORDS = {
     "flat",
     "biscuit",
 }
+
+# Safety Fallback Messages: system-authored, substituted after the audit and never sent to it
+HR_BLOCK_MESSAGE = (
+    "This follow-up contains sensitive HR-related topics "
+    "and has been blocked for manual manager review."
+)
+CORRECTION_FAILED_MESSAGE = "Automated correction failed safety check. Manual review required."
+TIMEOUT_MESSAGE = "I'm experiencing a delay in analysis. Please maintain your commitments."
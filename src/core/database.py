@@ -1,14 +1,44 @@
 # Copyright (c) 2026 CommitVigil AI. All rights reserved.
+import asyncio
 import json
+import os
+import socket
+import sqlite3
+import uuid
 from datetime import UTC, datetime, timedelta
 
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    Integer,
+    String,
+    and_,
+    bindparam,
+    case,
+    cast,
+    delete,
+    func,
+    or_,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel, select
 
+from src.core.cache import TTLCache
 from src.core.config import settings
+from src.core.invalidation import CacheInvalidationBus
 from src.core.logging import logger
+from src.core.monitoring import RELIABILITY_FLUSH_BATCH
+from src.core.singleflight import singleflight
 from src.core.state import state
-from src.schemas.agents import CulturalPersona, SafetyRule, UserHistory
+from src.schemas.agents import (
+    CulturalPersona,
+    ReliabilityJournalEntry,
+    SafetyRule,
+    UserHistory,
+)
 
 # Async Engine for PostgreSQL
 engine = create_async_engine(settings.DATABASE_URL, echo=False, future=True)
@@ -57,27 +87,572 @@ async def get_user_history(user_id: str) -> UserHistory | None:
         return results.scalar_one_or_none()
 
 
+# Per-user context: short-TTL read-through cache (rows are shared read-only, never mutated)
+user_context_cache = TTLCache(
+    max_entries=settings.USER_CONTEXT_CACHE_MAX_ENTRIES,
+    default_ttl=settings.USER_CONTEXT_CACHE_TTL_SECONDS,
+)
+_NO_USER = object()  # Negative-cache marker: unknown users are the common first-contact case
+# Bumped on every write so a load racing an update never re-caches the stale row
+_user_context_generation: dict[str, int] = {}
+
+
+def invalidate_user_context(user_id: str) -> None:
+    _user_context_generation[user_id] = _user_context_generation.get(user_id, 0) + 1
+    user_context_cache.delete(user_id)
+
+
+async def load_user_context(user_id: str) -> UserHistory | None:
+    """
+    Unified User Context Loader: one UserHistory read per evaluation, shared by the
+    worker/API (reliability) and the brain (context lock), served from cache when warm.
+    """
+    cached = user_context_cache.get(user_id)
+    if cached is not None:
+        return None if cached is _NO_USER else cached
+
+    generation = _user_context_generation.get(user_id, 0)
+    user = await _fetch_user_context(user_id)
+    if _user_context_generation.get(user_id, 0) == generation:
+        user_context_cache.set(user_id, _NO_USER if user is None else user)
+    return user
+
+
+async def load_user_contexts(user_ids: list[str]) -> dict[str, UserHistory | None]:
+    """
+    Batch variant of `load_user_context`: cache hits are served locally and every
+    miss is fetched with a single IN query.
+    """
+    contexts: dict[str, UserHistory | None] = {}
+    missing: dict[str, int] = {}
+    for user_id in dict.fromkeys(user_ids):
+        cached = user_context_cache.get(user_id)
+        if cached is None:
+            missing[user_id] = _user_context_generation.get(user_id, 0)
+        else:
+            contexts[user_id] = None if cached is _NO_USER else cached
+    if not missing:
+        return contexts
+
+    async with AsyncSessionLocal() as session:
+        statement = select(UserHistory).where(UserHistory.user_id.in_(list(missing)))
+        rows = {user.user_id: user for user in (await session.execute(statement)).scalars()}
+    for user_id, generation in missing.items():
+        user = rows.get(user_id)
+        contexts[user_id] = user
+        if _user_context_generation.get(user_id, 0) == generation:
+            user_context_cache.set(user_id, _NO_USER if user is None else user)
+    return contexts
+
+
+@singleflight(lambda user_id: f"user_context:{user_id}")
+async def _fetch_user_context(user_id: str) -> UserHistory | None:
+    return await get_user_history(user_id)
+
+
+def reliability_snapshot(user: UserHistory | None) -> tuple[float, str | None, int]:
+    """(reliability_score, slack_id, consecutive_firm_interventions) with new-user defaults."""
+    if user:
+        return (
+            user.reliability_score,
+            user.slack_id,
+            user.consecutive_firm_interventions,
+        )
+    return 100.0, None, 0
+
+
 async def get_user_reliability(user_id: str) -> tuple[float, str | None, int]:
     """
     Fetch the reliability score, slack_id, and consecutive firm interventions.
     """
-    async with AsyncSessionLocal() as session:
-        statement = select(UserHistory).where(UserHistory.user_id == user_id)
-        results = await session.execute(statement)
-        user = results.scalar_one_or_none()
+    return reliability_snapshot(await load_user_context(user_id))
+
+
+FIRM_TONES = ("firm", "confrontational")
 
-        if user:
-            return (
-                user.reliability_score,
-                user.slack_id,
-                user.consecutive_firm_interventions,
-            )
-        return 100.0, None, 0
+
+def _upsert_insert():
+    """Dialect-specific INSERT supporting ON CONFLICT DO UPDATE ... RETURNING, if any."""
+    dialect = engine.dialect.name
+    if dialect == "postgresql":
+        return pg_insert
+    # RETURNING landed in SQLite 3.35
+    if dialect == "sqlite" and sqlite3.sqlite_version_info >= (3, 35):
+        return sqlite_insert
+    return None
+
+
+class ReliabilityDelta:
+    """
+    Net effect of one or more reliability outcomes for a single user, in arrival order.
+    A single update is simply a delta of one.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.failed = 0
+        self.firm_tail = 0  # Firm tones since the last non-firm one (the streak to add)
+        self.saw_reset = False  # A non-firm tone restarted the streak somewhere in the delta
+        self.last_firm_at: datetime | None = None
+
+    def record(self, was_failure: bool, is_firm: bool, at: datetime) -> None:
+        self.total += 1
+        self.failed += 1 if was_failure else 0
+        if is_firm:
+            self.firm_tail += 1
+            self.last_firm_at = at
+        else:
+            self.firm_tail = 0
+            self.saw_reset = True
+
+    def merge(self, newer: "ReliabilityDelta") -> None:
+        """Fold a delta that happened after this one into it."""
+        self.total += newer.total
+        self.failed += newer.failed
+        if newer.saw_reset:
+            self.firm_tail = newer.firm_tail
+            self.saw_reset = True
+        else:
+            self.firm_tail += newer.firm_tail
+        self.last_firm_at = newer.last_firm_at or self.last_firm_at
+
+    def params(self, user_id: str) -> dict:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        return {
+            "uid": user_id,
+            "total_inc": self.total,
+            "failed_inc": self.failed,
+            "new_user_score": (self.total - self.failed) * 100.0 / self.total,
+            "firm_tail": self.firm_tail,
+            "saw_reset": self.saw_reset,
+            "last_firm_at": self.last_firm_at,
+            "cutoff": now - timedelta(hours=settings.COOLING_OFF_PERIOD_HOURS),
+        }
+
+
+def _reliability_upsert_statement(insert):
+    """
+    The whole reliability update as one parameterized statement: counters, cooling-off
+    reset, firm streak and score are computed in SQL from the row's current values.
+    Executed with one delta (RETURNING) or a batch of deltas (executemany).
+    """
+    table = UserHistory.__table__
+    total = table.c.total_commitments + bindparam("total_inc", type_=Integer)
+    failed = table.c.failed_commitments + bindparam("failed_inc", type_=Integer)
+    firm_tail = bindparam("firm_tail", type_=Integer)
+    last_firm_at = bindparam("last_firm_at", type_=DateTime)
+
+    # Cooling-off: a streak older than the window restarts instead of extending
+    cooled_off = and_(
+        table.c.last_intervention_at.is_not(None),
+        table.c.last_intervention_at < bindparam("cutoff", type_=DateTime),
+    )
+    statement = insert(table).values(
+        user_id=bindparam("uid", type_=String),
+        total_commitments=bindparam("total_inc", type_=Integer),
+        failed_commitments=bindparam("failed_inc", type_=Integer),
+        reliability_score=bindparam("new_user_score", type_=Float),
+        consecutive_firm_interventions=firm_tail,
+        last_intervention_at=last_firm_at,
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.user_id],
+        set_={
+            "total_commitments": total,
+            "failed_commitments": failed,
+            "reliability_score": cast(total - failed, Float) * 100.0 / total,
+            "consecutive_firm_interventions": case(
+                (bindparam("saw_reset", type_=Boolean), firm_tail),
+                (cooled_off, firm_tail),
+                else_=table.c.consecutive_firm_interventions + firm_tail,
+            ),
+            "last_intervention_at": func.coalesce(last_firm_at, table.c.last_intervention_at),
+        },
+    )
 
 
 async def update_user_reliability(user_id: str, was_failure: bool, tone_used: str = "supportive"):
     """
     Update historical stats and track ethical Tone-Damping status.
+    One atomic INSERT ... ON CONFLICT DO UPDATE ... RETURNING round trip: concurrent
+    jobs for the same user never hold a row lock across Python work.
+    Inside workers running the write-behind buffer, the update is batched instead.
+    """
+    if reliability_buffer.running:
+        await reliability_buffer.add(user_id, was_failure, tone_used)
+        return
+
+    insert = _upsert_insert()
+    if insert is None:
+        await _update_user_reliability_locked(user_id, was_failure, tone_used)
+        return
+
+    delta = ReliabilityDelta()
+    delta.record(was_failure, tone_used in FIRM_TONES, datetime.now(UTC).replace(tzinfo=None))
+    table = UserHistory.__table__
+    statement = _reliability_upsert_statement(insert).returning(
+        table.c.reliability_score, table.c.consecutive_firm_interventions
+    )
+    async with AsyncSessionLocal() as session:
+        results = await session.execute(statement, delta.params(user_id))
+        new_score, consecutive_strict = results.one()
+        await session.commit()
+
+    invalidate_user_context(user_id)
+    logger.info(
+        "reliability_updated",
+        user_id=user_id,
+        new_score=new_score,
+        consecutive_strict=consecutive_strict,
+    )
+
+
+async def update_user_reliability_many(outcomes: list[tuple[str, bool, str]]) -> int:
+    """
+    Bulk variant of `update_user_reliability` for (user_id, was_failure, tone_used)
+    outcomes: folded into one delta per user and written in a single executemany.
+    Returns the number of users written.
+    """
+    if not outcomes:
+        return 0
+    if reliability_buffer.running:
+        for user_id, was_failure, tone_used in outcomes:
+            await reliability_buffer.add(user_id, was_failure, tone_used)
+        return len({user_id for user_id, _, _ in outcomes})
+
+    if _upsert_insert() is None:
+        for user_id, was_failure, tone_used in outcomes:
+            await _update_user_reliability_locked(user_id, was_failure, tone_used)
+        return len({user_id for user_id, _, _ in outcomes})
+
+    at = datetime.now(UTC).replace(tzinfo=None)
+    deltas: dict[str, ReliabilityDelta] = {}
+    for user_id, was_failure, tone_used in outcomes:
+        deltas.setdefault(user_id, ReliabilityDelta()).record(
+            was_failure, tone_used in FIRM_TONES, at
+        )
+    await _write_reliability_deltas(deltas)
+    for user_id in deltas:
+        invalidate_user_context(user_id)
+    logger.info("reliability_bulk_updated", users=len(deltas), outcomes=len(outcomes))
+    return len(deltas)
+
+
+async def _write_reliability_deltas(deltas: dict[str, ReliabilityDelta]) -> None:
+    async with AsyncSessionLocal() as session:
+        await _upsert_reliability_deltas(session, deltas)
+        await session.commit()
+
+
+async def _upsert_reliability_deltas(
+    session: AsyncSession, deltas: dict[str, ReliabilityDelta]
+) -> None:
+    if not deltas:
+        return
+    # Stable row order so concurrent batches from other workers cannot deadlock
+    batch = [deltas[user_id].params(user_id) for user_id in sorted(deltas)]
+    await session.execute(_reliability_upsert_statement(_upsert_insert()), batch)
+
+
+async def _apply_reliability_journal(
+    entries: list[tuple[str, dict[str, str]]], local: dict[str, ReliabilityDelta]
+) -> set[str]:
+    """
+    Writes journaled outcomes (plus `local` deltas that never reached the journal) in
+    one transaction, recording each entry id in the ledger alongside. An entry that is
+    delivered again (crash before acknowledging, or claimed from a slow worker) is
+    skipped by the ledger, so it is only ever counted once. Returns the users written.
+    """
+    deltas: dict[str, ReliabilityDelta] = {}
+    for user_id, delta in local.items():
+        deltas.setdefault(user_id, ReliabilityDelta()).merge(delta)
+
+    ledger = ReliabilityJournalEntry.__table__
+    async with AsyncSessionLocal() as session:
+        fresh: set[str] = set()
+        if entries:
+            applied_at = datetime.now(UTC).replace(tzinfo=None)
+            statement = (
+                _upsert_insert()(ledger)
+                .values(
+                    [{"entry_id": entry_id, "applied_at": applied_at} for entry_id, _ in entries]
+                )
+                .on_conflict_do_nothing(index_elements=[ledger.c.entry_id])
+                .returning(ledger.c.entry_id)
+            )
+            fresh = set((await session.execute(statement)).scalars())
+        for entry_id, data in entries:
+            if entry_id in fresh:
+                deltas.setdefault(data["user_id"], ReliabilityDelta()).record(
+                    data["failed"] == "1", data["firm"] == "1", datetime.fromisoformat(data["at"])
+                )
+        await _upsert_reliability_deltas(session, deltas)
+        await session.commit()
+
+    if len(fresh) < len(entries):
+        logger.info("reliability_journal_duplicates_skipped", entries=len(entries) - len(fresh))
+    return set(deltas)
+
+
+async def _prune_reliability_ledger() -> None:
+    cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(
+        hours=settings.RELIABILITY_JOURNAL_LEDGER_RETENTION_HOURS
+    )
+    ledger = ReliabilityJournalEntry.__table__
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(ledger).where(ledger.c.applied_at < cutoff))
+        await session.commit()
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+class ReliabilityWriteBuffer:
+    """
+    Write-Behind Layer: reliability outcomes are journaled to a Redis stream and workers
+    consume it as one consumer group, flushing what they read as one batched upsert
+    every N ms or N updates. Entries are acknowledged only after the write commits;
+    entries a consumer holds unacknowledged past the recovery age (crashed or failing
+    worker) are claimed by another worker, and a ledger table makes every replay
+    idempotent. Without Redis, outcomes are aggregated in memory instead.
+    Reads may lag the database by up to one flush interval.
+    """
+
+    STREAM_KEY = "reliability:journal"
+    GROUP = "reliability-writers"
+
+    def __init__(self, flush_interval_ms: int | None = None, max_pending: int | None = None):
+        self.flush_interval_ms = flush_interval_ms or settings.RELIABILITY_FLUSH_INTERVAL_MS
+        self.max_pending = max_pending or settings.RELIABILITY_FLUSH_MAX_PENDING
+        self.consumer = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._pending: dict[str, ReliabilityDelta] = {}
+        self._journaled = False
+        self._updates = 0
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._flush_lock: asyncio.Lock | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending_users(self) -> int:
+        return len(self._pending)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        if _upsert_insert() is None:
+            logger.warning("reliability_write_behind_unsupported", dialect=engine.dialect.name)
+            return
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._journaled = await self._join_group()
+        await self.recover()
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            "reliability_write_behind_started",
+            interval_ms=self.flush_interval_ms,
+            journaled=self._journaled,
+        )
+
+    async def stop(self) -> None:
+        """Stops the flush loop and writes out everything still buffered."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.flush()
+        await self._leave_group()
+        logger.info("reliability_write_behind_stopped", unflushed_users=len(self._pending))
+
+    async def _join_group(self) -> bool:
+        redis = state.get("redis")
+        if not redis:
+            return False
+        try:
+            await redis.xgroup_create(self.STREAM_KEY, self.GROUP, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):  # Another worker created it first
+                logger.warning("reliability_journal_unavailable", error=str(e))
+                return False
+        return True
+
+    async def _leave_group(self) -> None:
+        """Drops this consumer once nothing is pending for it (deleting it discards its PEL)."""
+        redis = state.get("redis")
+        if not (redis and self._journaled):
+            return
+        try:
+            if not await redis.xpending_range(
+                self.STREAM_KEY, self.GROUP, "-", "+", 1, consumername=self.consumer
+            ):
+                await redis.xgroup_delconsumer(self.STREAM_KEY, self.GROUP, self.consumer)
+        except Exception as e:
+            logger.warning("reliability_journal_leave_failed", error=str(e))
+
+    async def add(self, user_id: str, was_failure: bool, tone_used: str = "supportive") -> None:
+        at = datetime.now(UTC).replace(tzinfo=None)
+        is_firm = tone_used in FIRM_TONES
+        redis = state.get("redis")
+        journaled = False
+        if redis and self._journaled:
+            try:
+                await redis.xadd(
+                    self.STREAM_KEY,
+                    {
+                        "user_id": user_id,
+                        "failed": int(was_failure),
+                        "firm": int(is_firm),
+                        "at": at.isoformat(),
+                    },
+                )
+                journaled = True
+            except Exception as e:
+                logger.warning("reliability_journal_append_failed", error=str(e))
+
+        if not journaled:
+            self._pending.setdefault(user_id, ReliabilityDelta()).record(was_failure, is_firm, at)
+        self._updates += 1
+        if self._updates >= self.max_pending and self._wake:
+            self._wake.set()
+
+    async def flush(self) -> int:
+        """Writes buffered and journaled deltas in one batched upsert. Returns the users written."""
+        lock = self._flush_lock or asyncio.Lock()
+        async with lock:
+            entries, stale_ids = await self._read_journal()
+            await self._acknowledge(stale_ids)
+            if not (self._pending or entries):
+                return 0
+            local, self._pending = self._pending, {}
+            self._updates = 0
+
+            try:
+                written = await _apply_reliability_journal(entries, local)
+            except Exception as e:
+                # Journaled entries stay pending for this consumer and are read again
+                self._requeue(local)
+                logger.error("reliability_flush_failed", users=len(local), error=str(e))
+                return 0
+
+        for user_id in written:
+            invalidate_user_context(user_id)
+        RELIABILITY_FLUSH_BATCH.observe(len(written))
+        await self._acknowledge([entry_id for entry_id, _ in entries])
+        logger.info("reliability_flushed", users=len(written))
+        return len(written)
+
+    def _requeue(self, pending: dict[str, ReliabilityDelta]) -> None:
+        """Puts a failed batch back ahead of anything buffered while it was in flight."""
+        for user_id, newer in self._pending.items():
+            if user_id in pending:
+                pending[user_id].merge(newer)
+            else:
+                pending[user_id] = newer
+        self._pending = pending
+
+    async def _read_journal(self) -> tuple[list[tuple[str, dict[str, str]]], list[str]]:
+        """
+        This consumer's unacknowledged backlog (failed flushes, claimed entries) followed
+        by new entries. Also returns ids whose entries were already deleted from the stream.
+        """
+        redis = state.get("redis")
+        if not (redis and self._journaled):
+            return [], []
+        entries, stale_ids = [], []
+        try:
+            for start in ("0", ">"):
+                response = await redis.xreadgroup(
+                    self.GROUP, self.consumer, {self.STREAM_KEY: start}, count=self.max_pending
+                )
+                for _stream, messages in response or []:
+                    for entry_id, fields in messages:
+                        if not fields:
+                            stale_ids.append(_decode(entry_id))
+                            continue
+                        data = {_decode(k): _decode(v) for k, v in fields.items()}
+                        entries.append((_decode(entry_id), data))
+        except Exception as e:
+            logger.warning("reliability_journal_read_failed", error=str(e))
+        return entries, stale_ids
+
+    async def _acknowledge(self, entry_ids: list[str]) -> None:
+        redis = state.get("redis")
+        if not (redis and entry_ids):
+            return
+        try:
+            await redis.xack(self.STREAM_KEY, self.GROUP, *entry_ids)
+            await redis.xdel(self.STREAM_KEY, *entry_ids)
+        except Exception as e:
+            # Left pending: redelivered later and skipped by the ledger
+            logger.warning("reliability_journal_ack_failed", error=str(e))
+
+    async def recover(self) -> int:
+        """
+        Claims journal entries another consumer has held unacknowledged for longer than
+        the recovery age (its worker crashed, or keeps failing to flush) and flushes
+        them. Runs at startup and periodically, so orphans never wait for a restart.
+        """
+        redis = state.get("redis")
+        if not (redis and self._journaled):
+            return 0
+        claimed = 0
+        cursor = "0-0"
+        try:
+            while True:
+                response = await redis.xautoclaim(
+                    self.STREAM_KEY,
+                    self.GROUP,
+                    self.consumer,
+                    min_idle_time=settings.RELIABILITY_JOURNAL_RECOVERY_AGE_SECONDS * 1000,
+                    start_id=cursor,
+                    count=self.max_pending,
+                )
+                cursor, messages = _decode(response[0]), response[1]
+                claimed += len(messages)
+                if cursor == "0-0":
+                    break
+            await _prune_reliability_ledger()
+        except Exception as e:
+            logger.warning("reliability_journal_recovery_failed", error=str(e))
+
+        if claimed:
+            logger.info("reliability_journal_replayed", entries=claimed)
+            await self.flush()
+        return claimed
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        recovery_interval = max(settings.RELIABILITY_JOURNAL_RECOVERY_AGE_SECONDS / 2, 1)
+        next_recovery = loop.time() + recovery_interval
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval_ms / 1000)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+            if loop.time() >= next_recovery:
+                next_recovery = loop.time() + recovery_interval
+                await self.recover()
+
+
+# Process-wide buffer; only started inside workers with RELIABILITY_WRITE_BEHIND_ENABLED
+reliability_buffer = ReliabilityWriteBuffer()
+
+
+async def _update_user_reliability_locked(
+    user_id: str, was_failure: bool, tone_used: str = "supportive"
+):
+    """
+    Legacy read-modify-write path for dialects without INSERT ... ON CONFLICT ... RETURNING.
     Uses 'with_for_update' to ensure atomicity during multi-read-write operations.
     """
     async with AsyncSessionLocal() as session:
@@ -111,7 +686,7 @@ async def update_user_reliability(user_id: str, was_failure: bool, tone_used: st
                 logger.info("cooling_off_reset", user_id=user_id, reason="time_elapsed")
 
         # 2. Ethical Counter Management
-        if tone_used in ["firm", "confrontational"]:
+        if tone_used in FIRM_TONES:
             user.consecutive_firm_interventions += 1
             user.last_intervention_at = datetime.now(UTC).replace(tzinfo=None)
         else:
@@ -128,6 +703,7 @@ async def update_user_reliability(user_id: str, was_failure: bool, tone_used: st
             user.reliability_score = 100.0
 
         await session.commit()
+    invalidate_user_context(user_id)
     logger.info(
         "reliability_updated",
         user_id=user_id,
@@ -152,6 +728,7 @@ async def set_slack_id(user_id: str, slack_id: str):
             user.slack_id = slack_id
 
         await session.commit()
+    invalidate_user_context(user_id)
     logger.info("slack_id_mapped", user_id=user_id, slack_id=slack_id)
 
 
@@ -171,6 +748,7 @@ async def set_git_email(user_id: str, git_email: str):
             user.git_email = git_email
 
         await session.commit()
+    invalidate_user_context(user_id)
     logger.info("git_email_mapped", user_id=user_id, git_email=git_email)
 
 
@@ -184,6 +762,46 @@ async def get_user_by_git_email(git_email: str) -> UserHistory | None:
         return results.scalar_one_or_none()
 
 
+# Specificity of the rule a (industry, department) lookup resolved to
+RULE_SPECIFICITY_GENERIC = 0
+RULE_SPECIFICITY_INDUSTRY = 1
+RULE_SPECIFICITY_EXACT = 2
+SAFETY_RULES_CACHE_TTL_SECONDS = 3600
+# "Nothing configured" results are cached too, but briefly: onboarding usually follows
+SAFETY_RULES_NEGATIVE_TTL_SECONDS = 300
+
+# Reference data L1: safety rules & personas change a few times a month, so every process
+# keeps shared read-only snapshots in memory, dropped on writes via Redis pub/sub
+reference_cache = TTLCache(
+    max_entries=settings.REFERENCE_CACHE_MAX_ENTRIES,
+    default_ttl=settings.REFERENCE_CACHE_TTL_SECONDS,
+)
+reference_invalidation = CacheInvalidationBus(
+    reference_cache, channel="commitvigil:reference_invalidation"
+)
+_NO_PERSONA = object()  # L1 negative marker
+
+
+def _rule_specificity(rule: SafetyRule, industry: str, department: str) -> int:
+    if rule.industry == industry and rule.department == department:
+        return RULE_SPECIFICITY_EXACT
+    if rule.industry == industry:
+        return RULE_SPECIFICITY_INDUSTRY
+    return RULE_SPECIFICITY_GENERIC
+
+
+def _decode_cached_rules(
+    cached: str | bytes, industry: str, department: str
+) -> tuple[SafetyRule | None, int | None]:
+    data = json.loads(cached)
+    if "specificity" not in data:
+        # Legacy payload: a bare rule cached before specificity was stored alongside it
+        rule = SafetyRule.model_validate(data)
+        return rule, _rule_specificity(rule, industry, department)
+    rule = SafetyRule.model_validate(data["rule"]) if data["rule"] else None
+    return rule, data["specificity"]
+
+
 async def get_safety_rules(industry: str = "generic", department: str = "*") -> SafetyRule | None:
     """
     Fetch the safety rules for a specific industry and department with Redis caching.
@@ -192,59 +810,119 @@ async def get_safety_rules(industry: str = "generic", department: str = "*") ->
     2. Specific Industry + Wildcard Department (*)
     3. Generic Industry + Wildcard Department (*)
     """
+    rule, _specificity = await resolve_safety_rules(industry, department)
+    return rule
+
+
+async def resolve_safety_rules(
+    industry: str = "generic", department: str = "*"
+) -> tuple[SafetyRule | None, int | None]:
+    """
+    Resolves the rule hierarchy in one query and reports which level matched
+    (RULE_SPECIFICITY_*, None when nothing is configured). Fallback and empty
+    resolutions are cached under the requested key like exact matches.
+    """
     # Normalize inputs
     industry = industry.lower()
     department = department.lower()
 
+    cache_key = f"safety_rules:{industry}:{department}"
+    snapshot = reference_cache.get(cache_key)
+    if snapshot is not None:
+        return snapshot
+
+    generation = reference_invalidation.generation
+    resolved = await _load_safety_rules(industry, department)
+    reference_invalidation.fill(cache_key, resolved, generation)
+    return resolved
+
+
+@singleflight(lambda industry, department: f"safety_rules:{industry}:{department}")
+async def _load_safety_rules(
+    industry: str, department: str
+) -> tuple[SafetyRule | None, int | None]:
     cache_key = f"safety_rules:{industry}:{department}"
     redis = state.get("redis")
 
-    # 1. Check Cache
+    # 1. Check Cache (shared Redis tier)
     if redis:
         try:
             cached = await redis.get(cache_key)
             if cached:
-                data = json.loads(cached)
-                return SafetyRule(**data)
+                return _decode_cached_rules(cached, industry, department)
         except Exception as e:
             logger.warning("cache_lookup_failed", error=str(e))
 
-    # 2. Check Database (Hierarchical)
-    async with AsyncSessionLocal() as session:
-        # Try specific industry + specific department
-        statement = select(SafetyRule).where(
-            SafetyRule.industry == industry,
-            SafetyRule.department == department,
+    # 2. Check Database: all three candidate keys at once, most specific first
+    specificity = case(
+        (
+            and_(SafetyRule.industry == industry, SafetyRule.department == department),
+            RULE_SPECIFICITY_EXACT,
+        ),
+        (SafetyRule.industry == industry, RULE_SPECIFICITY_INDUSTRY),
+        else_=RULE_SPECIFICITY_GENERIC,
+    )
+    statement = (
+        select(SafetyRule, specificity)
+        .where(
             SafetyRule.is_active,
+            or_(
+                and_(SafetyRule.industry == industry, SafetyRule.department == department),
+                and_(SafetyRule.industry == industry, SafetyRule.department == "*"),
+                and_(SafetyRule.industry == "generic", SafetyRule.department == "*"),
+            ),
         )
+        .order_by(specificity.desc())
+        .limit(1)
+    )
+    async with AsyncSessionLocal() as session:
         results = await session.execute(statement)
-        rule = results.scalar_one_or_none()
+        row = results.first()
+    rule, resolved = (row[0], row[1]) if row else (None, None)
 
-        # Fallback to industry-wide rule
-        if not rule and department != "*":
-            statement = select(SafetyRule).where(
-                SafetyRule.industry == industry, SafetyRule.department == "*", SafetyRule.is_active
+    # 3. Populate Cache (negative results included)
+    if redis:
+        try:
+            payload = json.dumps(
+                {
+                    "rule": rule.model_dump(mode="json") if rule else None,
+                    "specificity": resolved,
+                }
             )
-            results = await session.execute(statement)
-            rule = results.scalar_one_or_none()
+            ttl = SAFETY_RULES_CACHE_TTL_SECONDS if rule else SAFETY_RULES_NEGATIVE_TTL_SECONDS
+            await redis.setex(cache_key, ttl, payload)
+        except Exception as e:
+            logger.warning("cache_population_failed", error=str(e))
 
-        # Fallback to generic rule
-        if not rule and industry != "generic":
-            statement = select(SafetyRule).where(
-                SafetyRule.industry == "generic", SafetyRule.department == "*", SafetyRule.is_active
-            )
-            results = await session.execute(statement)
-            rule = results.scalar_one_or_none()
+    return rule, resolved
 
-    # 3. Populate Cache
-    if rule and redis:
+
+async def _invalidate_safety_rules_cache(industry: str, department: str) -> None:
+    """
+    Drops every cached lookup that could have resolved to this rule: a wildcard rule
+    also backs the fallback entries of its industry (or, for generic, of all industries).
+    Redis goes first so no process can refill its L1 from the stale shared copy.
+    """
+    if department != "*":
+        keys, prefixes = [f"safety_rules:{industry}:{department}"], []
+    elif industry == "generic":
+        keys, prefixes = [], ["safety_rules:"]
+    else:
+        keys, prefixes = [], [f"safety_rules:{industry}:"]
+
+    redis = state.get("redis")
+    if redis:
         try:
-            # Cache for 1 hour
-            await redis.setex(cache_key, 3600, rule.model_dump_json())
+            stale = list(keys)
+            for prefix in prefixes:
+                stale += [key async for key in redis.scan_iter(match=f"{prefix}*")]
+            if stale:
+                await redis.delete(*stale)
+            logger.info("safety_rule_cache_invalidated", industry=industry, department=department)
         except Exception as e:
-            logger.warning("cache_population_failed", error=str(e))
+            logger.warning("cache_invalidation_failed", error=str(e))
 
-    return rule
+    await reference_invalidation.invalidate(keys=keys, prefixes=prefixes)
 
 
 async def seed_safety_rules():
@@ -332,15 +1010,8 @@ async def set_safety_rule(
         await session.commit()
         await session.refresh(rule)
 
-    # Cache Invalidation
-    redis = state.get("redis")
-    if redis:
-        try:
-            cache_key = f"safety_rules:{industry}:{department}"
-            await redis.delete(cache_key)
-            logger.info("safety_rule_cache_invalidated", industry=industry, department=department)
-        except Exception as e:
-            logger.warning("cache_invalidation_failed", error=str(e))
+    # Cache Invalidation (Redis tier, then every process's L1)
+    await _invalidate_safety_rules_cache(industry, department)
 
     logger.info("safety_rule_updated", industry=industry, department=department)
     return rule
@@ -348,9 +1019,22 @@ async def set_safety_rule(
 
 async def get_cultural_persona(code: str) -> CulturalPersona | None:
     """
-    Fetch a cultural persona by code with Redis caching.
+    Fetch a cultural persona by code: in-process L1, then Redis, then the database.
     """
     code = code.lower()
+    cache_key = f"persona:{code}"
+    snapshot = reference_cache.get(cache_key)
+    if snapshot is not None:
+        return None if snapshot is _NO_PERSONA else snapshot
+
+    generation = reference_invalidation.generation
+    persona = await _load_cultural_persona(code)
+    reference_invalidation.fill(cache_key, _NO_PERSONA if persona is None else persona, generation)
+    return persona
+
+
+@singleflight(lambda code: f"persona:{code}")
+async def _load_cultural_persona(code: str) -> CulturalPersona | None:
     cache_key = f"persona:{code}"
     redis = state.get("redis")
 
@@ -390,14 +1074,15 @@ async def create_cultural_persona(persona: CulturalPersona) -> CulturalPersona:
         await session.commit()
         await session.refresh(persona)
 
-    # Invalidate Cache
+    # Invalidate Cache (Redis tier, then every process's L1)
+    cache_key = f"persona:{persona.code}"
     redis = state.get("redis")
     if redis:
         try:
-            cache_key = f"persona:{persona.code}"
             await redis.delete(cache_key)
         except Exception as e:
             logger.warning("cache_invalidation_failed", error=str(e))
+    await reference_invalidation.invalidate(keys=[cache_key])
 
     logger.info("cultural_persona_created", code=persona.code, source=persona.source)
     return persona
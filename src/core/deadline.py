@@ -0,0 +1,94 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+"""
+Deadline Propagation: one end-to-end budget per evaluation, visible to every stage.
+The active deadline lives in a ContextVar, so it flows into gathered tasks and down to
+the LLM providers without threading an argument through every signature.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+from tenacity import RetryCallState
+from tenacity.stop import stop_base
+
+R = TypeVar("R")
+
+
+class Deadline:
+    """An absolute point on the monotonic clock by which the whole pipeline must finish."""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def budget(self, cap: float) -> float:
+        """Per-stage timeout: the stage's own cap, never beyond what is left overall."""
+        return min(cap, self.remaining())
+
+
+_current: ContextVar[Deadline | None] = ContextVar("commitvigil_deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    return _current.get()
+
+
+def stage_budget(cap: float) -> float:
+    """Timeout for a stage capped at `cap` seconds, shortened by the active deadline."""
+    deadline = _current.get()
+    return deadline.budget(cap) if deadline else cap
+
+
+@contextmanager
+def deadline_scope(
+    seconds: float | None = None, deadline: Deadline | None = None
+) -> Iterator[Deadline]:
+    """
+    Activates a deadline for the enclosed block. Nested scopes can only tighten the
+    budget: an inner scope never outlives the deadline it was started under.
+    """
+    candidate = deadline or Deadline(seconds if seconds is not None else 0.0)
+    parent = _current.get()
+    if parent and parent.expires_at < candidate.expires_at:
+        candidate = parent
+    token = _current.set(candidate)
+    try:
+        yield candidate
+    finally:
+        _current.reset(token)
+
+
+async def run_with_budget(awaitable: Awaitable[R], cap: float) -> R:  # noqa: UP047
+    """
+    asyncio.wait_for with the stage budget; raises TimeoutError like the existing stages.
+    The stage runs under its own (tighter) deadline so nested stages see what is left of it.
+    """
+    budget = stage_budget(cap)
+    with deadline_scope(budget):
+        return await asyncio.wait_for(awaitable, timeout=budget)
+
+
+class stop_on_deadline(stop_base):  # noqa: N801 (tenacity naming convention)
+    """
+    Tenacity stop condition: skip a retry when the backoff plus a typical attempt
+    (the mean so far) would overrun the active deadline.
+    """
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        deadline = _current.get()
+        if deadline is None:
+            return False
+        elapsed = (retry_state.seconds_since_start or 0.0) - retry_state.idle_for
+        mean_attempt = elapsed / max(1, retry_state.attempt_number)
+        upcoming_sleep = retry_state.upcoming_sleep or 0.0
+        return upcoming_sleep + mean_attempt > deadline.remaining()
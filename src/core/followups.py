@@ -0,0 +1,193 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+"""
+Follow-up Scheduling Layer: accountability follow-ups are deferred ARQ jobs, so
+scheduling one is a single async Redis write and every worker's regular queue poll
+dispatches them; no sync job store sits inside the event loop.
+With coalescing on, each user has at most one pending follow-up job, fed by a
+per-user index of the commitments it should check in on.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from src.core.config import settings
+from src.core.logging import logger
+from src.core.monitoring import FOLLOW_UPS_COALESCED
+from src.core.state import state
+
+FOLLOW_UP_JOB = "send_follow_up"
+COALESCED_FOLLOW_UP_JOB = "send_coalesced_follow_up"
+LEGACY_MIGRATION_LOCK_KEY = "follow_ups:legacy_migration"
+# Per-user follow-up index: pending commitments, the one queued job, the send cooldown
+PENDING_KEY = "follow_ups:pending:{user_id}"
+JOB_KEY = "follow_ups:job:{user_id}"
+LAST_SENT_KEY = "follow_ups:last_sent:{user_id}"
+
+
+def follow_up_message(commitment: str) -> str:
+    return f"🔔 *CommitVigil Alert:* Checking in on commitment: {commitment}"
+
+
+def digest_message(commitments: list[str]) -> str:
+    lines = "\n".join(f"• {commitment}" for commitment in commitments)
+    return f"🔔 *CommitVigil Alert:* Checking in on {len(commitments)} commitments:\n{lines}"
+
+
+async def request_follow_up(
+    user_id: str, commitment: str, slack_id: str | None = None
+) -> str | None:
+    """
+    Entry point for high-risk evaluations. Without coalescing every request is its
+    own deferred job; with it, the request joins the user's pending follow-up.
+    """
+    if not settings.FOLLOW_UP_COALESCING_ENABLED:
+        return await schedule_follow_up(user_id, follow_up_message(commitment), slack_id)
+
+    redis = state.get("redis")
+    if not redis:
+        logger.warning("follow_up_not_scheduled", user_id=user_id, reason="redis_unavailable")
+        return None
+
+    # Same commitment again replaces its entry; different commitments merge
+    field = hashlib.sha256(commitment.encode()).hexdigest()[:16]
+    entry = json.dumps({"commitment": commitment, "slack_id": slack_id, "at": time.time()})
+    job_key = JOB_KEY.format(user_id=user_id)
+    job_id = f"follow-up:{user_id}:{uuid.uuid4().hex}"
+    # Bounds index lifetime even if a job is lost
+    ttl = settings.FOLLOW_UP_DELAY_SECONDS + settings.FOLLOW_UP_MIN_INTERVAL_SECONDS + 3600
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hset(PENDING_KEY.format(user_id=user_id), field, entry)
+        pipe.expire(PENDING_KEY.format(user_id=user_id), ttl)
+        pipe.set(job_key, job_id, nx=True, ex=ttl)
+        pipe.pttl(LAST_SENT_KEY.format(user_id=user_id))
+        _, _, created, cooldown_ms = await pipe.execute()
+
+    if not created:
+        FOLLOW_UPS_COALESCED.inc()
+        logger.info("follow_up_coalesced", user_id=user_id)
+        return None
+
+    # Per-user minimum interval: wait out the cooldown left by the previous send
+    delay = max(settings.FOLLOW_UP_DELAY_SECONDS, max(cooldown_ms, 0) / 1000)
+    try:
+        await redis.enqueue_job(
+            COALESCED_FOLLOW_UP_JOB, user_id, _job_id=job_id, _defer_by=timedelta(seconds=delay)
+        )
+    except Exception:
+        await redis.delete(job_key)  # Let the next request schedule instead
+        raise
+    logger.info("follow_up_scheduled", user_id=user_id, delay_seconds=delay)
+    return job_id
+
+
+async def drain_follow_ups(user_id: str) -> list[tuple[str, str | None]]:
+    """
+    Claims a user's pending follow-ups as (message, slack_id) pairs: one digest in
+    digest mode, otherwise one message per distinct commitment.
+    """
+    redis = state.get("redis")
+    if not redis:
+        return []
+
+    # Release the job slot first: anything requested from now on schedules a new job
+    await redis.delete(JOB_KEY.format(user_id=user_id))
+    pending_key = PENDING_KEY.format(user_id=user_id)
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hgetall(pending_key)
+        pipe.delete(pending_key)
+        entries, _ = await pipe.execute()
+    if not entries:
+        return []
+
+    items = sorted((json.loads(value) for value in entries.values()), key=lambda i: i["at"])
+    if settings.FOLLOW_UP_MIN_INTERVAL_SECONDS > 0:
+        await redis.set(
+            LAST_SENT_KEY.format(user_id=user_id), "1", ex=settings.FOLLOW_UP_MIN_INTERVAL_SECONDS
+        )
+    if settings.FOLLOW_UP_DIGEST_ENABLED and len(items) > 1:
+        slack_id = next((item["slack_id"] for item in reversed(items) if item["slack_id"]), None)
+        return [(digest_message([item["commitment"] for item in items]), slack_id)]
+    return [(follow_up_message(item["commitment"]), item["slack_id"]) for item in items]
+
+
+async def schedule_follow_up(
+    user_id: str,
+    message: str,
+    slack_id: str | None = None,
+    run_at: datetime | None = None,
+    job_id: str | None = None,
+) -> str | None:
+    """Defers a `send_follow_up` job until `run_at` (default: FOLLOW_UP_DELAY_SECONDS)."""
+    redis = state.get("redis")
+    if not redis:
+        logger.warning("follow_up_not_scheduled", user_id=user_id, reason="redis_unavailable")
+        return None
+
+    run_at = run_at or datetime.now(UTC) + timedelta(seconds=settings.FOLLOW_UP_DELAY_SECONDS)
+    job = await redis.enqueue_job(
+        FOLLOW_UP_JOB, user_id, message, slack_id, _job_id=job_id, _defer_until=run_at
+    )
+    if job is None:  # Same job id already queued (e.g. a repeated migration)
+        return job_id
+    logger.info("follow_up_scheduled", user_id=user_id, time=run_at.isoformat())
+    return job.job_id
+
+
+async def migrate_legacy_follow_ups() -> int:
+    """
+    Migration path from the APScheduler SQLAlchemyJobStore: every pending legacy row
+    becomes a deferred ARQ job (same run time and arguments), then the row is removed.
+    One worker migrates at a time; the sync job-store I/O runs off the event loop.
+    """
+    redis = state.get("redis")
+    if not redis:
+        return 0
+    try:
+        if not await redis.set(LEGACY_MIGRATION_LOCK_KEY, "1", nx=True, ex=300):
+            return 0
+        legacy_jobs = await asyncio.to_thread(_load_legacy_jobs)
+    except Exception as e:
+        logger.warning("legacy_follow_up_migration_failed", error=str(e))
+        return 0
+
+    migrated = []
+    for legacy_id, run_at, args in legacy_jobs:
+        try:
+            # Deterministic id: a migration interrupted before cleanup never double-sends
+            await schedule_follow_up(*args, run_at=run_at, job_id=f"legacy-follow-up:{legacy_id}")
+            migrated.append(legacy_id)
+        except Exception as e:
+            logger.warning("legacy_follow_up_skipped", job_id=legacy_id, error=str(e))
+
+    if migrated:
+        await asyncio.to_thread(_remove_legacy_jobs, migrated)
+    logger.info("legacy_follow_ups_migrated", migrated=len(migrated), found=len(legacy_jobs))
+    return len(migrated)
+
+
+def _legacy_job_store():
+    # Imported lazily: APScheduler is only needed to read rows left by older releases
+    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+
+    return SQLAlchemyJobStore(url=settings.SYNC_DATABASE_URL)
+
+
+def _load_legacy_jobs() -> list[tuple[str, datetime | None, list]]:
+    store = _legacy_job_store()
+    try:
+        return [(job.id, job.next_run_time, list(job.args)) for job in store.get_all_jobs()]
+    finally:
+        store.shutdown()
+
+
+def _remove_legacy_jobs(job_ids: list[str]) -> None:
+    store = _legacy_job_store()
+    try:
+        for job_id in job_ids:
+            store.remove_job(job_id)
+    finally:
+        store.shutdown()
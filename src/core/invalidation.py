@@ -0,0 +1,106 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+"""
+Cross-process cache invalidation: writers publish the keys they changed on a Redis
+pub/sub channel and every API/worker process drops them from its in-process L1.
+"""
+
+import asyncio
+import json
+from typing import Any
+
+from src.core.cache import TTLCache
+from src.core.logging import logger
+from src.core.state import state
+
+
+class CacheInvalidationBus:
+    """
+    Keeps one process-local TTLCache coherent with writes made by any process.
+    Pub/sub is fire-and-forget, so the L1 TTL stays the upper bound on staleness
+    whenever the listener is disconnected.
+    """
+
+    MAX_BACKOFF_SECONDS = 30.0
+
+    def __init__(self, cache: TTLCache, channel: str):
+        self.cache = cache
+        self.channel = channel
+        # Bumped on every invalidation so loads racing a write never re-cache stale data
+        self.generation = 0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def fill(self, key: str, value: Any, generation: int) -> None:
+        """Caches a loaded value unless an invalidation arrived while it was loading."""
+        if generation == self.generation:
+            self.cache.set(key, value)
+
+    def apply(self, keys: list[str] | tuple = (), prefixes: list[str] | tuple = ()) -> None:
+        self.generation += 1
+        for key in keys:
+            self.cache.delete(key)
+        for prefix in prefixes:
+            self.cache.delete_prefix(prefix)
+
+    async def invalidate(self, keys: list[str] | tuple = (), prefixes: list[str] | tuple = ()):
+        """Drops the entries here and tells every other process to do the same."""
+        self.apply(keys, prefixes)
+        redis = state.get("redis")
+        if redis:
+            try:
+                payload = json.dumps({"keys": list(keys), "prefixes": list(prefixes)})
+                await redis.publish(self.channel, payload)
+            except Exception as e:
+                logger.warning("cache_invalidation_publish_failed", error=str(e))
+
+    def start(self) -> None:
+        if not self.running and state.get("redis"):
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _on_message(self, data: str | bytes) -> None:
+        try:
+            message = json.loads(data)
+            self.apply(message.get("keys", ()), message.get("prefixes", ()))
+        except (ValueError, AttributeError) as e:
+            logger.warning("cache_invalidation_message_invalid", error=str(e))
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = None
+            try:
+                pubsub = state["redis"].pubsub()
+                await pubsub.subscribe(self.channel)
+                # Messages published while unsubscribed are lost: start from a clean L1
+                self.cache.clear()
+                self.generation += 1
+                backoff = 1.0
+                logger.info("cache_invalidation_subscribed", channel=self.channel)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._on_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("cache_invalidation_listener_failed", error=str(e))
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:  # noqa: S110 (connection already gone)
+                        pass
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.MAX_BACKOFF_SECONDS)
@@ -0,0 +1,114 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+"""
+Job Status Store: evaluation results live in ARQ's result store, and workers publish
+a completion signal per job so API long-polls and SSE streams wake the moment it
+finishes instead of polling on a timer. Submission claims map retried requests
+(Idempotency-Key or identical content) onto the job they already created.
+"""
+
+import asyncio
+import hashlib
+import json
+import uuid
+from typing import Any
+
+from arq import ArqRedis
+from arq.jobs import Job
+
+from src.core.logging import logger
+
+JOB_DONE_CHANNEL = "commitvigil:job_done:{job_id}"
+# Safety net if a completion signal is missed (e.g. published during a reconnect)
+FALLBACK_POLL_SECONDS = 1.0
+TERMINAL_STATUSES = frozenset({"complete", "failed", "not_found"})
+SUBMISSION_KEY = "evaluate:submission:{scope}:{digest}"
+
+
+class IdempotencyKeyReused(Exception):
+    """An Idempotency-Key was replayed with a different request body."""
+
+
+def fingerprint(*parts: Any) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+async def claim_submission(
+    redis: ArqRedis, scope: str, digest: str, ttl: int, body_fingerprint: str | None = None
+) -> tuple[str, bool]:
+    """
+    (job_id, is_new) for a submission. The first caller within `ttl` claims a fresh
+    job id; repeats get the original one. With `body_fingerprint` (client-chosen keys),
+    raises IdempotencyKeyReused when the claim was made by a request with a different body.
+    """
+    key = SUBMISSION_KEY.format(scope=scope, digest=digest)
+    for _ in range(2):  # A claim can expire between SET NX and GET: retry once
+        job_id = uuid.uuid4().hex
+        if await redis.set(key, f"{job_id}:{body_fingerprint or ''}", nx=True, ex=ttl):
+            return job_id, True
+        existing = await redis.get(key)
+        if existing is None:
+            continue
+        existing_id, _, existing_fingerprint = _decode(existing).partition(":")
+        if body_fingerprint is not None and existing_fingerprint != body_fingerprint:
+            raise IdempotencyKeyReused(key)
+        return existing_id, False
+    return job_id, True
+
+
+async def release_submission(redis: ArqRedis, scope: str, digest: str) -> None:
+    """Drops a claim whose job could not be enqueued, so a retry can try again."""
+    try:
+        await redis.delete(SUBMISSION_KEY.format(scope=scope, digest=digest))
+    except Exception as e:
+        logger.warning("submission_release_failed", error=str(e))
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+async def publish_job_done(redis: ArqRedis, job_id: str) -> None:
+    try:
+        await redis.publish(JOB_DONE_CHANNEL.format(job_id=job_id), "1")
+    except Exception as e:
+        logger.warning("job_done_publish_failed", job_id=job_id, error=str(e))
+
+
+async def job_snapshot(redis: ArqRedis, job_id: str) -> dict[str, Any]:
+    """
+    Current state of a job: queued/deferred/in_progress, complete (with its result),
+    failed (with the error) or not_found (unknown or result expired).
+    """
+    job = Job(job_id, redis)
+    info = await job.result_info()
+    if info is not None:
+        if info.success:
+            return {"job_id": job_id, "status": "complete", "result": info.result}
+        return {"job_id": job_id, "status": "failed", "error": str(info.result)}
+    status = await job.status()
+    return {"job_id": job_id, "status": status.value}
+
+
+async def wait_for_job(redis: ArqRedis, job_id: str, timeout: float) -> dict[str, Any]:
+    """Long-poll: the job's snapshot as soon as it is terminal, or when `timeout` elapses."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    pubsub = redis.pubsub()
+    try:
+        # Subscribe before the first read so a job finishing in between still wakes us
+        await pubsub.subscribe(JOB_DONE_CHANNEL.format(job_id=job_id))
+        snapshot = await job_snapshot(redis, job_id)
+        while snapshot["status"] not in TERMINAL_STATUSES:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=min(remaining, FALLBACK_POLL_SECONDS)
+            )
+            snapshot = await job_snapshot(redis, job_id)
+        return snapshot
+    finally:
+        try:
+            await pubsub.aclose()
+        except Exception:  # noqa: S110 (connection already gone)
+            pass
@@ -0,0 +1,132 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+"""
+Deterministic Keyword Firewall: an Aho-Corasick automaton over the restricted topics
+of a safety policy. One pass over the message finds every keyword regardless of how
+many are configured, with Unicode (NFKC) and case normalization on both sides.
+"""
+
+import unicodedata
+from collections import deque
+from collections.abc import Iterator
+
+REDACTION_MASK = "[REDACTED]"
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def _fold(text: str) -> tuple[str, str, list[int]]:
+    """
+    (nfkc, folded, origin): casefolding can change lengths ("ß" -> "ss"), so origin[j]
+    maps folded[j] back to its index in the NFKC form for redaction.
+    """
+    nfkc = unicodedata.normalize("NFKC", text)
+    folded: list[str] = []
+    origin: list[int] = []
+    for index, char in enumerate(nfkc):
+        for piece in char.casefold():
+            folded.append(piece)
+            origin.append(index)
+    return nfkc, "".join(folded), origin
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick matcher for whole-word keywords. Immutable once built; build it once
+    per policy and share it across messages.
+    """
+
+    def __init__(self, keywords: list[str] | tuple[str, ...]):
+        self.keywords: tuple[str, ...] = ()
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+        self._lengths: list[int] = []
+
+        seen: set[str] = set()
+        kept: list[str] = []
+        for keyword in keywords:
+            pattern = normalize(keyword).strip()
+            if pattern and pattern not in seen:
+                seen.add(pattern)
+                kept.append(keyword)
+                self._insert(pattern, len(self._lengths))
+                self._lengths.append(len(pattern))
+        self.keywords = tuple(kept)
+        self._link()
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def _insert(self, pattern: str, index: int) -> None:
+        state = 0
+        for char in pattern:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        self._output[state].append(index)
+
+    def _link(self) -> None:
+        """Breadth-first failure links; outputs inherit those of their failure state."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def _scan(self, folded: str) -> Iterator[tuple[int, int, int]]:
+        """(start, end, keyword index) for every whole-word occurrence in folded text."""
+        state = 0
+        for position, char in enumerate(folded):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for index in self._output[state]:
+                end = position + 1
+                start = end - self._lengths[index]
+                if (start == 0 or not _is_word_char(folded[start - 1])) and (
+                    end == len(folded) or not _is_word_char(folded[end])
+                ):
+                    yield start, end, index
+
+    def find(self, text: str) -> list[str]:
+        """Configured keywords present in the text, in order of first occurrence."""
+        if not self.keywords:
+            return []
+        _nfkc, folded, _origin = _fold(text)
+        hits = dict.fromkeys(self.keywords[index] for _s, _e, index in self._scan(folded))
+        return list(hits)
+
+    def redact(self, text: str, mask: str = REDACTION_MASK) -> str:
+        """Replaces leftmost-longest, non-overlapping keyword occurrences with the mask."""
+        nfkc, folded, origin = _fold(text)
+        if not self.keywords:
+            return nfkc
+        spans = sorted(((s, e) for s, e, _i in self._scan(folded)), key=lambda m: (m[0], -m[1]))
+        pieces: list[str] = []
+        cursor = 0
+        for start, end in spans:
+            first, last = origin[start], origin[end - 1] + 1
+            if first < cursor:
+                continue  # Overlaps a span already masked
+            pieces.append(nfkc[cursor:first])
+            pieces.append(mask)
+            cursor = last
+        pieces.append(nfkc[cursor:])
+        return "".join(pieces)
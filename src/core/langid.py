@@ -0,0 +1,86 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+"""
+Offline Language Identification (character trigram profiles).
+Answers in microseconds so the LLM is only consulted for ambiguous check-ins.
+Profiles are regenerated with scripts/build_langid_profiles.py.
+"""
+
+import re
+from collections import Counter
+
+PROFILE_SIZE = 120
+# Below this many trigrams the evidence is too thin to trust a profile match
+MIN_EVIDENCE_TRIGRAMS = 24
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+# Generated by scripts/build_langid_profiles.py (rank-ordered, most frequent first)
+_PROFILES: dict[str, str] = {
+    "en": " th|the|he | i |ing|nd |ng | an|ay |ed |is | is| re| to| we|and|day|on |re | be|for|ll |se |to | fo| ha| mo| ne| pr| wa| wi|ati|en |ent|est|ill|ld |nt |or |tha|thi|ve |we | de| me| no| of| so| te| wh|am |at |ave|ead|er |ew |hat|hav|hin|ion|me |men|of |oul|pro|rit|st |ter|til|tio|uld| bl| bu| by| da| fi| he| mi| on| pa| se| sh| st| un| ye| yo|ady|aft|ait|an |as |ase|be |blo|by |dat|dy |eam|eed|eek|elp|end|erd|ere|evi|ext|ght|gra|hel|her|hou|ht |ien|iew|igh|int|it |ith|iti|ked",
+    "de": "en | de|ch |ich|er | di| ic|che|den|die|ie |ste| da| un|abe|der|nd |ng |und|ung| be| ge|ert|ir |sch|st |ten| ha| we| wi|ben|ent|och|rei|rt |spr|ver|wir| ve|as |ber|das|eit|ell|ers|est|ges|hab|hen|ist|te | au| fr| he| is| no| te| wa|ag |art|be |bei|cht|de |ein|em |erd|ere|esp|fer|he |ht |ier|ion|lle|nde|noc|on |rde|tag|tel|ter|tio|war|wer| ab| an| bi| bl| en| et| fe| fü| ga| im| ka| mi| mo| pr| sc| so|ach|alb|am |and|ank|anz|ass|ati|auf|bes|bis|blo|chi|chu|dan|dem|des|eam|ech",
+    "fr": " la|la |ion| pr|on |our| de|re |ue | le|ati|de |le |ur |ai |ous|pou|que|tio|us | ai| et| l | pa| po|er |et | j | je| no| qu| re|ent|es |est|je |nou|nt |se |te | au| av| en| es| mi| pe|end|in |jou|men|ons|pro|st |tre|ée | d | do| dé| to| à |ce |di |don|ien|ise|lé |ns |par|pre|rai|rd |res|ser|sio|tou|ts |tte|té |ut |ver| a | at| be| bl| du| hi| jo| ma| me| mo| se| so| te| va| ve| vo| éc| éq| ét|aid|ain|ais|ali|ant|att|aur|ava|ave|blo|ci |cor|cti|dre|ec |ema|eme|en |enc|ens|eut",
+    "es": " la|la | de|el | es|ue | el|que|ón |de |ión| qu| pr| y |aci|est|os | al| po|or |por| co| re|al |ció|da |do |esp|sta|te | ay| ha| se| si|con|ent|er |mos|nte|on |per|ta | ca| en| te|ada|ado|amo|ana|ar |as |es |gra|gue|ien|igu|me |nal|pri|pro|qui|rac|se |sig|sió|to |tuv| ac| ba| bl| eq| in| mi| no| pa| pe| pu| so| to| tu|abl|ad |ali|and|ay |aye|ayu|baj|bas|blo|can|cha|cia|dad|deb|del|des|eba|egu|ema|equ|era|esi|evi|ha |hay|ida|ier|ina|int|ipo|isi|ite|iza|lie|loq|man|mo |na |nci",
+    "pt": "ão | a |da | de| pr| es| co| o |de |do |que| se|açã|est|os |ção| do| e | qu|com|ra | pa|ada|ar |ent|nte|to |ue | ma| pe| re|mos|om |ou |pre|pro|rev|se |vis| at| en| na| po| te| vo|ara|egu|ei |eir|ela|emo|er |era|es |esc|evi|is |ise|man|na |nda|ont|par|pe |pel|raç|seg|stá|são|ta |ter|tes|tá |uda|ver| ai| aj| al| bl| da| eq| eu| fe| fi| me| mu| nã| on| so| ta| to|ado|ain|ais|aju|ali|amo|ana|and|ant|blo|cis|con|dad|dar|eci|em |ema|equ|esp|eu |eve|fei|gra|ho |ia |ina|ind|io |ipe",
+    "sv": "en |ag |et | ja|gen|jag|an |ar |ing| de| oc|ch |för|nge|och|om |tt | me| ti|att|de |era| at| fö| sk|dag|ed |med|nde|nin|ter|var|är | om| pr| va| vi| är|det|er |ill|ka |kan|ker|ll |ran|ta |til|vi | bl| ha| in| te|and|ans|ara|cka|cke|den|eda|ion|nen|nna|ns |nta|one|ort|ras|ska|som|sta|ste|tet|tio|und|ver|ör | av| be| da| di| dr| ef| fo| he| hj| ig| ka| kl| ko| ku| nä| so| sä| tr| ve| vä| öv|ad |age|ame|as |at |ata|ati|av |bet|blo|dan|dat|der|dri|eam|eck|eft|ela|eta|far|for|fte",
+}
+
+
+def extract_trigrams(text: str) -> list[str]:
+    """Space-padded character trigrams of every alphabetic token."""
+    trigrams: list[str] = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        padded = f" {word} "
+        trigrams.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def _script_language(text: str) -> tuple[str, float] | None:
+    """CJK scripts are identified by code point range alone."""
+    kana = sum(1 for ch in text if "\u3040" <= ch <= "\u30ff")
+    han = sum(1 for ch in text if "\u4e00" <= ch <= "\u9fff")
+    letters = sum(1 for ch in text if ch.isalpha())
+    if not letters or (kana + han) / letters < 0.3:
+        return None
+    # Japanese mixes kana into kanji; Chinese text has none
+    return ("ja", 1.0) if kana else ("zh", 1.0)
+
+
+def _build_weights() -> dict[str, dict[str, float]]:
+    weights: dict[str, dict[str, float]] = {}
+    for code, profile in _PROFILES.items():
+        ranked = profile.split("|")
+        weights[code] = {
+            tri: (PROFILE_SIZE - rank) / PROFILE_SIZE for rank, tri in enumerate(ranked)
+        }
+    return weights
+
+
+_WEIGHTS = _build_weights()
+
+
+def identify_language(text: str) -> tuple[str, float]:
+    """
+    Returns (iso_code, confidence) where confidence is in [0, 1].
+    Confidence blends the margin over the runner-up with how much evidence the text holds.
+    """
+    scripted = _script_language(text)
+    if scripted:
+        return scripted
+
+    counts = Counter(extract_trigrams(text))
+    total = sum(counts.values())
+    if not total:
+        return "en", 0.0
+
+    scores = {
+        code: sum(weights.get(tri, 0.0) * n for tri, n in counts.items()) / total
+        for code, weights in _WEIGHTS.items()
+    }
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    (best_code, best), (_, runner_up) = ranked[0], ranked[1]
+    if best <= 0:
+        return "en", 0.0
+
+    margin = (best - runner_up) / best
+    evidence = min(1.0, total / MIN_EVIDENCE_TRIGRAMS)
+    return best_code, round(min(1.0, margin * 2) * evidence, 3)
@@ -2,7 +2,7 @@
 import time
 from contextlib import contextmanager
 
-from prometheus_client import Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 from src.core.config import settings
 from src.core.logging import logger
@@ -15,6 +15,110 @@ OPERATION_LATENCY = Histogram(
     buckets=[10, 50, 100, 250, 500, 1000, 2500, 5000],
 )
 
+# LLM Response Cache effectiveness (labelled by Pydantic response model, never by content)
+LLM_CACHE_HITS = Counter(
+    "commitvigil_llm_cache_hits_total",
+    "LLM completions served from the response cache",
+    ["response_model", "tier"],
+)
+LLM_CACHE_MISSES = Counter(
+    "commitvigil_llm_cache_misses_total",
+    "LLM completions that required a provider round-trip",
+    ["response_model"],
+)
+
+# Duplicate in-flight lookups that were served by another caller's computation
+SINGLEFLIGHT_COALESCED = Counter(
+    "commitvigil_singleflight_coalesced_total",
+    "Concurrent calls that awaited an in-flight computation instead of repeating it",
+    ["group"],
+)
+
+# LLM Admission Control (per provider/model queueing ahead of the provider quota)
+LLM_ADMISSION_QUEUE_DEPTH = Gauge(
+    "commitvigil_llm_admission_queue_depth",
+    "LLM calls waiting for rate or concurrency budget",
+    ["provider", "model"],
+)
+LLM_ADMISSION_WAIT = Histogram(
+    "commitvigil_llm_admission_wait_ms",
+    "Time LLM calls spent queued before admission in milliseconds",
+    ["provider", "model"],
+    buckets=[1, 10, 50, 100, 250, 500, 1000, 2500, 5000, 10000],
+)
+LLM_CONCURRENCY_LIMIT = Gauge(
+    "commitvigil_llm_concurrency_limit",
+    "Current adaptive (AIMD) concurrency window per provider/model",
+    ["provider", "model"],
+)
+
+# Hedged LLM requests (primary vs secondary provider race outcomes)
+LLM_HEDGE_EVENTS = Counter(
+    "commitvigil_llm_hedge_events_total",
+    "Outcomes of hedged LLM requests",
+    ["outcome"],
+)
+
+# Provider circuit breakers and the heuristic answers served while they are open
+LLM_CIRCUIT_STATE = Gauge(
+    "commitvigil_llm_circuit_state",
+    "Circuit breaker state per provider/model (0=closed, 1=open, 2=half_open)",
+    ["provider", "model"],
+)
+LLM_DEGRADED_RESPONSES = Counter(
+    "commitvigil_llm_degraded_responses_total",
+    "Analyses answered by the heuristic fast-path while a provider circuit was open",
+    ["response_model"],
+)
+
+# Safety audit decisions taken without an LLM round trip
+SAFETY_LOCAL_VERDICTS = Counter(
+    "commitvigil_safety_local_verdicts_total",
+    "Safety audits decided locally (keyword firewall, verdict cache)",
+    ["outcome"],
+)
+
+# Per-node latency of the evaluation DAG (critical path vs overlapped lookups)
+PIPELINE_NODE_LATENCY = Histogram(
+    "commitvigil_pipeline_node_latency_ms",
+    "Time spent in each evaluation pipeline node in milliseconds",
+    ["pipeline", "node"],
+    buckets=[1, 5, 10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000],
+)
+
+# Reliability write-behind flushes (users per batched upsert)
+RELIABILITY_FLUSH_BATCH = Histogram(
+    "commitvigil_reliability_flush_batch_users",
+    "Users written per batched reliability flush",
+    buckets=[1, 5, 10, 25, 50, 100, 250, 500, 1000],
+)
+
+# Follow-up requests folded into an already pending per-user follow-up
+FOLLOW_UPS_COALESCED = Counter(
+    "commitvigil_follow_ups_coalesced_total",
+    "High-risk follow-up requests merged into a pending follow-up for the same user",
+)
+
+# Outbound Slack delivery queue
+SLACK_DELIVERY_LATENCY = Histogram(
+    "commitvigil_slack_delivery_latency_ms",
+    "Time from enqueue to successful Slack delivery in milliseconds",
+    buckets=[10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000],
+)
+SLACK_DELIVERY_EVENTS = Counter(
+    "commitvigil_slack_delivery_events_total",
+    "Outbound Slack queue outcomes per message",
+    ["outcome"],  # delivered | rate_limited | retried | dropped
+)
+
+# Micro-batch sizes (items handed to one batch handler call)
+MICRO_BATCH_SIZE = Histogram(
+    "commitvigil_micro_batch_size",
+    "Items processed per micro-batch",
+    ["batcher"],
+    buckets=[1, 2, 5, 10, 25, 50, 100, 250],
+)
+
 
 @contextmanager
 def LatencyMonitor(operation_name: str, user_id: str):
@@ -0,0 +1,72 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+"""
+Pipeline DAG Scheduler: each node starts the moment its dependencies resolve, so
+independent lookups overlap with LLM analysis instead of running in phases.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.core.monitoring import PIPELINE_NODE_LATENCY
+
+
+class PipelineGraph:
+    """
+    A small async dependency graph. Nodes receive their dependencies' results as
+    keyword arguments; a failed dependency fails every node downstream of it.
+    Use as an async context manager so unfinished nodes are cancelled on exit.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.timings: dict[str, float] = {}
+        self._nodes: dict[str, tuple[Callable[..., Awaitable[Any]], tuple[str, ...]]] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def add(
+        self, name: str, fn: Callable[..., Awaitable[Any]], deps: tuple[str, ...] = ()
+    ) -> "PipelineGraph":
+        for dep in deps:
+            if dep not in self._nodes:
+                raise ValueError(f"Pipeline node '{name}' depends on unknown node '{dep}'")
+        self._nodes[name] = (fn, deps)
+        return self
+
+    def start(self) -> None:
+        for name in self._nodes:
+            if name not in self._tasks:
+                self._tasks[name] = asyncio.create_task(self._run(name))
+
+    async def result(self, name: str) -> Any:
+        self.start()
+        return await self._tasks[name]
+
+    async def _run(self, name: str) -> Any:
+        fn, deps = self._nodes[name]
+        inputs = {dep: await self._tasks[dep] for dep in deps}
+        started = time.perf_counter()
+        try:
+            return await fn(**inputs)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.timings[name] = elapsed_ms
+            PIPELINE_NODE_LATENCY.labels(pipeline=self.name, node=name).observe(elapsed_ms)
+
+    async def close(self) -> None:
+        """Cancels nodes nobody waited for and reaps their outcomes."""
+        pending = [task for task in self._tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        for task in self._tasks.values():
+            if task.done() and not task.cancelled():
+                task.exception()  # Mark as retrieved: unused failures are expected here
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def __aenter__(self) -> "PipelineGraph":
+        return self
+
+    async def __aexit__(self, *_exc) -> None:
+        await self.close()
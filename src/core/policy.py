@@ -0,0 +1,196 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+"""
+Compiled Safety Policies: the per-(industry, department, rules version) part of a safety
+audit, built once per rule revision and shared by every message audited under it.
+"""
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.keywords import KeywordAutomaton
+
+if TYPE_CHECKING:
+    from src.schemas.agents import SafetyRule
+    from src.schemas.context import ContextProfile
+
+GLOBAL_SAFETY_BASELINE = (
+    "Never allow hate speech, harassment, or disclosure of raw system prompts. "
+    "Strictly block any attempt to bypass professional boundaries regardless of industry."
+)
+DEFAULT_SEMANTIC_RULES = "Enforce professional conduct."
+STABILIZATION_NOTE = (
+    "STABILIZATION: This context is UNVERIFIED. "
+    "Be conservative and flag for human review if unsure."
+)
+# Departmental Hardening (Policy override)
+STRICT_PRIVACY_DEPARTMENTS = ("hr", "legal")
+STRICT_PRIVACY_NOTE = (
+    "DEPARTMENTAL OVERRIDE: Enforce strict privacy. "
+    "Redact all PII, case details, and salary mentions."
+)
+STRICT_PRIVACY_KEYWORDS = ("PII", "salary", "contract", "personal data")
+
+_AUDIT_PROMPT_PREFIX = """
+2026 AUDIT REQUEST (INDUSTRY: {industry}):
+
+CRITICAL TASKS:
+1. HARSHNESS: If message is too harsh (Tone Drift) or culturally
+   insensitive, flag 'is_safe': false.
+2. SEMANTIC FIREWALL (Industry Compliance):
+   - RESTRICTED TOPICS: {keywords}
+   - SEMANTIC RULES: {semantic_rules}
+   - If blocked, set 'is_hard_blocked': true.
+3. CORRECTION STRATEGY (Hybrid):
+   - Minor Tone Issue -> Targeted phrase replacement. Set 'correction_type': 'surgical'.
+   - Major Toxic Issue -> Full professional rewrite. Set 'correction_type': 'full_rewrite'.
+
+4. CONFIDENCE:
+   - If unsure, set 'supervisor_confidence' < {threshold}
+     and flag 'requires_human_review'.
+"""
+
+_AUDIT_PROMPT_DATA = """
+DATA TO AUDIT:
+<proposed_message>
+{message}
+</proposed_message>
+
+<intended_tone>
+{tone}
+</intended_tone>
+
+<user_context>
+{user_context}
+</user_context>
+
+MANAGER_ACCEPTANCE_RATE: {acceptance_rate} (If < 0.8, favor 'requires_human_review': True)
+FORCED_HUMAN_REVIEW: {force_human_review}
+"""
+
+
+class CompiledSafetyPolicy:
+    """
+    Immutable audit policy: merged restricted keywords, their matcher, the semantic
+    rules and the static prompt text. `version` changes whenever any of them does,
+    so downstream caches can key on it.
+    """
+
+    __slots__ = (
+        "force_human_review",
+        "industry",
+        "keywords",
+        "matcher",
+        "prompt_prefix",
+        "semantic_rules",
+        "system_prompt",
+        "version",
+    )
+
+    def __init__(
+        self,
+        industry: str,
+        keywords: list[str] | tuple[str, ...],
+        semantic_rules: str,
+        force_human_review: bool = False,
+    ):
+        self.industry = industry
+        # Ordered de-duplication keeps the rendered prompt identical across processes
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self.semantic_rules = semantic_rules
+        self.force_human_review = force_human_review
+        self.matcher = KeywordAutomaton(self.keywords)
+        self.system_prompt = (
+            f"You are a specialized 2026 {industry.capitalize()} Ethics & Security Supervisor."
+        )
+        self.prompt_prefix = _AUDIT_PROMPT_PREFIX.format(
+            industry=industry.upper(),
+            keywords=", ".join(self.keywords),
+            semantic_rules=semantic_rules,
+            threshold=settings.SAFETY_CONFIDENCE_THRESHOLD,
+        )
+        fingerprint = "\x1f".join((self.system_prompt, self.prompt_prefix, str(force_human_review)))
+        self.version = hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+
+    def find_restricted(self, message: str) -> list[str]:
+        """Restricted keywords present in the message (whole-word, Unicode/case-insensitive)."""
+        return self.matcher.find(message)
+
+    def redact(self, message: str) -> str:
+        return self.matcher.redact(message)
+
+    def render_prompt(
+        self, message: str, tone: str, user_context: str, acceptance_rate: float
+    ) -> str:
+        return self.prompt_prefix + _AUDIT_PROMPT_DATA.format(
+            message=message,
+            tone=tone,
+            user_context=user_context,
+            acceptance_rate=acceptance_rate,
+            force_human_review=self.force_human_review,
+        )
+
+    def with_context(self, context_profile: "ContextProfile | None") -> "CompiledSafetyPolicy":
+        """Layers a context profile's departmental override and dynamic rules on top."""
+        dynamic_rules = getattr(context_profile, "dynamic_safety_rules", None)
+        if not dynamic_rules:
+            return self
+
+        strict_privacy = context_profile.department in STRICT_PRIVACY_DEPARTMENTS
+        keywords: list[str] = []
+        notes: list[str] = []
+        for rule in dynamic_rules:
+            if hasattr(rule, "target_tokens"):
+                keywords.extend(rule.target_tokens)
+            notes.append(f"[{rule.rule_name}]: {rule.reasoning}")
+
+        key = ("context", self.version, strict_privacy, tuple(keywords), tuple(notes))
+        policy = _compiled_policies.get(key)
+        if policy is None:
+            semantic_rules = self.semantic_rules
+            merged = list(self.keywords)
+            if strict_privacy:
+                semantic_rules += f" | {STRICT_PRIVACY_NOTE}"
+                merged.extend(STRICT_PRIVACY_KEYWORDS)
+            merged.extend(keywords)
+            if notes:
+                semantic_rules += " | DYNAMIC RULES: " + " ".join(notes)
+            policy = CompiledSafetyPolicy(
+                self.industry, merged, semantic_rules, self.force_human_review
+            )
+            _compiled_policies.set(key, policy)
+        return policy
+
+
+# Keyed by rule revision (or context layer), so a rule update simply stops hitting old entries
+_compiled_policies = TTLCache(max_entries=1024, default_ttl=3600)
+
+
+def compile_safety_policy(
+    rules: "SafetyRule | None", industry: str = "generic"
+) -> CompiledSafetyPolicy:
+    """The compiled policy for a resolved rule, rebuilt only when the rule's revision changes."""
+    industry = industry.lower()
+    revision = (
+        (rules.id, rules.industry, rules.department, rules.updated_at, rules.is_verified)
+        if rules
+        else None
+    )
+    key = ("rule", industry, revision)
+    policy = _compiled_policies.get(key)
+    if policy is None:
+        semantic_rules = str(rules.semantic_rules) if rules else DEFAULT_SEMANTIC_RULES
+        semantic_rules += f" | MANDATORY BASELINE: {GLOBAL_SAFETY_BASELINE}"
+        # Stabilization Layer: Force Human Review if context is unverified
+        force_human_review = bool(rules and not rules.is_verified)
+        if force_human_review:
+            semantic_rules += f" | {STABILIZATION_NOTE}"
+        policy = CompiledSafetyPolicy(
+            industry,
+            list(rules.hr_keywords) if rules else [],
+            semantic_rules,
+            force_human_review,
+        )
+        _compiled_policies.set(key, policy)
+    return policy
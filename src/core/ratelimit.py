@@ -0,0 +1,40 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Classic token bucket: `rate` tokens refill per second up to `capacity`.
+    Waiters are served FIFO so a large request cannot be starved by small ones.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def try_acquire(self, amount: float = 1.0) -> bool:
+        self._refill()
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return True
+        return False
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Blocks until `amount` tokens are available. Returns seconds spent waiting."""
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        async with self._lock:
+            while not self.try_acquire(amount):
+                delay = (amount - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+        return waited
@@ -0,0 +1,157 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar, cast
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from src.core.config import settings
+from src.core.logging import logger
+from src.core.monitoring import SINGLEFLIGHT_COALESCED
+from src.core.state import state
+
+R = TypeVar("R")
+
+# Compare-and-delete so a slow leader never releases a lock it no longer owns
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class _LeaderCancelled(Exception):
+    """The leader was cancelled (e.g. its stage budget ran out) before finishing."""
+
+
+class SingleFlight:
+    """
+    In-Process Request Coalescing: only one computation runs per key at a time.
+    Concurrent callers for the same key await the leader's result (or exception).
+    If the leader itself is cancelled, a waiting follower takes over as leader.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[R]]) -> R:
+        while True:
+            existing = self._inflight.get(key)
+            if existing is None or existing.get_loop() is not asyncio.get_running_loop():
+                return await self._lead(key, fn)
+            SINGLEFLIGHT_COALESCED.labels(group=key.split(":", 1)[0]).inc()
+            try:
+                # Shield: a cancelled follower must not cancel the leader's work
+                return await asyncio.shield(existing)
+            except _LeaderCancelled:
+                continue
+
+    async def _lead(self, key: str, fn: Callable[[], Awaitable[R]]) -> R:
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Followers were not cancelled: wake them to retry rather than cancel them
+            future.set_exception(_LeaderCancelled(key))
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved: followers are optional
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+
+class RedisSingleFlight:
+    """
+    Cross-Worker Request Coalescing: a Redis lock (SET NX PX) elects one leader per key
+    across API and worker processes. When a `model` is given, the leader publishes its
+    result as JSON under a short-lived key that followers poll; otherwise (or if the leader
+    fails or dies) the lock clears without a result and the next follower to take the lock
+    runs the function, which should re-check the store before doing the work again.
+    Degrades to in-process coalescing when Redis is unavailable.
+    """
+
+    def __init__(
+        self,
+        local: SingleFlight | None = None,
+        lock_ttl_seconds: float | None = None,
+        poll_interval_seconds: float = 0.05,
+    ) -> None:
+        self.local = local or SingleFlight()
+        self.lock_ttl_seconds = lock_ttl_seconds or settings.SINGLEFLIGHT_LOCK_TTL_SECONDS
+        self.poll_interval_seconds = poll_interval_seconds
+
+    async def do(
+        self, key: str, fn: Callable[[], Awaitable[R]], model: type[BaseModel] | None = None
+    ) -> R:
+        return await self.local.do(key, lambda: self._run_locked(key, fn, model))
+
+    async def _run_locked(
+        self, key: str, fn: Callable[[], Awaitable[R]], model: type[BaseModel] | None
+    ) -> R:
+        redis = state.get("redis")
+        if not redis:
+            return await fn()
+
+        lock_key = f"singleflight:{key}"
+        result_key = f"singleflight:result:{key}"
+        ttl_ms = int(self.lock_ttl_seconds * 1000)
+        token = uuid4().hex
+        try:
+            while not await redis.set(lock_key, token, nx=True, px=ttl_ms):
+                await asyncio.sleep(self.poll_interval_seconds)
+                # Check for a result before retrying the lock the leader just released
+                published = await redis.get(result_key) if model else None
+                if model and published is not None:
+                    return cast(R, model.model_validate_json(published))
+            await redis.delete(result_key)  # Never serve a previous flight's result
+        except Exception as e:
+            logger.warning("singleflight_lock_failed", key=key, error=str(e))
+            return await fn()
+
+        try:
+            result = await fn()
+            if model and isinstance(result, model):
+                try:
+                    await redis.set(result_key, result.model_dump_json(), px=ttl_ms)
+                except Exception as e:
+                    logger.warning("singleflight_publish_failed", key=key, error=str(e))
+            return result
+        finally:
+            try:
+                await redis.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+            except Exception as e:
+                logger.warning("singleflight_unlock_failed", key=key, error=str(e))
+
+
+# Process-wide groups shared by every call site
+inflight = SingleFlight()
+distributed = RedisSingleFlight()
+
+
+def singleflight(
+    key_builder: Callable[..., str], cross_worker: bool = False
+) -> Callable[[Callable[..., Awaitable[R]]], Callable[..., Awaitable[R]]]:
+    """
+    Decorator form: `key_builder` receives the same arguments as the wrapped coroutine.
+    """
+
+    def decorator(func: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> R:
+            group = distributed if cross_worker else inflight
+            return await group.do(key_builder(*args, **kwargs), lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
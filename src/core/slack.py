@@ -1,14 +1,25 @@
 # Copyright (c) 2026 CommitVigil AI. All rights reserved.
+import asyncio
+import os
+import socket
+import time
+import uuid
+from collections import deque
+
 import httpx
 
 from src.core.config import settings
 from src.core.logging import logger
+from src.core.monitoring import SLACK_DELIVERY_EVENTS, SLACK_DELIVERY_LATENCY
+from src.core.ratelimit import TokenBucket
+from src.core.state import state
 
 
 class SlackConnector:
     """
     Handles outbound notifications to Slack via Webhooks.
     Uses connection pooling via a shared AsyncClient for efficiency.
+    When the delivery queue is running, notifications are queued instead of posted inline.
     """
 
     _client: httpx.AsyncClient | None = None
@@ -29,6 +40,10 @@ class SlackConnector:
         prefix = f"<@{slack_id}> " if slack_id else ""
         formatted_message = f"{prefix}{message}"
 
+        if slack_outbox.running:
+            await slack_outbox.enqueue(formatted_message)
+            return
+
         client = cls.get_client()
         try:
             payload = {"text": formatted_message}
@@ -46,3 +61,319 @@ class SlackConnector:
     async def close(cls):
         if cls._client and not cls._client.is_closed:
             await cls._client.aclose()
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+DEFAULT_WEBHOOK = "default"
+
+
+class SlackMessage:
+    __slots__ = ("attempts", "enqueued_at", "journal_id", "text", "webhook")
+
+    def __init__(self, webhook: str, text: str, enqueued_at: float, journal_id=None):
+        self.webhook = webhook  # Alias, resolved to a URL only when sending
+        self.text = text
+        self.enqueued_at = enqueued_at
+        self.journal_id = journal_id
+        self.attempts = 0
+
+
+class SlackDeliveryQueue:
+    """
+    Outbound Delivery Layer: one sender per webhook, paced by its own token bucket
+    (Slack allows ~1 msg/sec per webhook). Messages waiting for the same webhook are
+    sent as one payload; 429s are retried after `Retry-After`, 5xx/network errors with
+    backoff. Messages are journaled to a Redis stream read as one consumer group: the
+    process that reads an entry delivers it, and entries a consumer holds unacknowledged
+    past the recovery age (stopped or crashed process) are claimed by another one.
+    The journal stores webhook aliases only; webhook URLs are credentials and stay in
+    settings (or the in-process `webhooks` map) until the moment of sending.
+    """
+
+    STREAM_KEY = "slack:outbox"
+    GROUP = "slack-senders"
+
+    def __init__(
+        self,
+        rate_per_second: float | None = None,
+        batch_max_messages: int | None = None,
+        max_attempts: int | None = None,
+        webhooks: dict[str, str] | None = None,
+    ):
+        self.rate_per_second = rate_per_second or settings.SLACK_RATE_LIMIT_PER_SECOND
+        self.batch_max_messages = batch_max_messages or settings.SLACK_BATCH_MAX_MESSAGES
+        self.max_attempts = max_attempts or settings.SLACK_DELIVERY_MAX_ATTEMPTS
+        self.webhooks = webhooks or {}
+        self.consumer = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._queues: dict[str, deque[SlackMessage]] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._senders: dict[str, asyncio.Task] = {}
+        self._recovery: asyncio.Task | None = None
+        self._journaled = False
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def pending(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def resolve_webhook(self, alias: str) -> str | None:
+        if alias in self.webhooks:
+            return self.webhooks[alias]
+        return settings.SLACK_WEBHOOK_URL if alias == DEFAULT_WEBHOOK else None
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._journaled = await self._join_group()
+        await self.recover()
+        if self._journaled:
+            self._recovery = asyncio.create_task(self._recover_periodically())
+        logger.info("slack_delivery_queue_started", rate_per_second=self.rate_per_second)
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        """Gives queued messages a bounded chance to go out; the journal keeps the rest."""
+        self._running = False
+        if self._recovery is not None:
+            self._recovery.cancel()
+            await asyncio.gather(self._recovery, return_exceptions=True)
+            self._recovery = None
+        senders = [task for task in self._senders.values() if not task.done()]
+        if senders:
+            _done, still_running = await asyncio.wait(senders, timeout=drain_timeout)
+            for task in still_running:
+                task.cancel()
+            await asyncio.gather(*still_running, return_exceptions=True)
+        self._senders.clear()
+        await self._leave_group()
+        logger.info("slack_delivery_queue_stopped", undelivered=self.pending)
+
+    async def drain(self) -> None:
+        """Waits until everything queued so far has been delivered or dropped."""
+        while senders := [task for task in self._senders.values() if not task.done()]:
+            await asyncio.gather(*senders, return_exceptions=True)
+
+    async def _join_group(self) -> bool:
+        redis = state.get("redis")
+        if not redis:
+            return False
+        try:
+            await redis.xgroup_create(self.STREAM_KEY, self.GROUP, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):  # Another process created it first
+                logger.warning("slack_outbox_journal_unavailable", error=str(e))
+                return False
+        return True
+
+    async def _leave_group(self) -> None:
+        """Drops this consumer once nothing is pending for it (deleting it discards its PEL)."""
+        redis = state.get("redis")
+        if not (redis and self._journaled):
+            return
+        try:
+            if not await redis.xpending_range(
+                self.STREAM_KEY, self.GROUP, "-", "+", 1, consumername=self.consumer
+            ):
+                await redis.xgroup_delconsumer(self.STREAM_KEY, self.GROUP, self.consumer)
+        except Exception as e:
+            logger.warning("slack_outbox_leave_failed", error=str(e))
+
+    async def enqueue(self, text: str, webhook: str = DEFAULT_WEBHOOK) -> None:
+        redis = state.get("redis")
+        if redis and self._journaled:
+            try:
+                await redis.xadd(
+                    self.STREAM_KEY, {"webhook": webhook, "text": text, "at": time.time()}
+                )
+            except Exception as e:
+                logger.warning("slack_outbox_journal_append_failed", error=str(e))
+            else:
+                # Usually reads back our own entry; anything else read is ours to deliver too
+                await self._read_new()
+                return
+        self._push(SlackMessage(webhook, text, time.time()))
+
+    def _push(self, message: SlackMessage) -> None:
+        self._queues.setdefault(message.webhook, deque()).append(message)
+        sender = self._senders.get(message.webhook)
+        if sender is None or sender.done():
+            self._senders[message.webhook] = asyncio.create_task(self._send_loop(message.webhook))
+
+    def _push_entries(self, messages: list) -> int:
+        pushed = 0
+        for entry_id, fields in messages:
+            if not fields:  # Already delivered and trimmed by another consumer
+                continue
+            data = {_decode(k): _decode(v) for k, v in fields.items()}
+            self._push(SlackMessage(data["webhook"], data["text"], float(data["at"]), entry_id))
+            pushed += 1
+        return pushed
+
+    async def _read_new(self) -> int:
+        redis = state.get("redis")
+        try:
+            response = await redis.xreadgroup(
+                self.GROUP,
+                self.consumer,
+                {self.STREAM_KEY: ">"},
+                count=self.batch_max_messages * 10,
+            )
+        except Exception as e:
+            logger.warning("slack_outbox_journal_read_failed", error=str(e))
+            return 0
+        return sum(self._push_entries(messages) for _stream, messages in response or [])
+
+    async def _send_loop(self, webhook: str) -> None:
+        queue = self._queues[webhook]
+        bucket = self._buckets.setdefault(webhook, TokenBucket(self.rate_per_second, 1.0))
+        while queue:
+            await bucket.acquire()
+            # Everything that piled up while we waited for the bucket goes out together
+            batch = [queue.popleft() for _ in range(min(len(queue), self.batch_max_messages))]
+            retry_in = await self._deliver(webhook, batch)
+            if retry_in is not None:
+                await asyncio.sleep(retry_in)
+
+    async def _deliver(self, webhook: str, batch: list[SlackMessage]) -> float | None:
+        """Posts one batch. Returns seconds to wait before retrying, or None when done."""
+        url = self.resolve_webhook(webhook)
+        if not url:
+            await self._finish(batch, outcome="dropped")
+            logger.error("slack_notification_failed", reason="unknown_webhook", webhook=webhook)
+            return None
+
+        payload = {"text": "\n".join(message.text for message in batch)}
+        try:
+            response = await SlackConnector.get_client().post(url, json=payload)
+        except httpx.HTTPError as e:
+            return await self._retry(webhook, batch, reason="network_error", error=str(e))
+        except Exception as e:
+            # Not transport trouble (e.g. an invalid URL): retrying will not help
+            await self._finish(batch, outcome="dropped")
+            logger.error("slack_notification_failed", webhook=webhook, error=str(e))
+            return None
+
+        if response.status_code == 429:
+            SLACK_DELIVERY_EVENTS.labels(outcome="rate_limited").inc(len(batch))
+            return await self._retry(
+                webhook, batch, reason="rate_limited", delay=_retry_after(response)
+            )
+        if response.status_code >= 500:
+            return await self._retry(webhook, batch, reason=f"http_{response.status_code}")
+        if response.is_error:
+            # 4xx other than 429 (revoked webhook, bad payload) will not succeed on retry
+            await self._finish(batch, outcome="dropped")
+            logger.error(
+                "slack_notification_failed", status=response.status_code, messages=len(batch)
+            )
+            return None
+
+        now = time.time()
+        for message in batch:
+            SLACK_DELIVERY_LATENCY.observe((now - message.enqueued_at) * 1000)
+        await self._finish(batch, outcome="delivered")
+        logger.info("slack_notification_sent", status="success", messages=len(batch))
+        return None
+
+    async def _retry(
+        self,
+        webhook: str,
+        batch: list[SlackMessage],
+        reason: str,
+        delay: float | None = None,
+        error: str | None = None,
+    ) -> float:
+        retryable: list[SlackMessage] = []
+        expired: list[SlackMessage] = []
+        for message in batch:
+            message.attempts += 1
+            (retryable if message.attempts < self.max_attempts else expired).append(message)
+        if expired:
+            await self._finish(expired, outcome="dropped")
+            logger.error("slack_notification_failed", reason=reason, dropped=len(expired))
+
+        SLACK_DELIVERY_EVENTS.labels(outcome="retried").inc(len(retryable))
+        # Back at the front, in their original order
+        self._queues[webhook].extendleft(reversed(retryable))
+        attempts = max((message.attempts for message in batch), default=1)
+        delay = delay if delay is not None else min(2.0**attempts, 30.0)
+        logger.warning("slack_delivery_retry", reason=reason, delay=delay, error=error)
+        return delay
+
+    async def _finish(self, batch: list[SlackMessage], outcome: str) -> None:
+        SLACK_DELIVERY_EVENTS.labels(outcome=outcome).inc(len(batch))
+        journal_ids = [message.journal_id for message in batch if message.journal_id]
+        redis = state.get("redis")
+        if not (redis and journal_ids):
+            return
+        try:
+            await redis.xack(self.STREAM_KEY, self.GROUP, *journal_ids)
+            await redis.xdel(self.STREAM_KEY, *journal_ids)
+        except Exception as e:
+            logger.warning("slack_outbox_journal_trim_failed", error=str(e))
+
+    async def recover(self) -> int:
+        """
+        Picks up journaled messages nobody is delivering: entries never read, and entries
+        another consumer has held unacknowledged for longer than the recovery age.
+        Messages this process is still retrying are re-claimed first, so they never look idle.
+        """
+        redis = state.get("redis")
+        if not (redis and self._journaled):
+            return 0
+        own_ids = [
+            message.journal_id
+            for queue in self._queues.values()
+            for message in queue
+            if message.journal_id
+        ]
+        replayed = 0
+        cursor = "0-0"
+        try:
+            if own_ids:
+                await redis.xclaim(
+                    self.STREAM_KEY, self.GROUP, self.consumer, 0, own_ids, justid=True
+                )
+            while True:
+                response = await redis.xautoclaim(
+                    self.STREAM_KEY,
+                    self.GROUP,
+                    self.consumer,
+                    min_idle_time=settings.SLACK_DELIVERY_RECOVERY_AGE_SECONDS * 1000,
+                    start_id=cursor,
+                    count=self.batch_max_messages * 10,
+                )
+                cursor = _decode(response[0])
+                replayed += self._push_entries(response[1])
+                if cursor == "0-0":
+                    break
+        except Exception as e:
+            logger.warning("slack_outbox_recovery_failed", error=str(e))
+        replayed += await self._read_new()
+        if replayed:
+            logger.info("slack_outbox_replayed", entries=replayed)
+        return replayed
+
+    async def _recover_periodically(self) -> None:
+        interval = max(settings.SLACK_DELIVERY_RECOVERY_AGE_SECONDS / 2, 1)
+        while True:
+            await asyncio.sleep(interval)
+            await self.recover()
+
+
+def _retry_after(response: httpx.Response) -> float:
+    try:
+        return max(float(response.headers.get("Retry-After", 1)), 0.0)
+    except ValueError:
+        return 1.0
+
+
+# Process-wide queue; only started where SLACK_DELIVERY_QUEUE_ENABLED is set
+slack_outbox = SlackDeliveryQueue()
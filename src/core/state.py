@@ -1,7 +1,10 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from arq import ArqRedis
 
+if TYPE_CHECKING:
+    from src.agents.brain import CommitVigilBrain
+
 
 class ApplicationState:
     """
@@ -11,6 +14,7 @@ class ApplicationState:
 
     def __init__(self):
         self.redis: ArqRedis | None = None
+        self.brain: CommitVigilBrain | None = None
 
     def __getitem__(self, key: str) -> Any:
         return getattr(self, key, None)
@@ -24,3 +24,7 @@ class LLMProvider(ABC):
         self, response_model: type[T], messages: list[dict[str, Any]], model: str
     ) -> T:
         pass
+
+    async def close(self) -> None:
+        """Release pooled network resources. Providers without sockets need not override."""
+        return None
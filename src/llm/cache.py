@@ -0,0 +1,125 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, cast
+
+from pydantic import BaseModel
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.logging import logger
+from src.core.monitoring import LLM_CACHE_HITS, LLM_CACHE_MISSES
+from src.core.state import state
+from src.llm.base import LLMProvider, T
+
+# Process-wide L1 tier shared by every CachedProvider instance
+response_cache: TTLCache = TTLCache(
+    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    default_ttl=settings.LLM_CACHE_DEFAULT_TTL_SECONDS,
+)
+
+
+@lru_cache(maxsize=128)
+def _schema_fingerprint(response_model: type[BaseModel]) -> str:
+    """Stable digest of a Pydantic schema so prompt-compatible model changes bust the cache."""
+    schema = json.dumps(response_model.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode()).hexdigest()
+
+
+def _normalize_messages(messages: list[dict[str, Any]]) -> list[dict[str, str]]:
+    """Collapse whitespace so cosmetic prompt indentation does not fragment the cache."""
+    return [
+        {"role": str(m.get("role", "")), "content": " ".join(str(m.get("content", "")).split())}
+        for m in messages
+    ]
+
+
+class CachedProvider(LLMProvider):
+    """
+    Content-Addressed Response Cache: Wraps any LLMProvider.
+    Identical (provider, model, response_model, messages) requests are served from an
+    in-process LRU tier first, then from Redis (shared across API and worker processes).
+    """
+
+    REDIS_PREFIX = "llm_cache:"
+
+    def __init__(self, inner: LLMProvider, cache: TTLCache | None = None):
+        self.inner = inner
+        self.local = cache if cache is not None else response_cache
+        # Governor/hedge/breaker wrappers carry the backend's name; keys must not name a wrapper
+        self.provider_name = getattr(inner, "provider_name", type(inner).__name__)
+
+    @property
+    def is_mock(self) -> bool:
+        return self.inner.is_mock
+
+    def _ttl_for(self, response_model: type[BaseModel]) -> int:
+        return settings.LLM_CACHE_MODEL_TTLS.get(
+            response_model.__name__, settings.LLM_CACHE_DEFAULT_TTL_SECONDS
+        )
+
+    def cache_key(
+        self, response_model: type[BaseModel], messages: list[dict[str, Any]], model: str
+    ) -> str:
+        payload = json.dumps(
+            {
+                "provider": self.provider_name,
+                "model": model,
+                "response_model": response_model.__name__,
+                "schema": _schema_fingerprint(response_model),
+                "messages": _normalize_messages(messages),
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def chat_completion(
+        self, response_model: type[T], messages: list[dict[str, Any]], model: str
+    ) -> T:
+        # Raw (unstructured) completions are not content-addressable by schema
+        if response_model is None:
+            return await self.inner.chat_completion(response_model, messages, model)
+
+        model_cls = cast(type[BaseModel], response_model)
+        ttl = self._ttl_for(model_cls)
+        if ttl <= 0:
+            return await self.inner.chat_completion(response_model, messages, model)
+
+        label = model_cls.__name__
+        key = self.cache_key(model_cls, messages, model)
+
+        # 1. L1: In-process (copies protect the cache from downstream mutation)
+        cached = self.local.get(key)
+        if cached is not None:
+            LLM_CACHE_HITS.labels(response_model=label, tier="local").inc()
+            return cast(T, cached.model_copy(deep=True))
+
+        # 2. L2: Redis (shared across processes)
+        redis = state.get("redis")
+        if redis:
+            try:
+                raw = await redis.get(self.REDIS_PREFIX + key)
+                if raw:
+                    result = model_cls.model_validate_json(raw)
+                    self.local.set(key, result, ttl)
+                    LLM_CACHE_HITS.labels(response_model=label, tier="redis").inc()
+                    return cast(T, result.model_copy(deep=True))
+            except Exception as e:
+                logger.warning("llm_cache_lookup_failed", error=str(e))
+
+        # 3. Provider round-trip
+        LLM_CACHE_MISSES.labels(response_model=label).inc()
+        result = cast(BaseModel, await self.inner.chat_completion(response_model, messages, model))
+        if getattr(result, "is_degraded", False):
+            return cast(T, result)  # Heuristic stand-ins must not outlive the provider incident
+
+        self.local.set(key, result.model_copy(deep=True), ttl)
+        if redis:
+            try:
+                await redis.setex(self.REDIS_PREFIX + key, ttl, result.model_dump_json())
+            except Exception as e:
+                logger.warning("llm_cache_population_failed", error=str(e))
+
+        return cast(T, result)
@@ -0,0 +1,183 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+import asyncio
+import time
+from collections import deque
+from typing import Any, cast
+
+from pydantic import BaseModel
+
+from src.core.config import settings
+from src.core.logging import logger
+from src.core.monitoring import LLM_CIRCUIT_STATE, LLM_DEGRADED_RESPONSES
+from src.llm.base import LLMProvider, T
+from src.llm.mock import MockProvider
+from src.schemas.agents import BurnoutDetection, ExcuseAnalysis, RiskAssessment, SafetyAudit
+
+# Analyses that have a deterministic heuristic answer while the provider is unavailable
+DEGRADABLE_MODELS: tuple[type[BaseModel], ...] = (
+    ExcuseAnalysis,
+    BurnoutDetection,
+    RiskAssessment,
+    SafetyAudit,
+)
+
+_STATE_VALUES = {"closed": 0, "open": 1, "half_open": 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised for requests with no degraded fast-path while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Rolling-window breaker: opens when the failure rate (errors + slow calls) over the
+    last `window` calls crosses `failure_rate`, then admits one probe after `recovery_seconds`.
+    """
+
+    def __init__(self, failure_rate: float, min_calls: int, window: int, recovery_seconds: float):
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.recovery_seconds = recovery_seconds
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.state = "closed"
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.recovery_seconds:
+            self.state = "half_open"
+            self._probe_in_flight = False
+        if self.state == "half_open" and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record(self, failed: bool) -> None:
+        if self.state == "half_open":
+            if failed:
+                self.trip()
+            else:
+                self.reset()
+            return
+        if self.state == "open":
+            return  # Stragglers admitted before the trip carry no new information
+
+        self.outcomes.append(failed)
+        if len(self.outcomes) >= self.min_calls:
+            if sum(self.outcomes) / len(self.outcomes) >= self.failure_rate:
+                self.trip()
+
+    def release_probe(self) -> None:
+        """A cancelled probe neither closes nor re-opens the circuit."""
+        self._probe_in_flight = False
+
+    def trip(self) -> None:
+        self.state = "open"
+        self.opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def reset(self) -> None:
+        self.state = "closed"
+        self.outcomes.clear()
+        self._probe_in_flight = False
+
+
+# Process-wide breakers keyed by (provider, model)
+_breakers: dict[tuple[str, str], CircuitBreaker] = {}
+
+
+def get_circuit_breaker(provider_name: str, model: str) -> CircuitBreaker:
+    key = (provider_name, model)
+    breaker = _breakers.get(key)
+    if breaker is None:
+        breaker = _breakers[key] = CircuitBreaker(
+            failure_rate=settings.LLM_CIRCUIT_FAILURE_RATE,
+            min_calls=settings.LLM_CIRCUIT_MIN_CALLS,
+            window=settings.LLM_CIRCUIT_WINDOW,
+            recovery_seconds=settings.LLM_CIRCUIT_RECOVERY_SECONDS,
+        )
+    return breaker
+
+
+_heuristics = MockProvider()
+
+
+def degraded_response(response_model: type[T], messages: list[dict[str, Any]]) -> T | None:
+    """
+    Deterministic fast-path built from the MockProvider heuristics.
+    The SafetyAudit verdict is deliberately conservative: it always routes to human review.
+    """
+    if response_model not in DEGRADABLE_MODELS:
+        return None
+
+    if response_model is SafetyAudit:
+        result: BaseModel = SafetyAudit(
+            is_safe=True,
+            requires_human_review=True,
+            risk_of_morale_damage=0.5,
+            supervisor_confidence=0.0,
+            reasoning="Degraded mode: LLM supervisor unavailable, manual review required.",
+        )
+    else:
+        result = cast(BaseModel, _heuristics.heuristic_completion(response_model, messages))
+
+    result.is_degraded = True  # type: ignore[attr-defined]
+    return cast(T, result)
+
+
+class CircuitBreakerProvider(LLMProvider):
+    """
+    Resilience Layer: Fails fast while a provider is unhealthy instead of burning
+    retries, answering core analyses from heuristics flagged `is_degraded`.
+    """
+
+    def __init__(self, inner: LLMProvider, provider_name: str | None = None):
+        self.inner = inner
+        self.provider_name = provider_name or type(inner).__name__
+
+    @property
+    def is_mock(self) -> bool:
+        return self.inner.is_mock
+
+    async def close(self) -> None:
+        await self.inner.close()
+
+    def _set_state_metric(self, model: str, breaker: CircuitBreaker) -> None:
+        LLM_CIRCUIT_STATE.labels(provider=self.provider_name, model=model).set(
+            _STATE_VALUES[breaker.state]
+        )
+
+    async def chat_completion(
+        self, response_model: type[T], messages: list[dict[str, Any]], model: str
+    ) -> T:
+        breaker = get_circuit_breaker(self.provider_name, model)
+        if not breaker.allow_request():
+            return self._fail_fast(response_model, messages, model)
+
+        started = time.perf_counter()
+        try:
+            result = await self.inner.chat_completion(response_model, messages, model)
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except Exception:
+            breaker.record(failed=True)
+            self._set_state_metric(model, breaker)
+            raise
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        breaker.record(failed=elapsed_ms > settings.LLM_CIRCUIT_SLOW_CALL_MS)
+        self._set_state_metric(model, breaker)
+        return result
+
+    def _fail_fast(self, response_model: type[T], messages: list[dict[str, Any]], model: str) -> T:
+        degraded = degraded_response(response_model, messages)
+        name = getattr(response_model, "__name__", "raw")
+        if degraded is None:
+            raise CircuitOpenError(f"{self.provider_name} circuit open for {model} ({name})")
+
+        logger.warning("llm_degraded_response", provider=self.provider_name, response_model=name)
+        LLM_DEGRADED_RESPONSES.labels(response_model=name).inc()
+        return degraded
@@ -2,7 +2,12 @@
 from src.core.config import settings
 from src.core.logging import logger
 from src.llm.base import LLMProvider
+from src.llm.cache import CachedProvider
+from src.llm.circuit import CircuitBreakerProvider
+from src.llm.governor import GovernedProvider
 from src.llm.groq import GroqProvider
+from src.llm.hedging import HedgedProvider
+from src.llm.http import build_http_client
 from src.llm.mock import MockProvider
 from src.llm.openai import OpenAIProvider
 
@@ -10,29 +15,100 @@ from src.llm.openai import OpenAIProvider
 class LLMFactory:
     """
     Elite LLM Factory with Automatic Key Detection.
+    Providers are process-wide singletons sharing one pooled HTTP client each.
     """
 
+    _instances: dict[tuple[str, str], LLMProvider] = {}
+
     @staticmethod
     def get_provider(provider_name: str | None = None) -> LLMProvider:
+        provider = LLMFactory._resolve_provider(provider_name)
+        # The hermetic mock is already free and instant: no governor, hedge or cache needed
+        if provider.is_mock:
+            return provider
+
+        composed = LLMFactory._govern(provider)
+        if settings.LLM_HEDGE_ENABLED:
+            secondary = LLMFactory._hedge_secondary()
+            if secondary is not None and secondary is not provider:
+                composed = HedgedProvider(composed, LLMFactory._govern(secondary))
+
+        # Breaker wraps the whole (hedged) call so it only trips when no provider can answer
+        if settings.LLM_CIRCUIT_ENABLED:
+            composed = CircuitBreakerProvider(composed, provider_name=type(provider).__name__)
+
+        # Cache is outermost so hits never consume admission quota or trigger hedges
+        if settings.LLM_CACHE_ENABLED:
+            return CachedProvider(composed)
+        return composed
+
+    @staticmethod
+    def _govern(provider: LLMProvider) -> LLMProvider:
+        if settings.LLM_GOVERNOR_ENABLED and not provider.is_mock:
+            return GovernedProvider(provider)
+        return provider
+
+    @staticmethod
+    def _resolve_provider(provider_name: str | None = None) -> LLMProvider:
         # 1. Respect explicit steering if set
         active_provider = provider_name or settings.LLM_PROVIDER
         if active_provider:
             if active_provider == "openai" and settings.OPENAI_API_KEY:
-                return OpenAIProvider(api_key=settings.OPENAI_API_KEY)
+                return LLMFactory._shared("openai", settings.OPENAI_API_KEY)
             if active_provider == "groq" and settings.GROQ_API_KEY:
-                return GroqProvider(api_key=settings.GROQ_API_KEY)
+                return LLMFactory._shared("groq", settings.GROQ_API_KEY)
             if active_provider == "mock":
-                return MockProvider()
+                return LLMFactory._shared("mock")
 
         # 2. Automatic Detection (Heuristic Discovery)
         if settings.OPENAI_API_KEY:
             logger.info("llm_factory_auto_detect", provider="OpenAI")
-            return OpenAIProvider(api_key=settings.OPENAI_API_KEY)
+            return LLMFactory._shared("openai", settings.OPENAI_API_KEY)
 
         if settings.GROQ_API_KEY:
             logger.info("llm_factory_auto_detect", provider="Groq")
-            return GroqProvider(api_key=settings.GROQ_API_KEY)
+            return LLMFactory._shared("groq", settings.GROQ_API_KEY)
 
         # 3. Fallback to Hermetic Mock
         logger.warning("llm_factory_fallback", reason="NO_KEYS_AVAILABLE", mode="MOCK")
-        return MockProvider()
+        return LLMFactory._shared("mock")
+
+    @staticmethod
+    def _hedge_secondary() -> LLMProvider | None:
+        """The provider hedged requests race against, if its credentials are configured."""
+        name = settings.LLM_HEDGE_PROVIDER
+        if name == "groq" and settings.GROQ_API_KEY:
+            return LLMFactory._shared("groq", settings.GROQ_API_KEY)
+        if name == "openai" and settings.OPENAI_API_KEY:
+            return LLMFactory._shared("openai", settings.OPENAI_API_KEY)
+        if name == "mock":
+            return LLMFactory._shared("mock")
+        logger.warning("llm_hedge_secondary_unavailable", provider=name)
+        return None
+
+    @staticmethod
+    def _shared(provider_name: str, api_key: str = "") -> LLMProvider:
+        """Return the process-wide instance, building it (and its HTTP pool) on first use."""
+        key = (provider_name, api_key)
+        provider = LLMFactory._instances.get(key)
+        if provider is None:
+            if provider_name == "openai":
+                provider = OpenAIProvider(api_key=api_key, http_client=build_http_client())
+            elif provider_name == "groq":
+                provider = GroqProvider(api_key=api_key, http_client=build_http_client())
+            else:
+                provider = MockProvider()
+            LLMFactory._instances[key] = provider
+            logger.info("llm_provider_initialized", provider=provider_name)
+        return provider
+
+    @staticmethod
+    async def close_all() -> None:
+        """Close every pooled provider client (app/worker shutdown)."""
+        instances = list(LLMFactory._instances.values())
+        LLMFactory._instances.clear()
+        for provider in instances:
+            try:
+                await provider.close()
+            except Exception as e:
+                logger.warning("llm_provider_close_failed", error=str(e))
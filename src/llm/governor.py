@@ -0,0 +1,140 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+import asyncio
+import time
+from typing import Any
+
+from src.core.config import settings
+from src.core.logging import logger
+from src.core.monitoring import (
+    LLM_ADMISSION_QUEUE_DEPTH,
+    LLM_ADMISSION_WAIT,
+    LLM_CONCURRENCY_LIMIT,
+)
+from src.core.ratelimit import TokenBucket
+from src.llm.base import LLMProvider, T
+
+# Rough chars-per-token ratio and a flat allowance for the structured completion itself
+CHARS_PER_TOKEN = 4
+COMPLETION_TOKEN_ALLOWANCE = 256
+
+
+def estimate_tokens(messages: list[dict[str, Any]]) -> int:
+    """Cheap prompt-size estimate used for tokens-per-minute budgeting."""
+    chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return chars // CHARS_PER_TOKEN + COMPLETION_TOKEN_ALLOWANCE
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Provider SDKs (OpenAI, Groq) expose HTTP status on their API errors."""
+    return getattr(error, "status_code", None) == 429 or "RateLimit" in type(error).__name__
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency window: grows by ~1 slot per window of healthy completions,
+    halves on provider 429s and shrinks gently when latency exceeds the target.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int, latency_target_ms: float):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.latency_target_ms = latency_target_ms
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, latency_ms: float, rate_limited: bool = False) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            if rate_limited:
+                self.limit = max(self.minimum, self.limit * 0.5)
+            elif latency_ms > self.latency_target_ms:
+                self.limit = max(self.minimum, self.limit * 0.9)
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class AdmissionController:
+    """Budgets for a single (provider, model) pair: RPM, TPM and the adaptive window."""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.requests = TokenBucket(rate=rpm / 60.0, capacity=max(1, rpm // 60 or 1))
+        self.tokens = TokenBucket(rate=tpm / 60.0, capacity=tpm / 60.0 * 10)
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial=settings.LLM_INITIAL_CONCURRENCY,
+            minimum=settings.LLM_MIN_CONCURRENCY,
+            maximum=settings.LLM_MAX_CONCURRENCY,
+            latency_target_ms=settings.LLM_LATENCY_TARGET_MS,
+        )
+
+
+# Process-wide budgets: every GovernedProvider for the same provider/model shares them
+_controllers: dict[tuple[str, str], AdmissionController] = {}
+
+
+def get_admission_controller(provider_name: str, model: str) -> AdmissionController:
+    key = (provider_name, model)
+    controller = _controllers.get(key)
+    if controller is None:
+        budget = settings.LLM_MODEL_BUDGETS.get(model, {})
+        controller = AdmissionController(
+            rpm=budget.get("rpm", settings.LLM_RPM_LIMIT),
+            tpm=budget.get("tpm", settings.LLM_TPM_LIMIT),
+        )
+        _controllers[key] = controller
+    return controller
+
+
+class GovernedProvider(LLMProvider):
+    """
+    Admission Control Layer: Wraps any LLMProvider with RPM/TPM token buckets and an
+    AIMD concurrency window so bursts queue locally instead of tripping provider 429s.
+    """
+
+    def __init__(self, inner: LLMProvider):
+        self.inner = inner
+        self.provider_name = type(inner).__name__
+
+    @property
+    def is_mock(self) -> bool:
+        return self.inner.is_mock
+
+    async def close(self) -> None:
+        await self.inner.close()
+
+    async def chat_completion(
+        self, response_model: type[T], messages: list[dict[str, Any]], model: str
+    ) -> T:
+        controller = get_admission_controller(self.provider_name, model)
+        labels = {"provider": self.provider_name, "model": model}
+
+        queue_started = time.perf_counter()
+        LLM_ADMISSION_QUEUE_DEPTH.labels(**labels).inc()
+        try:
+            await controller.requests.acquire(1)
+            await controller.tokens.acquire(estimate_tokens(messages))
+            await controller.limiter.acquire()
+        finally:
+            LLM_ADMISSION_QUEUE_DEPTH.labels(**labels).dec()
+        LLM_ADMISSION_WAIT.labels(**labels).observe((time.perf_counter() - queue_started) * 1000)
+
+        call_started = time.perf_counter()
+        rate_limited = False
+        try:
+            return await self.inner.chat_completion(response_model, messages, model)
+        except Exception as e:
+            rate_limited = is_rate_limited(e)
+            if rate_limited:
+                logger.warning("llm_rate_limited", provider=self.provider_name, model=model)
+            raise
+        finally:
+            await controller.limiter.release(
+                (time.perf_counter() - call_started) * 1000, rate_limited=rate_limited
+            )
+            LLM_CONCURRENCY_LIMIT.labels(**labels).set(controller.limiter.limit)
@@ -1,20 +1,24 @@
 # Copyright (c) 2026 CommitVigil AI. All rights reserved.
 from typing import Any
 
+import httpx
 import instructor
 from groq import AsyncGroq
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from src.core.config import settings
+from src.core.deadline import stage_budget, stop_on_deadline
 from src.llm.base import LLMProvider, T
 
 
 class GroqProvider(LLMProvider):
     client: Any | None
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: httpx.AsyncClient | None = None):
+        self.http_client = http_client
         if api_key and api_key != "MOCK":
             self.client = instructor.from_groq(
-                AsyncGroq(api_key=api_key), mode=instructor.Mode.JSON
+                AsyncGroq(api_key=api_key, http_client=http_client), mode=instructor.Mode.JSON
             )
         else:
             # Handle the case where api_key is empty or "MOCK"
@@ -30,8 +34,12 @@ class GroqProvider(LLMProvider):
     def is_mock(self) -> bool:
         return self.client is None
 
+    async def close(self) -> None:
+        if self.http_client and not self.http_client.is_closed:
+            await self.http_client.aclose()
+
     @retry(
-        stop=stop_after_attempt(3),
+        stop=stop_after_attempt(3) | stop_on_deadline(),
         wait=wait_exponential(multiplier=1, min=1, max=10),
         retry=retry_if_exception_type((TimeoutError, ConnectionError)),
         reraise=True,
@@ -48,4 +56,5 @@ class GroqProvider(LLMProvider):
             model=model,
             response_model=response_model,
             messages=messages,  # type: ignore[arg-type]
+            timeout=stage_budget(settings.LLM_HTTP_TIMEOUT_SECONDS),
         )
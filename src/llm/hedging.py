@@ -0,0 +1,111 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+from src.core.config import settings
+from src.core.logging import logger
+from src.core.monitoring import LLM_HEDGE_EVENTS
+from src.llm.base import LLMProvider, T
+
+# Below this many observations the configured default delay is used instead of the percentile
+MIN_LATENCY_SAMPLES = 20
+LATENCY_WINDOW = 500
+
+# Process-wide primary latency windows, keyed by (provider, model)
+_latency_windows: dict[tuple[str, str], deque[float]] = {}
+
+
+def _window(provider_name: str, model: str) -> deque[float]:
+    key = (provider_name, model)
+    window = _latency_windows.get(key)
+    if window is None:
+        window = _latency_windows[key] = deque(maxlen=LATENCY_WINDOW)
+    return window
+
+
+class HedgedProvider(LLMProvider):
+    """
+    Tail-Latency Hedging: issues the request to the primary provider and, if it has not
+    answered within its observed latency percentile, fires the same structured request at
+    the secondary. Whichever finishes first wins; the loser is cancelled.
+    """
+
+    def __init__(
+        self,
+        primary: LLMProvider,
+        secondary: LLMProvider,
+        secondary_model: str | None = None,
+        percentile: float | None = None,
+        default_delay_ms: float | None = None,
+    ):
+        self.primary = primary
+        self.secondary = secondary
+        self.secondary_model = secondary_model or settings.LLM_HEDGE_MODEL
+        self.percentile = percentile or settings.LLM_HEDGE_PERCENTILE
+        self.default_delay_ms = default_delay_ms or settings.LLM_HEDGE_DEFAULT_DELAY_MS
+        self.provider_name = getattr(primary, "provider_name", type(primary).__name__)
+
+    @property
+    def is_mock(self) -> bool:
+        return self.primary.is_mock
+
+    async def close(self) -> None:
+        await self.primary.close()
+        await self.secondary.close()
+
+    def hedge_delay(self, model: str) -> float:
+        """Seconds to wait on the primary before hedging (observed percentile latency)."""
+        samples = _window(self.provider_name, model)
+        if len(samples) < MIN_LATENCY_SAMPLES:
+            return self.default_delay_ms / 1000
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return ordered[index] / 1000
+
+    async def _timed_primary(
+        self, response_model: type[T], messages: list[dict[str, Any]], model: str
+    ) -> T:
+        started = time.perf_counter()
+        try:
+            return await self.primary.chat_completion(response_model, messages, model)
+        finally:
+            # Cancelled primaries record a lower bound so slow spells still raise the percentile
+            _window(self.provider_name, model).append((time.perf_counter() - started) * 1000)
+
+    async def chat_completion(
+        self, response_model: type[T], messages: list[dict[str, Any]], model: str
+    ) -> T:
+        primary = asyncio.create_task(self._timed_primary(response_model, messages, model))
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay(model))
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done and primary.exception() is None:
+            LLM_HEDGE_EVENTS.labels(outcome="not_hedged").inc()
+            return primary.result()
+
+        # Either the primary is slow or it already failed: the secondary races (or takes over)
+        logger.info("llm_request_hedged", provider=self.provider_name, model=model)
+        secondary = asyncio.create_task(
+            self.secondary.chat_completion(response_model, messages, self.secondary_model)
+        )
+        return await self._first_success(primary, secondary)
+
+    async def _first_success(self, primary: asyncio.Task[T], secondary: asyncio.Task[T]) -> T:
+        pending: set[asyncio.Task[T]] = {primary, secondary}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = "primary_won" if task is primary else "secondary_won"
+                        LLM_HEDGE_EVENTS.labels(outcome=winner).inc()
+                        return task.result()
+            LLM_HEDGE_EVENTS.labels(outcome="both_failed").inc()
+            raise primary.exception()  # type: ignore[misc]
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,26 @@
+# Copyright (c) 2026 CommitVigil AI. All rights reserved.
+import httpx
+
+from src.core.config import settings
+from src.core.logging import logger
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """
+    Shared connection pool for an LLM provider SDK client.
+    Keep-alive connections remove repeated TLS handshakes from every evaluation.
+    """
+    limits = httpx.Limits(
+        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    timeout = httpx.Timeout(settings.LLM_HTTP_TIMEOUT_SECONDS)
+
+    if settings.LLM_HTTP2_ENABLED:
+        try:
+            return httpx.AsyncClient(limits=limits, timeout=timeout, http2=True)
+        except ImportError:
+            logger.warning("llm_http2_unavailable", reason="h2_not_installed", fallback="http/1.1")
+
+    return httpx.AsyncClient(limits=limits, timeout=timeout)
@@ -1,4 +1,6 @@
 # Copyright (c) 2026 CommitVigil AI. All rights reserved.
+import asyncio
+from collections.abc import Callable
 from typing import Any, TypeVar, cast
 
 from pydantic import BaseModel
@@ -11,6 +13,7 @@ from src.schemas.agents import (
     ExcuseAnalysis,
     ExcuseCategory,
     ExtractedCommitment,
+    FusedAnalysis,
     RiskAssessment,
     RiskLevel,
     SafetyAudit,
@@ -26,8 +29,12 @@ class MockProvider(LLMProvider):
     """
     Elite Level Hermetic Mock Provider.
     Simulates LLM responses with basic heuristics to enable offline testing/demo.
+    `latency_sampler` (seconds per call) injects a latency distribution for load tests.
     """
 
+    def __init__(self, latency_sampler: Callable[[], float] | None = None):
+        self.latency_sampler = latency_sampler
+
     @property
     def is_mock(self) -> bool:
         return True
@@ -53,6 +60,14 @@ class MockProvider(LLMProvider):
             recommendation="Suggest time off" if is_risk else "Continues monitoring",
         )
 
+    def _handle_risk_heuristics(self) -> RiskAssessment:
+        return RiskAssessment(
+            risk_score=0.75,
+            level=RiskLevel.HIGH,
+            predicted_latency_days=3,
+            mitigation_strategy="Mock: Suggest immediate PM intervention.",
+        )
+
     def _handle_decision_heuristics(self, user_content: str, system_content: str) -> AgentDecision:
         import re
 
@@ -91,22 +106,28 @@ class MockProvider(LLMProvider):
             analysis_summary=f"Mock Decision (Rel={reliability}, Strict={consecutive_strict}, Burnout={is_burnout})",
         )
 
-    def _dispatch_model(self, response_model: type[T], user_content: str, system_content: str) -> T:
-        """Central dispatcher for mock heuristics to satisfy complexity constraints."""
+    def _dispatch_analysis(self, response_model: type[T], user_content: str) -> T:
+        """Check-in analysis heuristics, individually or fused into a single response."""
         if response_model is ExcuseAnalysis:
             return cast(T, self._handle_excuse_heuristics(user_content))
         if response_model is RiskAssessment:
-            return cast(
-                T,
-                RiskAssessment(
-                    risk_score=0.75,
-                    level=RiskLevel.HIGH,
-                    predicted_latency_days=3,
-                    mitigation_strategy="Mock: Suggest immediate PM intervention.",
-                ),
-            )
+            return cast(T, self._handle_risk_heuristics())
         if response_model is BurnoutDetection:
             return cast(T, self._handle_burnout_heuristics(user_content))
+        return cast(
+            T,
+            FusedAnalysis(
+                excuse=self._handle_excuse_heuristics(user_content),
+                burnout=self._handle_burnout_heuristics(user_content),
+                risk=self._handle_risk_heuristics(),
+                language="en",
+            ),
+        )
+
+    def _dispatch_model(self, response_model: type[T], user_content: str, system_content: str) -> T:
+        """Central dispatcher for mock heuristics to satisfy complexity constraints."""
+        if response_model in (ExcuseAnalysis, RiskAssessment, BurnoutDetection, FusedAnalysis):
+            return self._dispatch_analysis(response_model, user_content)
         if response_model is ExtractedCommitment:
             return cast(
                 T,
@@ -166,7 +187,12 @@ class MockProvider(LLMProvider):
         self, response_model: type[T], messages: list[dict[str, str]], model: str
     ) -> T:
         logger.warning("llm_mock_completion_triggered", provider="Mock", model=model)
+        if self.latency_sampler:
+            await asyncio.sleep(self.latency_sampler())
+        return self.heuristic_completion(response_model, messages)
 
+    def heuristic_completion(self, response_model: type[T], messages: list[dict[str, str]]) -> T:
+        """Synchronous, deterministic heuristics (also the circuit breaker's degraded fast-path)."""
         user_content = next(
             (m["content"] for m in reversed(messages) if m["role"] == "user"), ""
         ).lower()
@@ -1,23 +1,31 @@
 # Copyright (c) 2026 CommitVigil AI. All rights reserved.
 from typing import Any, cast
 
+import httpx
 import instructor
 from openai import AsyncOpenAI
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from src.core.config import settings
+from src.core.deadline import stage_budget, stop_on_deadline
 from src.llm.base import LLMProvider, T
 
 
 class OpenAIProvider(LLMProvider):
-    def __init__(self, api_key: str):
-        self.client = instructor.from_openai(AsyncOpenAI(api_key=api_key))
+    def __init__(self, api_key: str, http_client: httpx.AsyncClient | None = None):
+        self.http_client = http_client
+        self.client = instructor.from_openai(AsyncOpenAI(api_key=api_key, http_client=http_client))
 
     @property
     def is_mock(self) -> bool:
         return False
 
+    async def close(self) -> None:
+        if self.http_client and not self.http_client.is_closed:
+            await self.http_client.aclose()
+
     @retry(
-        stop=stop_after_attempt(3),
+        stop=stop_after_attempt(3) | stop_on_deadline(),
         wait=wait_exponential(multiplier=1, min=1, max=10),
         retry=retry_if_exception_type((TimeoutError, ConnectionError)),
         reraise=True,
@@ -26,5 +34,8 @@ class OpenAIProvider(LLMProvider):
         self, response_model: type[T], messages: list[dict[str, Any]], model: str
     ) -> T:
         return await self.client.chat.completions.create(
-            model=model, response_model=response_model, messages=cast(Any, messages)
+            model=model,
+            response_model=response_model,
+            messages=cast(Any, messages),
+            timeout=stage_budget(settings.LLM_HTTP_TIMEOUT_SECONDS),
         )
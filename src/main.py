@@ -16,10 +16,11 @@ from starlette.responses import Response
 from src.api.deps import get_api_key
 from src.api.v1.router import api_router
 from src.core.config import settings
-from src.core.database import engine, init_db
+from src.core.database import engine, init_db, reference_invalidation
 from src.core.logging import logger, setup_logging
 from src.core.slack import SlackConnector
 from src.core.state import state
+from src.llm.factory import LLMFactory
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -67,6 +68,8 @@ async def lifespan(fastapi_app: FastAPI):  # noqa: ARG001
         state["redis"] = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
         await FastAPILimiter.init(state["redis"])
         logger.info("redis_connected", url=settings.REDIS_URL)
+        # Keep this process's rule/persona L1 coherent with writes from any process
+        reference_invalidation.start()
 
     except Exception as e:
         logger.warning("redis_connection_failed", error=str(e), mode="local_dev")
@@ -75,10 +78,13 @@ async def lifespan(fastapi_app: FastAPI):  # noqa: ARG001
     yield
 
     # Cleanup
+    state["brain"] = None  # Its pooled providers are closed below
+    await reference_invalidation.stop()
     if state["redis"]:
         await state["redis"].close()
 
     await SlackConnector.close()
+    await LLMFactory.close_all()
     logger.info("application_shutdown", status="cleaning_up")
 
 
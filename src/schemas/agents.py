@@ -5,6 +5,7 @@ from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel
+from pydantic.json_schema import SkipJsonSchema
 from sqlalchemy import JSON, Column
 from sqlmodel import Field, SQLModel
 
@@ -19,6 +20,8 @@ class ExcuseAnalysis(BaseModel):
     category: ExcuseCategory
     confidence_score: float = Field(..., ge=0, le=1)
     reasoning: str = Field(..., description="The logic behind the classification.")
+    # Set by the circuit breaker's heuristic fast-path; hidden from the LLM-facing schema
+    is_degraded: SkipJsonSchema[bool] = False
 
 
 class RiskLevel(str, Enum):
@@ -33,12 +36,27 @@ class RiskAssessment(BaseModel):
     level: RiskLevel
     predicted_latency_days: int = Field(..., description="Estimated delay in completion.")
     mitigation_strategy: str
+    is_degraded: SkipJsonSchema[bool] = False
 
 
 class BurnoutDetection(BaseModel):
     is_at_risk: bool
     sentiment_indicators: list[str]
     recommendation: str
+    is_degraded: SkipJsonSchema[bool] = False
+
+
+class FusedAnalysis(BaseModel):
+    """
+    Single-call analysis bundle: excuse, burnout, risk and language in one structured response.
+    """
+
+    excuse: ExcuseAnalysis
+    burnout: BurnoutDetection
+    risk: RiskAssessment
+    language: str | None = Field(
+        default=None, description="2-letter ISO code of the check-in language (e.g., 'en')."
+    )
 
 
 class ToneType(str, Enum):
@@ -69,6 +87,7 @@ class SafetyAudit(BaseModel):
     suggested_correction: str | None = None
     correction_type: str = Field(default="none", description="'none', 'surgical', 'full_rewrite'")
     reasoning: str
+    is_degraded: SkipJsonSchema[bool] = False
 
 
 class SafetyIntervention(BaseModel):
@@ -248,3 +267,17 @@ class CulturalPersona(SQLModel, table=True):
     source: str = Field(default="auto_generated")  # "system" or "auto_generated"
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
+
+
+class ReliabilityJournalEntry(SQLModel, table=True):
+    """
+    Write-Behind Ledger: Redis journal entries already applied to user_history,
+    recorded in the same transaction so a redelivered entry is never counted twice.
+    """
+
+    __tablename__ = "reliability_journal_applied"
+
+    entry_id: str = Field(primary_key=True)
+    applied_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC).replace(tzinfo=None), index=True
+    )
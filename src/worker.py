@@ -1,93 +1,92 @@
 # Copyright (c) 2026 CommitVigil AI. All rights reserved.
-from datetime import UTC, datetime, timedelta
+import asyncio
 from typing import ClassVar
 
-from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from arq import func
 from arq.connections import RedisSettings
 
 from src.agents.brain import CommitVigilBrain
+from src.core.batching import MicroBatcher
 from src.core.config import settings
-from src.core.database import get_user_reliability, init_db, update_user_reliability
+from src.core.database import (
+    init_db,
+    load_user_context,
+    load_user_contexts,
+    reference_invalidation,
+    reliability_buffer,
+    reliability_snapshot,
+    resolve_safety_rules,
+    update_user_reliability,
+    update_user_reliability_many,
+)
+from src.core.followups import drain_follow_ups, migrate_legacy_follow_ups, request_follow_up
+from src.core.jobs import publish_job_done
 from src.core.logging import logger, setup_logging
-from src.core.slack import SlackConnector
-from src.schemas.agents import ExcuseCategory, RiskLevel
+from src.core.slack import SlackConnector, slack_outbox
+from src.core.state import state
+from src.llm.factory import LLMFactory
+from src.schemas.agents import ExcuseCategory, PipelineEvaluation, RiskLevel, UserHistory
 
 # Initialize Logging for the Worker
 setup_logging()
 
-# Configure Job Store
-# APScheduler requires a sync connection string for SQLAlchemyJobStore
-job_stores = {"default": SQLAlchemyJobStore(url=settings.SYNC_DATABASE_URL)}
 
-# Initialize a persistent scheduler
-scheduler = AsyncIOScheduler(jobstores=job_stores)
-
-
-async def send_follow_up(user_id: str, message: str, slack_id: str | None = None):
+async def send_follow_up(_ctx: dict, user_id: str, message: str, slack_id: str | None = None):
     """
     Dedicated background task to handle push or chat-based notifications.
-    Now sends REAL notifications to Slack.
+    Runs as a deferred ARQ job and sends REAL notifications to Slack.
     """
     logger.info("scheduled_follow_up_triggered", user_id=user_id, message=message)
     await SlackConnector.send_notification(message, slack_id=slack_id)
 
 
+async def send_coalesced_follow_up(_ctx: dict, user_id: str):
+    """
+    Per-user follow-up job (coalescing mode): sends everything queued for the user
+    since it was scheduled, as one digest when digest mode is on.
+    """
+    for message, slack_id in await drain_follow_ups(user_id):
+        logger.info("scheduled_follow_up_triggered", user_id=user_id, message=message)
+        await SlackConnector.send_notification(message, slack_id=slack_id)
+
+
 async def process_commitment_eval(
-    _ctx: dict, user_id: str, commitment: str, check_in: str, industry: str = "generic"
+    ctx: dict, user_id: str, commitment: str, check_in: str, industry: str = "generic"
 ):
     """
     The Main Agentic Pipeline.
     Runs behavioral analysis and schedules accountability follow-ups.
+    With micro-batching on, the job joins the worker's current evaluation batch.
     """
+    batcher = ctx.get("batcher")
+    if batcher is not None:
+        return await batcher.submit(
+            {
+                "user_id": user_id,
+                "commitment": commitment,
+                "check_in": check_in,
+                "industry": industry,
+            }
+        )
+
     logger.info("processing_commitment_eval_start", user_id=user_id)
 
     try:
-        brain = CommitVigilBrain()
+        # Built once per worker process in `startup`; ad-hoc callers get a fresh one
+        brain = ctx.get("brain") or CommitVigilBrain()
 
-        # 1. Fetch Historical Reliability & Ethical Tracking status
-        reliability, slack_id, consecutive_firm = await get_user_reliability(user_id)
+        # 1. Fetch Historical Reliability & Ethical Tracking status (one read, shared below)
+        user_history = await load_user_context(user_id)
 
         # 2. Executing the Orchestrated Pipeline (The Brain)
-        evaluation = await brain.evaluate_participation(
-            user_id=user_id,
-            check_in=check_in,
-            reliability_score=reliability,
-            consecutive_firm=consecutive_firm,
-            industry=industry,
-        )
-
-        decision = evaluation.decision
-        risk = evaluation.risk
-
-        logger.info(
-            "agent_pipeline_completed",
-            user_id=user_id,
-            action=decision.action,
-            tone=decision.tone,
-            final_message_preview=decision.message[:50] + "...",
-        )
+        evaluation = await _evaluate(brain, user_id, check_in, industry, user_history)
 
         # 3. Persist results for Heatmap tracking & Ethical Cooling-off state
-        is_failure = evaluation.excuse.category != ExcuseCategory.LEGITIMATE
-        await update_user_reliability(user_id, was_failure=is_failure, tone_used=decision.tone)
+        is_failure, tone_used = _reliability_outcome(evaluation)
+        await update_user_reliability(user_id, was_failure=is_failure, tone_used=tone_used)
 
         # 4. Accountability Logic: Proactive Follow-up
-        # Triggered based on calculated risk thresholds
-        if risk.level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
-            run_time = datetime.now(UTC) + timedelta(seconds=settings.FOLLOW_UP_DELAY_SECONDS)
-            scheduler.add_job(
-                send_follow_up,
-                "date",
-                run_date=run_time,
-                args=[
-                    user_id,
-                    f"🔔 *CommitVigil Alert:* Checking in on commitment: {commitment}",
-                    slack_id,
-                ],
-            )
-
-            logger.info("follow_up_scheduled", user_id=user_id, time=run_time.isoformat())
+        await _schedule_follow_up(user_id, commitment, evaluation, user_history)
 
         logger.info("processing_commitment_eval_success", user_id=user_id)
 
@@ -99,22 +98,190 @@ async def process_commitment_eval(
     return evaluation
 
 
-async def startup(_ctx):
+async def process_commitment_batch(ctx: dict, evaluations: list[dict]):
+    """
+    Batch job variant: evaluates many commitments (e.g. a whole stand-up) in one job.
+    Each entry carries the `process_commitment_eval` arguments; failed entries yield None.
+    """
+    brain = ctx.get("brain") or CommitVigilBrain()
+    results = await run_evaluation_batch(brain, evaluations)
+    return [None if isinstance(result, BaseException) else result for result in results]
+
+
+async def run_evaluation_batch(brain: CommitVigilBrain, requests: list[dict]) -> list:
+    """
+    Evaluates a batch of commitments: one IN query for every user's history, persona
+    and safety-rule lookups shared per language/industry group, one bulk reliability
+    write. Returns one PipelineEvaluation (or the raised exception) per request.
+    """
+    logger.info("processing_commitment_batch_start", size=len(requests))
+    histories = await load_user_contexts([request["user_id"] for request in requests])
+    await _prefetch_reference_data(brain, requests, histories)
+
+    async def evaluate(request: dict) -> PipelineEvaluation:
+        return await _evaluate(
+            brain,
+            request["user_id"],
+            request["check_in"],
+            request.get("industry", "generic"),
+            histories.get(request["user_id"]),
+        )
+
+    results = await asyncio.gather(*(evaluate(r) for r in requests), return_exceptions=True)
+
+    completed = [
+        (request, result)
+        for request, result in zip(requests, results, strict=True)
+        if not isinstance(result, BaseException)
+    ]
+    for request, result in zip(requests, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error("worker_task_failed", user_id=request["user_id"], error=str(result))
+
+    # Completed evaluations are never failed (and so retried) over a post-step error:
+    # a retry would re-run the LLM pipeline and count the outcome twice
+    await _record_outcomes(
+        [(request["user_id"], *_reliability_outcome(result)) for request, result in completed]
+    )
+    for request, result in completed:
+        try:
+            await _schedule_follow_up(
+                request["user_id"], request["commitment"], result, histories.get(request["user_id"])
+            )
+        except Exception as e:
+            logger.error("follow_up_schedule_failed", user_id=request["user_id"], error=str(e))
+
+    logger.info("processing_commitment_batch_success", size=len(requests), ok=len(completed))
+    return results
+
+
+async def _record_outcomes(outcomes: list[tuple[str, bool, str]]) -> None:
+    """One bulk reliability write; if it fails, each outcome is retried on its own."""
+    try:
+        await update_user_reliability_many(outcomes)
+        return
+    except Exception as e:
+        logger.error("reliability_bulk_update_failed", outcomes=len(outcomes), error=str(e))
+    for user_id, was_failure, tone_used in outcomes:
+        try:
+            await update_user_reliability(user_id, was_failure=was_failure, tone_used=tone_used)
+        except Exception as e:
+            logger.error("reliability_update_failed", user_id=user_id, error=str(e))
+
+
+async def _prefetch_reference_data(
+    brain: CommitVigilBrain, requests: list[dict], histories: dict[str, UserHistory]
+) -> None:
+    """Warms the persona and safety-rule caches once per language/rule-scope group."""
+    languages = {brain.detect_language_locally(request["check_in"]) for request in requests}
+    scopes = {
+        CommitVigilBrain.known_rule_scope(
+            request.get("industry", "generic"), histories.get(request["user_id"])
+        )
+        for request in requests
+    }
+    lookups = [brain.get_or_create_persona(lang) for lang in languages if lang]
+    # AUTO scopes are only known after context sensing; those resolve on their own path
+    lookups += [resolve_safety_rules(*scope) for scope in scopes if scope]
+    for outcome in await asyncio.gather(*lookups, return_exceptions=True):
+        if isinstance(outcome, Exception):
+            # Each evaluation repeats the lookup on its own path, so this is only a warm-up
+            logger.warning("batch_prefetch_failed", error=str(outcome))
+
+
+async def _evaluate(
+    brain: CommitVigilBrain,
+    user_id: str,
+    check_in: str,
+    industry: str,
+    user_history: UserHistory | None,
+) -> PipelineEvaluation:
+    reliability, _slack_id, consecutive_firm = reliability_snapshot(user_history)
+    evaluation = await brain.evaluate_participation(
+        user_id=user_id,
+        check_in=check_in,
+        reliability_score=reliability,
+        consecutive_firm=consecutive_firm,
+        industry=industry,
+        user_history=user_history,
+    )
+    decision = evaluation.decision
+    logger.info(
+        "agent_pipeline_completed",
+        user_id=user_id,
+        action=decision.action,
+        tone=decision.tone,
+        final_message_preview=decision.message[:50] + "...",
+    )
+    return evaluation
+
+
+def _reliability_outcome(evaluation: PipelineEvaluation) -> tuple[bool, str]:
+    """(was_failure, tone_used) as recorded in the user's reliability history."""
+    is_failure = evaluation.excuse.category != ExcuseCategory.LEGITIMATE
+    return is_failure, evaluation.decision.tone
+
+
+async def _schedule_follow_up(
+    user_id: str,
+    commitment: str,
+    evaluation: PipelineEvaluation,
+    user_history: UserHistory | None,
+) -> None:
+    # Triggered based on calculated risk thresholds
+    if evaluation.risk.level not in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
+        return
+    _reliability, slack_id, _consecutive_firm = reliability_snapshot(user_history)
+    await request_follow_up(user_id, commitment, slack_id)
+
+
+async def startup(ctx):
     """
     Worker lifecycle management: Initialization.
     """
-    logger.info("worker_startup", status="starting_sidecar_scheduler")
+    logger.info("worker_startup", status="initializing_resources")
+    # Share ARQ's pool so DB and LLM caches use Redis inside workers too
+    state["redis"] = ctx.get("redis")
+    reference_invalidation.start()
     await init_db()
-    scheduler.start()
+    if settings.FOLLOW_UP_MIGRATE_LEGACY_JOBS:
+        await migrate_legacy_follow_ups()
+    if settings.RELIABILITY_WRITE_BEHIND_ENABLED:
+        await reliability_buffer.start()
+    # One brain (scout, supervisor, pooled LLM providers) and Slack pool per process
+    brain = ctx["brain"] = CommitVigilBrain()
+    SlackConnector.get_client()
+    if settings.SLACK_DELIVERY_QUEUE_ENABLED:
+        await slack_outbox.start()
+    if settings.EVALUATION_BATCH_ENABLED:
+        ctx["batcher"] = MicroBatcher(
+            lambda requests: run_evaluation_batch(brain, requests),
+            max_size=settings.EVALUATION_BATCH_MAX_SIZE,
+            max_wait_ms=settings.EVALUATION_BATCH_MAX_WAIT_MS,
+            name="evaluation",
+        )
 
 
-async def shutdown(_ctx):
+async def shutdown(ctx):
     """
     Worker lifecycle management: Graceful shutdown.
     """
-    logger.info("worker_shutdown", status="stopping_scheduler")
-    scheduler.shutdown()
+    logger.info("worker_shutdown", status="releasing_resources")
+    batcher = ctx.pop("batcher", None)
+    if batcher is not None:
+        await batcher.close()
+    ctx.pop("brain", None)
+    # Drain buffered reliability deltas before the process exits
+    await reliability_buffer.stop()
+    await reference_invalidation.stop()
+    await slack_outbox.stop()
     await SlackConnector.close()
+    await LLMFactory.close_all()
+
+
+async def after_job_end(ctx):
+    """Wakes API long-polls and SSE streams waiting on this job (result already stored)."""
+    await publish_job_done(ctx["redis"], ctx["job_id"])
 
 
 class WorkerSettings:
@@ -122,7 +289,18 @@ class WorkerSettings:
     ARQ specific configuration for the background worker process.
     """
 
-    functions: ClassVar[list] = [process_commitment_eval]
+    functions: ClassVar[list] = [
+        # Evaluation results double as the replay cache for retried /evaluate submissions
+        func(process_commitment_eval, keep_result=settings.EVALUATION_RESULT_TTL_SECONDS),
+        process_commitment_batch,
+        send_follow_up,
+        send_coalesced_follow_up,
+    ]
+    # Batching needs at least a full batch of jobs in flight at once
+    max_jobs = (
+        max(10, settings.EVALUATION_BATCH_MAX_SIZE) if settings.EVALUATION_BATCH_ENABLED else 10
+    )
     on_startup = startup
     on_shutdown = shutdown
+    after_job_end = after_job_end
     redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
@@ -92,6 +92,8 @@ async def setup_test_db():
         autoflush=False,
     )
     database.AsyncSessionLocal = new_session_local
+    database.user_context_cache.clear()
+    database.reference_cache.clear()
 
     if "src.agents.learning" in sys.modules:
         import src.agents.learning
@@ -130,3 +132,63 @@ async def setup_test_db():
             os.remove("test_commitvigil.db")
         except PermissionError:
             pass
+
+
+class FakeStreamRedis:
+    """One Redis stream with a single consumer group, in memory."""
+
+    def __init__(self):
+        self.entries: dict[str, dict] = {}
+        self.delivered: list[str] = []  # Entries handed out via ">", in order
+        self.pel: dict[str, str] = {}  # entry id -> consumer
+        self.group = False
+        self.sequence = 0
+
+    async def xgroup_create(self, _name, _group, **_options):
+        if self.group:
+            raise RuntimeError("BUSYGROUP Consumer Group name already exists")
+        self.group = True
+
+    async def xadd(self, _name, fields):
+        self.sequence += 1
+        entry_id = f"1-{self.sequence}"
+        self.entries[entry_id] = {k: str(v) for k, v in fields.items()}
+        return entry_id
+
+    async def xreadgroup(self, _group, consumer, streams, count=None):
+        ((name, start),) = streams.items()
+        if start == ">":
+            ids = [i for i in self.entries if i not in self.delivered][:count]
+            self.delivered.extend(ids)
+            self.pel.update(dict.fromkeys(ids, consumer))
+        else:
+            ids = [i for i, owner in self.pel.items() if owner == consumer][:count]
+        return [[name, [(i, self.entries.get(i)) for i in ids]]] if ids else []
+
+    async def xautoclaim(self, _name, _group, consumer, min_idle_time, start_id, count):  # noqa: ARG002
+        ids = [i for i, owner in self.pel.items() if owner != consumer][:count]
+        self.pel.update(dict.fromkeys(ids, consumer))
+        return ["0-0", [(i, self.entries.get(i)) for i in ids]]
+
+    async def xclaim(self, _name, _group, consumer, _min_idle_time, ids, **_options):
+        self.pel.update({i: consumer for i in ids if i in self.pel})
+        return ids
+
+    async def xack(self, _name, _group, *ids):
+        for entry_id in ids:
+            self.pel.pop(entry_id, None)
+
+    async def xdel(self, _name, *ids):
+        for entry_id in ids:
+            self.entries.pop(entry_id, None)
+
+    async def xpending_range(self, _name, _group, _min, _max, _count, consumername=None):
+        return [i for i, owner in self.pel.items() if owner == consumername]
+
+    async def xgroup_delconsumer(self, _name, _group, _consumer):
+        return 0
+
+
+@pytest.fixture
+def stream_redis():
+    return FakeStreamRedis()
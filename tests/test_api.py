@@ -3,8 +3,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
-from src.api.deps import get_redis
+from src.api.deps import get_brain, get_redis
 from src.core.config import settings
+from src.core.state import state
 from src.main import app
 from src.schemas.agents import UserHistory
 
@@ -296,3 +297,9 @@ def test_metrics_protection():
     assert response.status_code == 200
     # Prometheus format usually starts with # HELP
     assert b"# HELP" in response.content
+
+
+def test_sync_brain_is_built_once_per_process():
+    with patch.object(state, "brain", None):
+        brain = get_brain()
+        assert get_brain() is brain
@@ -0,0 +1,113 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.agents import safety
+from src.agents.safety import SafetySupervisor
+from src.core.constants import HR_BLOCK_MESSAGE
+from src.core.database import set_safety_rule
+from src.schemas.agents import SafetyAudit, ToneType
+
+
+def _verdict(**overrides) -> SafetyAudit:
+    fields = {
+        "is_safe": True,
+        "risk_of_morale_damage": 0.1,
+        "supervisor_confidence": 0.95,
+        "reasoning": "ok",
+    }
+    fields.update(overrides)
+    return SafetyAudit(**fields)
+
+
+@pytest.fixture(autouse=True)
+def clear_verdicts():
+    safety._audit_verdicts.clear()
+    yield
+    safety._audit_verdicts.clear()
+
+
+@pytest.mark.asyncio
+async def test_repeated_messages_served_from_verdict_cache():
+    """Same normalized message, tone and policy: one LLM audit, then local hits."""
+    await set_safety_rule("generic", ["PIP"], "HR boundaries.", is_verified=True)
+    supervisor = SafetySupervisor()
+    with (
+        patch("src.agents.safety.settings.SAFETY_AUDIT_CACHE_ENABLED", True),
+        patch.object(supervisor.provider, "chat_completion", new_callable=AsyncMock) as mock_chat,
+    ):
+        mock_chat.return_value = _verdict()
+        first = await supervisor.audit_message("Please send the update.", ToneType.FIRM, "u1")
+        second = await supervisor.audit_message("  please SEND the update. ", ToneType.FIRM, "u2")
+        assert mock_chat.await_count == 1
+        assert second == first
+        assert second is not first  # Callers get their own copy
+
+        # A different tone is a different audit
+        await supervisor.audit_message("Please send the update.", ToneType.SUPPORTIVE, "u1")
+        assert mock_chat.await_count == 2
+
+        # A rule change bumps the policy version, so old verdicts stop matching
+        await set_safety_rule("generic", ["PIP", "Salary"], "HR boundaries.", is_verified=True)
+        await supervisor.audit_message("Please send the update.", ToneType.FIRM, "u1")
+        assert mock_chat.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_degraded_verdicts_are_not_cached():
+    supervisor = SafetySupervisor()
+    with (
+        patch("src.agents.safety.settings.SAFETY_AUDIT_CACHE_ENABLED", True),
+        patch.object(supervisor.provider, "chat_completion", new_callable=AsyncMock) as mock_chat,
+    ):
+        mock_chat.return_value = _verdict(is_degraded=True, requires_human_review=True)
+        await supervisor.audit_message("Status please.", ToneType.NEUTRAL, "u1")
+        await supervisor.audit_message("Status please.", ToneType.NEUTRAL, "u1")
+        assert mock_chat.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fallback_messages_are_never_sent_to_the_auditor():
+    """A blocked message is replaced by the system fallback without auditing the fallback."""
+    from src.agents.brain import CommitVigilBrain
+    from src.schemas.agents import (
+        AgentDecision,
+        BurnoutDetection,
+        ExcuseAnalysis,
+        ExcuseCategory,
+        RiskAssessment,
+        RiskLevel,
+    )
+    from src.schemas.context import ContextProfile
+
+    brain = CommitVigilBrain()
+    decision = AgentDecision(
+        action="warned", tone=ToneType.FIRM, message="Your PIP starts Monday", analysis_summary="s"
+    )
+    with patch.object(
+        brain.supervisor,
+        "audit_message",
+        new_callable=AsyncMock,
+        return_value=_verdict(is_safe=False, is_hard_blocked=True),
+    ) as mock_audit:
+        evaluation = await brain._supervise(
+            "u1",
+            decision,
+            ExcuseAnalysis(category=ExcuseCategory.DEFLECTION, confidence_score=1, reasoning="r"),
+            RiskAssessment(
+                risk_score=0.9,
+                level=RiskLevel.HIGH,
+                predicted_latency_days=2,
+                mitigation_strategy="m",
+            ),
+            BurnoutDetection(is_at_risk=False, sentiment_indicators=[], recommendation="r"),
+            50.0,
+            0,
+            "generic",
+            "*",
+            ContextProfile(reasoning="t"),
+        )
+
+    assert evaluation.decision.message == HR_BLOCK_MESSAGE
+    mock_audit.assert_awaited_once()
+    assert mock_audit.await_args.args[0] == "Your PIP starts Monday"
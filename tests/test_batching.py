@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from src.core.batching import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_batch_dispatched_when_full():
+    batches = []
+
+    async def handler(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(handler, max_size=3, max_wait_ms=60000)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+    assert results == [0, 2, 4]
+    assert batches == [[0, 1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_dispatched_after_wait():
+    batches = []
+
+    async def handler(items):
+        batches.append(list(items))
+        return items
+
+    batcher = MicroBatcher(handler, max_size=100, max_wait_ms=10)
+    assert await asyncio.gather(batcher.submit("a"), batcher.submit("b")) == ["a", "b"]
+    assert batches == [["a", "b"]]
+    assert batcher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_item_failure_only_fails_its_submitter():
+    async def handler(items):
+        return [ValueError(item) if item == "bad" else item for item in items]
+
+    batcher = MicroBatcher(handler, max_size=2, max_wait_ms=60000)
+    good, bad = await asyncio.gather(
+        batcher.submit("good"), batcher.submit("bad"), return_exceptions=True
+    )
+    assert good == "good"
+    assert isinstance(bad, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_waiting_items():
+    async def handler(items):
+        return items
+
+    batcher = MicroBatcher(handler, max_size=100, max_wait_ms=60000)
+    pending = asyncio.create_task(batcher.submit("late"))
+    await asyncio.sleep(0)
+    await batcher.close()
+    assert await pending == "late"
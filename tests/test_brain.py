@@ -1,9 +1,12 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from src.agents.brain import CommitVigilBrain
 from src.agents.commitment_extractor import CommitmentExtractor
 from src.llm.mock import MockProvider
-from src.schemas.agents import ExcuseCategory, ToneType
+from src.schemas.agents import ExcuseCategory, FusedAnalysis, RiskLevel, ToneType
 
 
 @pytest.fixture
@@ -80,3 +83,60 @@ async def test_commitment_extractor(mock_extractor):
     assert extracted.commitment_found is True
     assert "Refactor API" in extracted.what
     assert "Friday" in extracted.when
+
+
+@pytest.mark.asyncio
+async def test_fused_analysis_single_call(mock_brain):
+    """Fused mode answers excuse/burnout/risk/language with one provider call."""
+    mock_brain.provider.chat_completion = AsyncMock(wraps=mock_brain.provider.chat_completion)
+
+    with patch("src.agents.brain.settings.ANALYSIS_MODE", "fused"):
+        excuse, burnout, risk, lang = await mock_brain._run_parallel_analysis(
+            "I am exhausted and cannot cope", 80.0, None
+        )
+
+    assert excuse.category == ExcuseCategory.BURNOUT_SIGNAL
+    assert burnout.is_at_risk is True
+    assert risk.level == RiskLevel.HIGH
+    assert lang == "en"
+    mock_brain.provider.chat_completion.assert_called_once()
+    assert mock_brain.provider.chat_completion.call_args.kwargs["response_model"] is FusedAnalysis
+
+
+@pytest.mark.asyncio
+async def test_fused_analysis_falls_back_to_fanout(mock_brain):
+    """A malformed fused response degrades to the classic parallel fan-out."""
+    mock_brain.analyze_fused = AsyncMock(side_effect=ValueError("schema mismatch"))
+
+    with patch("src.agents.brain.settings.ANALYSIS_MODE", "fused"):
+        excuse, burnout, risk, lang = await mock_brain._run_parallel_analysis(
+            "I was sick yesterday", 80.0, "de"
+        )
+
+    assert excuse.category == ExcuseCategory.LEGITIMATE
+    assert burnout.is_at_risk is False
+    assert risk.level == RiskLevel.HIGH
+    assert lang == "de"
+
+
+@pytest.mark.asyncio
+async def test_decision_stage_respects_deadline(mock_brain):
+    """A stalled decision stage escalates within the deadline and keeps the analyses."""
+    from src.core.deadline import Deadline
+    from src.schemas.context import ContextProfile
+
+    async def stalled_tone(*_args, **_kwargs):
+        await asyncio.sleep(5)
+
+    profile = ContextProfile(industry="generic", department="*", confidence=1.0, reasoning="t")
+    mock_brain._get_context_profile = AsyncMock(return_value=(profile, "generic", "*"))
+    mock_brain.adapt_tone = stalled_tone
+
+    start = asyncio.get_running_loop().time()
+    evaluation = await mock_brain.evaluate_participation(
+        "u1", "I was sick yesterday", 80.0, 0, lang="en", deadline=Deadline(0.2)
+    )
+
+    assert asyncio.get_running_loop().time() - start < 1
+    assert evaluation.decision.action == "escalate_to_manager"
+    assert evaluation.excuse.category == ExcuseCategory.LEGITIMATE
@@ -0,0 +1,119 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.core import database
+from src.core.cache import TTLCache
+from src.core.invalidation import CacheInvalidationBus
+from src.core.state import state
+from src.schemas.agents import CulturalPersona
+
+
+class FakePubSubRedis:
+    """In-memory stand-in for Redis pub/sub: every publish reaches every subscriber."""
+
+    def __init__(self):
+        self.subscribers: list[asyncio.Queue] = []
+        self.published: list[tuple[str, str]] = []
+
+    async def publish(self, channel, payload):
+        self.published.append((channel, payload))
+        for queue in self.subscribers:
+            queue.put_nowait({"type": "message", "channel": channel, "data": payload})
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+
+class FakePubSub:
+    def __init__(self, redis: FakePubSubRedis):
+        self.redis = redis
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, _channel):
+        self.redis.subscribers.append(self.queue)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        self.redis.subscribers.remove(self.queue)
+
+
+@pytest.fixture
+def fake_redis():
+    original = state["redis"]
+    state["redis"] = FakePubSubRedis()
+    yield state["redis"]
+    state["redis"] = original
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_other_processes(fake_redis):
+    """A write in one process drops the matching L1 entries in every subscribed process."""
+    writer = CacheInvalidationBus(TTLCache(), channel="test")
+    reader = CacheInvalidationBus(TTLCache(), channel="test")
+    reader.start()
+    await asyncio.sleep(0)  # Let the listener subscribe
+
+    reader.cache.set("safety_rules:finance:*", "rule")
+    reader.cache.set("safety_rules:finance:trading", "fallback")
+    reader.cache.set("persona:ja", "persona")
+
+    await writer.invalidate(prefixes=["safety_rules:finance:"])
+    await asyncio.sleep(0)
+
+    assert reader.cache.get("safety_rules:finance:*") is None
+    assert reader.cache.get("safety_rules:finance:trading") is None
+    assert reader.cache.get("persona:ja") == "persona"
+    assert json.loads(fake_redis.published[0][1]) == {
+        "keys": [],
+        "prefixes": ["safety_rules:finance:"],
+    }
+    await reader.stop()
+    assert not reader.running
+
+
+@pytest.mark.asyncio
+async def test_fill_skips_values_loaded_across_an_invalidation():
+    """A load that raced a write must not re-cache the pre-write snapshot."""
+    bus = CacheInvalidationBus(TTLCache(), channel="test")
+    generation = bus.generation
+    await bus.invalidate(keys=["persona:de"])
+    bus.fill("persona:de", "stale", generation)
+    assert bus.cache.get("persona:de") is None
+
+    bus.fill("persona:de", "fresh", bus.generation)
+    assert bus.cache.get("persona:de") == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_rule_lookups_served_from_l1_until_written():
+    """Repeat lookups skip Redis and the database; set_safety_rule drops the snapshot."""
+    await database.set_safety_rule("energy", ["grid"], "grid rules")
+    first, _ = await database.resolve_safety_rules("energy", "ops")
+
+    with patch.object(database, "AsyncSessionLocal", side_effect=AssertionError):
+        again, specificity = await database.resolve_safety_rules("Energy", "Ops")
+    assert again is first
+    assert specificity == database.RULE_SPECIFICITY_INDUSTRY
+
+    await database.set_safety_rule("energy", ["grid"], "new grid rules")
+    updated, _ = await database.resolve_safety_rules("energy", "ops")
+    assert updated.semantic_rules == "new grid rules"
+
+
+@pytest.mark.asyncio
+async def test_persona_misses_cached_until_created():
+    """Unknown persona codes are negatively cached in L1 and cleared on creation."""
+    assert await database.get_cultural_persona("xx") is None
+    assert database.reference_cache.get("persona:xx") is not None
+
+    await database.create_cultural_persona(
+        CulturalPersona(code="xx", name="Test", instruction="Be kind.")
+    )
+    persona = await database.get_cultural_persona("XX")
+    assert persona.instruction == "Be kind."
@@ -3,6 +3,7 @@ from datetime import UTC, datetime, timedelta
 import pytest
 from sqlmodel import select
 
+from src.core import database
 from src.core.config import settings
 from src.core.database import (
     get_user_by_git_email,
@@ -117,3 +118,249 @@ async def test_cooling_off_reset():
 
     _, _, consecutive_firm = await get_user_reliability(user_id)
     assert consecutive_firm == 1  # Reset to 0 then +1
+
+
+@pytest.mark.asyncio
+async def test_user_context_loaded_once_and_invalidated_on_update():
+    from unittest.mock import AsyncMock, patch
+
+    from src.core import database
+    from src.core.database import load_user_context
+
+    await update_user_reliability("ctx_user", was_failure=False, tone_used="supportive")
+
+    with patch(
+        "src.core.database.get_user_history",
+        wraps=database.get_user_history,
+        new_callable=AsyncMock,
+    ) as mock_fetch:
+        first = await load_user_context("ctx_user")
+        second = await load_user_context("ctx_user")
+        assert first is second
+        assert mock_fetch.await_count == 1
+
+        # Writes invalidate: the next read sees the fresh row
+        await update_user_reliability("ctx_user", was_failure=True, tone_used="firm")
+        refreshed = await load_user_context("ctx_user")
+        assert mock_fetch.await_count == 2
+        assert refreshed.failed_commitments == 1
+
+        # Unknown users are negatively cached too
+        assert await load_user_context("ghost") is None
+        assert await load_user_context("ghost") is None
+        assert mock_fetch.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_atomic_reliability_upsert_under_concurrency():
+    """Concurrent updates for one hot user never lose an increment."""
+    import asyncio
+
+    user_id = "hot_user"
+    await asyncio.gather(
+        *[
+            update_user_reliability(user_id, was_failure=i % 2 == 0, tone_used="firm")
+            for i in range(10)
+        ]
+    )
+
+    async with database.AsyncSessionLocal() as session:
+        results = await session.execute(select(UserHistory).where(UserHistory.user_id == user_id))
+        user = results.scalar_one()
+
+    assert user.total_commitments == 10
+    assert user.failed_commitments == 5
+    assert user.reliability_score == 50.0
+    assert user.consecutive_firm_interventions == 10
+    # Column defaults still apply to rows created by the upsert
+    assert user.department == "engineering"
+
+
+@pytest.mark.asyncio
+async def test_batch_user_context_load_and_bulk_reliability_write():
+    """A batch reads all users in one query and writes one row per user."""
+    from unittest.mock import patch
+
+    from src.core.database import load_user_context, load_user_contexts
+
+    await update_user_reliability("batch_a", was_failure=False, tone_used="supportive")
+    await load_user_context("batch_a")  # Warm: served without touching the DB
+
+    with patch.object(database, "AsyncSessionLocal", wraps=database.AsyncSessionLocal) as sessions:
+        contexts = await load_user_contexts(["batch_a", "batch_b", "batch_a"])
+        assert sessions.call_count == 1
+    assert contexts["batch_a"].total_commitments == 1
+    assert contexts["batch_b"] is None
+    assert await load_user_context("batch_b") is None  # Negative result was cached
+
+    written = await database.update_user_reliability_many(
+        [("batch_a", True, "firm"), ("batch_b", False, "supportive"), ("batch_a", True, "firm")]
+    )
+    assert written == 2
+    batch_a = await _read_user("batch_a")
+    assert batch_a.total_commitments == 3
+    assert batch_a.failed_commitments == 2
+    assert batch_a.consecutive_firm_interventions == 2
+    # Writes invalidate the cached contexts
+    assert (await load_user_context("batch_b")).total_commitments == 1
+
+
+async def _read_user(user_id: str) -> UserHistory:
+    async with database.AsyncSessionLocal() as session:
+        results = await session.execute(select(UserHistory).where(UserHistory.user_id == user_id))
+        return results.scalar_one()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("hours_since_last", [1, settings.COOLING_OFF_PERIOD_HOURS + 1])
+async def test_write_behind_flush_matches_sequential_updates(hours_since_last):
+    """One batched flush lands the same row state as applying each update in turn."""
+    last = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=hours_since_last)
+    async with database.AsyncSessionLocal() as session:
+        for user_id in ("sequential", "buffered"):
+            session.add(
+                UserHistory(
+                    user_id=user_id,
+                    total_commitments=4,
+                    failed_commitments=1,
+                    consecutive_firm_interventions=2,
+                    last_intervention_at=last,
+                )
+            )
+        await session.commit()
+
+    outcomes = [(True, "firm"), (False, "supportive"), (True, "firm"), (True, "confrontational")]
+    buffer = database.ReliabilityWriteBuffer(flush_interval_ms=60000)
+    for was_failure, tone in outcomes:
+        await update_user_reliability("sequential", was_failure=was_failure, tone_used=tone)
+        await buffer.add("buffered", was_failure, tone)
+    await buffer.add("new_user", False, "firm")
+
+    assert await buffer.flush() == 2
+    assert buffer.pending_users == 0
+
+    sequential, buffered = await _read_user("sequential"), await _read_user("buffered")
+    assert buffered.total_commitments == sequential.total_commitments == 8
+    assert buffered.failed_commitments == sequential.failed_commitments == 4
+    assert buffered.reliability_score == sequential.reliability_score == 50.0
+    assert buffered.consecutive_firm_interventions == sequential.consecutive_firm_interventions
+    assert buffered.last_intervention_at > last
+
+    new_user = await _read_user("new_user")
+    assert new_user.total_commitments == 1
+    assert new_user.consecutive_firm_interventions == 1
+
+
+@pytest.mark.asyncio
+async def test_write_behind_buffers_until_shutdown_flush():
+    """While running, updates stay in memory; stopping the buffer writes them out."""
+    await database.reliability_buffer.start()
+    try:
+        await update_user_reliability("worker_user", was_failure=True, tone_used="firm")
+        await update_user_reliability("worker_user", was_failure=False, tone_used="firm")
+        assert await get_user_reliability("worker_user") == (100.0, None, 0)
+    finally:
+        await database.reliability_buffer.stop()
+
+    user = await _read_user("worker_user")
+    assert user.total_commitments == 2
+    assert user.failed_commitments == 1
+    assert user.consecutive_firm_interventions == 2
+    # The flush invalidated the cached (pre-flush) context
+    assert await get_user_reliability("worker_user") == (50.0, None, 2)
+
+
+@pytest.mark.asyncio
+async def test_write_behind_replays_orphaned_journal_entries_once(stream_redis):
+    """
+    A crashed worker's journal entries are claimed and applied by another worker,
+    and entries it already wrote (crash before acknowledging) are not counted twice.
+    """
+    from unittest.mock import patch
+
+    redis = stream_redis
+    with (
+        patch.object(database.state, "redis", redis),
+        patch.object(settings, "RELIABILITY_JOURNAL_RECOVERY_AGE_SECONDS", 0),
+    ):
+        crashed = database.ReliabilityWriteBuffer(flush_interval_ms=60000)
+        await crashed.start()
+        await crashed.add("crashed", was_failure=True, tone_used="supportive")
+        await crashed.add("crashed", was_failure=False, tone_used="firm")
+        # Committed, but the worker dies before acknowledging
+        with patch.object(redis, "xack", side_effect=ConnectionError("gone")):
+            assert await crashed.flush() == 1
+        # Read, but the worker dies before writing
+        await crashed.add("crashed", was_failure=False, tone_used="firm")
+        await crashed._read_journal()
+        crashed._task.cancel()
+
+        survivor = database.ReliabilityWriteBuffer(flush_interval_ms=60000)
+        await survivor.start()
+        await survivor.stop()
+
+    user = await _read_user("crashed")
+    assert user.total_commitments == 3
+    assert user.failed_commitments == 1
+    assert user.consecutive_firm_interventions == 2
+    assert redis.entries == {}
+    assert redis.pel == {}
+
+
+class FakeCacheRedis:
+    """Just enough of the Redis API for the safety rule cache."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, _ttl, value):
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    async def scan_iter(self, match):
+        import fnmatch
+
+        for key in list(self.store):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+
+@pytest.mark.asyncio
+async def test_safety_rule_resolution_specificity_and_negative_cache():
+    """One query resolves the hierarchy; fallbacks and misses are cached with their level."""
+    from unittest.mock import patch
+
+    redis = FakeCacheRedis()
+    with patch.object(database.state, "redis", redis):
+        # Nothing configured yet: cached as an explicit miss
+        assert await database.resolve_safety_rules("mining", "ops") == (None, None)
+        assert "safety_rules:mining:ops" in redis.store
+
+        await database.set_safety_rule("generic", ["Salary"], "baseline")
+        # The generic wildcard write dropped every cached lookup it could back
+        assert redis.store == {}
+        rule, specificity = await database.resolve_safety_rules("mining", "ops")
+        assert rule.industry == "generic"
+        assert specificity == database.RULE_SPECIFICITY_GENERIC
+
+        await database.set_safety_rule("mining", ["blast"], "industry rules")
+        rule, specificity = await database.resolve_safety_rules("mining", "ops")
+        assert rule.industry == "mining"
+        assert specificity == database.RULE_SPECIFICITY_INDUSTRY
+
+        await database.set_safety_rule("mining", ["shaft"], "ops rules", department="ops")
+        rule, specificity = await database.resolve_safety_rules("Mining", "OPS")
+        assert rule.semantic_rules == "ops rules"
+        assert specificity == database.RULE_SPECIFICITY_EXACT
+
+        # Served from cache without touching the database
+        with patch.object(database, "AsyncSessionLocal", side_effect=AssertionError):
+            cached_rule, cached_specificity = await database.resolve_safety_rules("mining", "ops")
+        assert cached_rule.hr_keywords == ["shaft"]
+        assert cached_specificity == database.RULE_SPECIFICITY_EXACT
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_fixed
+
+from src.core.deadline import (
+    Deadline,
+    current_deadline,
+    deadline_scope,
+    run_with_budget,
+    stage_budget,
+    stop_on_deadline,
+)
+
+
+def test_stage_budget_is_capped_by_active_deadline():
+    assert stage_budget(30) == 30
+    with deadline_scope(5):
+        assert stage_budget(30) <= 5
+        assert stage_budget(1) == 1
+    assert current_deadline() is None
+
+
+def test_nested_scope_never_extends_parent():
+    with deadline_scope(1) as outer, deadline_scope(60) as inner:
+        assert inner is outer
+
+
+@pytest.mark.asyncio
+async def test_run_with_budget_times_out_at_deadline():
+    with deadline_scope(0.05), pytest.raises(TimeoutError):
+        await run_with_budget(asyncio.sleep(5), cap=60)
+
+
+@pytest.mark.asyncio
+async def test_deadline_propagates_into_gathered_tasks():
+    async def seen() -> float:
+        deadline = current_deadline()
+        assert deadline is not None
+        return deadline.remaining()
+
+    with deadline_scope(10):
+        remaining = await asyncio.gather(seen(), seen())
+    assert all(0 < r <= 10 for r in remaining)
+
+
+@pytest.mark.asyncio
+async def test_retries_skipped_when_backoff_overruns_deadline():
+    attempts = 0
+
+    async def flaky() -> None:
+        nonlocal attempts
+        attempts += 1
+        raise ConnectionError("reset")
+
+    retrying = AsyncRetrying(
+        stop=stop_after_attempt(3) | stop_on_deadline(),
+        wait=wait_fixed(1),
+        retry=retry_if_exception_type(ConnectionError),
+        reraise=True,
+    )
+    with deadline_scope(deadline=Deadline(0.5)), pytest.raises(ConnectionError):
+        await retrying(flaky)
+
+    assert attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_fan_out_analysis_runs_under_the_stage_budget():
+    """The fan-out calls see the analysis stage budget, not the looser outer deadline."""
+    from unittest.mock import patch
+
+    from src.agents.brain import CommitVigilBrain
+
+    seen: list[float] = []
+
+    async def record(*_args, **_kwargs):
+        seen.append(current_deadline().remaining())
+
+    brain = CommitVigilBrain()
+    with (
+        patch("src.agents.brain.settings.ANALYSIS_MODE", "fanout"),
+        patch("src.agents.brain.settings.STAGE_BUDGET_ANALYSIS_SECONDS", 2),
+        patch.object(brain, "analyze_excuse", record),
+        patch.object(brain, "detect_burnout", record),
+        patch.object(brain, "assess_risk", record),
+        deadline_scope(60),
+    ):
+        await brain._run_parallel_analysis("Blocked on review", 90.0, "en")
+
+    assert len(seen) == 3
+    assert all(remaining <= 2 for remaining in seen)
@@ -4,7 +4,16 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.core.config import settings
-from src.core.database import get_safety_rules, init_db, set_safety_rule, update_user_reliability
+from src.core.database import (
+    RULE_SPECIFICITY_EXACT,
+    RULE_SPECIFICITY_GENERIC,
+    RULE_SPECIFICITY_INDUSTRY,
+    _update_user_reliability_locked,
+    get_safety_rules,
+    init_db,
+    resolve_safety_rules,
+    set_safety_rule,
+)
 from src.llm.factory import LLMFactory
 from src.llm.groq import GroqProvider
 from src.llm.mock import MockProvider
@@ -16,6 +25,10 @@ from src.schemas.agents import SafetyRule, UserHistory
 async def test_llm_factory_steering():
     """Test explicit provider steering in LLMFactory."""
     with patch("src.llm.factory.settings") as mock_settings:
+        mock_settings.LLM_CACHE_ENABLED = False
+        mock_settings.LLM_GOVERNOR_ENABLED = False
+        mock_settings.LLM_HEDGE_ENABLED = False
+        mock_settings.LLM_CIRCUIT_ENABLED = False
         mock_settings.OPENAI_API_KEY = "sk-test"
         mock_settings.GROQ_API_KEY = "gsk-test"
 
@@ -37,6 +50,10 @@ async def test_llm_factory_auto_detect():
     """Test auto-detection of providers in LLMFactory."""
     # Test OpenAI auto-detect
     with patch("src.llm.factory.settings") as mock_settings:
+        mock_settings.LLM_CACHE_ENABLED = False
+        mock_settings.LLM_GOVERNOR_ENABLED = False
+        mock_settings.LLM_HEDGE_ENABLED = False
+        mock_settings.LLM_CIRCUIT_ENABLED = False
         mock_settings.LLM_PROVIDER = None
         mock_settings.OPENAI_API_KEY = "sk-test"
         mock_settings.GROQ_API_KEY = None
@@ -45,6 +62,10 @@ async def test_llm_factory_auto_detect():
 
     # Test Groq auto-detect
     with patch("src.llm.factory.settings") as mock_settings:
+        mock_settings.LLM_CACHE_ENABLED = False
+        mock_settings.LLM_GOVERNOR_ENABLED = False
+        mock_settings.LLM_HEDGE_ENABLED = False
+        mock_settings.LLM_CIRCUIT_ENABLED = False
         mock_settings.LLM_PROVIDER = None
         mock_settings.OPENAI_API_KEY = None
         mock_settings.GROQ_API_KEY = "gsk-test"
@@ -56,6 +77,10 @@ async def test_llm_factory_auto_detect():
 async def test_llm_factory_fallback():
     """Test fallback to mock when no keys are available."""
     with patch("src.llm.factory.settings") as mock_settings:
+        mock_settings.LLM_CACHE_ENABLED = False
+        mock_settings.LLM_GOVERNOR_ENABLED = False
+        mock_settings.LLM_HEDGE_ENABLED = False
+        mock_settings.LLM_CIRCUIT_ENABLED = False
         mock_settings.LLM_PROVIDER = None
         mock_settings.OPENAI_API_KEY = None
         mock_settings.GROQ_API_KEY = None
@@ -65,7 +90,7 @@ async def test_llm_factory_fallback():
 
 @pytest.mark.asyncio
 async def test_database_cooling_off_reset():
-    """Test that the consecutive_firm_interventions counter resets after cooling off."""
+    """Legacy locked path: consecutive_firm_interventions resets after cooling off."""
     user_id = "test_cooling_user"
 
     # 1. Setup user in database with last intervention 25 hours ago
@@ -89,7 +114,7 @@ async def test_database_cooling_off_reset():
         mock_session.execute.return_value = mock_result
 
         # 2. Update reliability with a supportive tone
-        await update_user_reliability(user_id, was_failure=False, tone_used="supportive")
+        await _update_user_reliability_locked(user_id, was_failure=False, tone_used="supportive")
 
         # 3. Assert counter was reset
         assert mock_user.consecutive_firm_interventions == 0
@@ -102,27 +127,27 @@ async def test_database_hierarchical_safety_rules():
         mock_session = AsyncMock()
         mock_session_factory.return_value.__aenter__.return_value = mock_session
 
-        # Case 1: Industry fallback (Engineering/Wildcard -> Engineering/*)
+        # Case 1: Industry fallback (Engineering/Dev -> Engineering/*)
         mock_result = MagicMock()
-        # First call (specific) returns None, second call (wildcard) returns a rule
-        mock_result.scalar_one_or_none.side_effect = [
-            None,
+        mock_result.first.return_value = (
             SafetyRule(industry="engineering", department="*", semantic_rules="test"),
-        ]
+            RULE_SPECIFICITY_INDUSTRY,
+        )
         mock_session.execute.return_value = mock_result
 
-        rule = await get_safety_rules(industry="engineering", department="dev")
+        rule, specificity = await resolve_safety_rules(industry="engineering", department="dev")
         assert rule.industry == "engineering"
         assert rule.department == "*"
+        assert specificity == RULE_SPECIFICITY_INDUSTRY
+        # The whole hierarchy is resolved in a single round trip
+        mock_session.execute.assert_awaited_once()
 
-        # Case 2: Generic fallback (Finance/Wildcard -> Generic/*)
+        # Case 2: Generic fallback (Finance/Trading -> Generic/*)
         mock_result = MagicMock()
-        # specific fails, industry-wide fails, generic succeeds
-        mock_result.scalar_one_or_none.side_effect = [
-            None,
-            None,
+        mock_result.first.return_value = (
             SafetyRule(industry="generic", department="*", semantic_rules="generic test"),
-        ]
+            RULE_SPECIFICITY_GENERIC,
+        )
         mock_session.execute.return_value = mock_result
 
         rule = await get_safety_rules(industry="finance", department="trading")
@@ -153,8 +178,9 @@ async def test_database_redis_cache_logic():
         mock_session = AsyncMock()
         mock_session_factory.return_value.__aenter__.return_value = mock_session
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = SafetyRule(
-            industry="uncached", department="*", semantic_rules="rules"
+        mock_result.first.return_value = (
+            SafetyRule(industry="uncached", department="*", semantic_rules="rules"),
+            RULE_SPECIFICITY_EXACT,
         )
         mock_session.execute.return_value = mock_result
 
@@ -162,6 +188,8 @@ async def test_database_redis_cache_logic():
         assert rule.industry == "uncached"
         mock_redis.setex.assert_called_once()
 
+    state["redis"] = None
+
 
 @pytest.mark.asyncio
 async def test_database_init_exception():
@@ -0,0 +1,179 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from src.core import followups
+from src.core.followups import (
+    drain_follow_ups,
+    migrate_legacy_follow_ups,
+    request_follow_up,
+    schedule_follow_up,
+)
+from src.core.state import state
+
+
+def _fake_redis() -> MagicMock:
+    redis = MagicMock()
+    redis.set = AsyncMock(return_value=True)
+    redis.enqueue_job = AsyncMock(side_effect=lambda *_a, **kw: MagicMock(job_id=kw["_job_id"]))
+    return redis
+
+
+@pytest.mark.asyncio
+async def test_follow_up_is_a_deferred_arq_job():
+    redis = _fake_redis()
+    with patch.object(state, "redis", redis):
+        before = datetime.now(UTC)
+        await schedule_follow_up("u1", "ping", "U1")
+
+    args, kwargs = redis.enqueue_job.await_args
+    assert args == ("send_follow_up", "u1", "ping", "U1")
+    assert kwargs["_defer_until"] >= before + timedelta(seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_follow_up_skipped_without_redis():
+    with patch.object(state, "redis", None):
+        assert await schedule_follow_up("u1", "ping") is None
+
+
+@pytest.mark.asyncio
+async def test_legacy_apscheduler_rows_migrate_to_arq(tmp_path):
+    """Pending APScheduler jobs keep their run time and arguments, then leave the table."""
+    url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    run_at = datetime.now(UTC) + timedelta(hours=1)
+    legacy = BackgroundScheduler(jobstores={"default": SQLAlchemyJobStore(url=url)})
+    legacy.start(paused=True)
+    legacy.add_job(
+        "src.worker:send_follow_up",
+        "date",
+        run_date=run_at,
+        args=["u1", "ping", "U1"],
+        id="old-1",
+    )
+    legacy.shutdown()
+
+    redis = _fake_redis()
+    with (
+        patch.object(state, "redis", redis),
+        patch.object(followups.settings, "SYNC_DATABASE_URL", url),
+    ):
+        assert await migrate_legacy_follow_ups() == 1
+
+    args, kwargs = redis.enqueue_job.await_args
+    assert args == ("send_follow_up", "u1", "ping", "U1")
+    assert kwargs["_job_id"] == "legacy-follow-up:old-1"
+    assert abs((kwargs["_defer_until"] - run_at).total_seconds()) < 1
+
+    store = SQLAlchemyJobStore(url=url)
+    assert store.get_all_jobs() == []
+    store.shutdown()
+
+
+class FakeFollowUpRedis:
+    """Just enough Redis (keys, hashes, TTLs, MULTI pipelines, ARQ enqueue) for follow-ups."""
+
+    def __init__(self):
+        self.values: dict[str, object] = {}
+        self.ttls: dict[str, float] = {}
+        self.jobs: list[tuple[tuple, dict]] = []
+
+    async def enqueue_job(self, *args, **kwargs):
+        self.jobs.append((args, kwargs))
+        return MagicMock(job_id=kwargs["_job_id"])
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        if ex:
+            self.ttls[key] = ex * 1000
+        return True
+
+    async def delete(self, key):
+        self.ttls.pop(key, None)
+        return int(self.values.pop(key, None) is not None)
+
+    async def hset(self, key, field, value):
+        self.values.setdefault(key, {})[field] = value
+
+    async def hgetall(self, key):
+        return dict(self.values.get(key, {}))
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds * 1000
+
+    async def pttl(self, key):
+        return self.ttls.get(key, -2) if key in self.values else -2
+
+    def pipeline(self, **_options):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return None
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, n)(*a, **kw) for n, a, kw in self.calls]
+
+
+@pytest.mark.asyncio
+async def test_follow_ups_coalesce_into_one_job_per_user():
+    """Repeated and distinct commitments share one pending job; same commitment dedups."""
+    redis = FakeFollowUpRedis()
+    with (
+        patch.object(state, "redis", redis),
+        patch.object(followups.settings, "FOLLOW_UP_COALESCING_ENABLED", True),
+    ):
+        assert await request_follow_up("u1", "Ship API", "U1") is not None
+        assert await request_follow_up("u1", "Ship API", "U1") is None
+        assert await request_follow_up("u1", "Fix tests", "U1") is None
+        await request_follow_up("u2", "Docs", None)
+        assert [args for args, _ in redis.jobs] == [
+            ("send_coalesced_follow_up", "u1"),
+            ("send_coalesced_follow_up", "u2"),
+        ]
+
+        messages = await drain_follow_ups("u1")
+        assert [message for message, _ in messages] == [
+            "🔔 *CommitVigil Alert:* Checking in on commitment: Ship API",
+            "🔔 *CommitVigil Alert:* Checking in on commitment: Fix tests",
+        ]
+        assert await drain_follow_ups("u1") == []  # Claimed exactly once
+
+
+@pytest.mark.asyncio
+async def test_follow_up_digest_and_min_interval():
+    redis = FakeFollowUpRedis()
+    with (
+        patch.object(state, "redis", redis),
+        patch.object(followups.settings, "FOLLOW_UP_COALESCING_ENABLED", True),
+        patch.object(followups.settings, "FOLLOW_UP_DIGEST_ENABLED", True),
+        patch.object(followups.settings, "FOLLOW_UP_MIN_INTERVAL_SECONDS", 600),
+    ):
+        await request_follow_up("u1", "Ship API", None)
+        await request_follow_up("u1", "Fix tests", "U1")
+        [(message, slack_id)] = await drain_follow_ups("u1")
+        assert "2 commitments" in message
+        assert "• Ship API" in message
+        assert "• Fix tests" in message
+        assert slack_id == "U1"
+
+        # The next follow-up waits out the per-user interval
+        await request_follow_up("u1", "Ship API", "U1")
+        _, kwargs = redis.jobs[-1]
+        assert kwargs["_defer_by"] == timedelta(seconds=600)
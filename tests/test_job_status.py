@@ -0,0 +1,234 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from arq.constants import default_queue_name, in_progress_key_prefix, result_key_prefix
+from arq.jobs import serialize_result
+from fastapi.testclient import TestClient
+
+from src.api.deps import get_redis
+from src.core.config import settings
+from src.core.jobs import JOB_DONE_CHANNEL, job_snapshot, publish_job_done, wait_for_job
+from src.main import app
+
+
+class FakeJobRedis:
+    """ARQ job keys plus pub/sub, in memory."""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.queue: dict[str, float] = {}
+        self.channels: dict[str, list[asyncio.Queue]] = {}
+        self.enqueued: list[tuple] = []
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, nx=False, **_options):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value.encode()
+        return True
+
+    async def delete(self, key):
+        return int(self.values.pop(key, None) is not None)
+
+    async def enqueue_job(self, function, _job_id=None, **kwargs):
+        if _job_id in self.queue or result_key_prefix + _job_id in self.values:
+            return None
+        self.queue[_job_id] = time.time() * 1000 - 1000
+        self.enqueued.append((function, _job_id, kwargs))
+        return MagicMock(job_id=_job_id)
+
+    async def exists(self, key):
+        return int(key in self.values)
+
+    async def zscore(self, name, member):
+        return self.queue.get(member) if name == default_queue_name else None
+
+    async def publish(self, channel, message):
+        for queue in self.channels.get(channel, []):
+            queue.put_nowait({"type": "message", "data": message})
+
+    def pipeline(self, **_options):
+        return FakePipeline(self)
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    def finish(self, job_id, result, success=True):
+        now = int(time.time() * 1000)
+        self.queue.pop(job_id, None)
+        self.values[result_key_prefix + job_id] = serialize_result(
+            "process_commitment_eval",
+            (),
+            {},
+            1,
+            now,
+            success,
+            result,
+            now,
+            now,
+            "ref",
+            default_queue_name,
+            job_id=job_id,
+        )
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return None
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.redis.channels.setdefault(channel, []).append(self.messages)
+
+    async def get_message(self, timeout=0.0, **_options):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except TimeoutError:
+            return None
+
+    async def aclose(self):
+        for queues in self.redis.channels.values():
+            if self.messages in queues:
+                queues.remove(self.messages)
+
+
+@pytest.mark.asyncio
+async def test_long_poll_wakes_on_completion_signal():
+    redis = FakeJobRedis()
+    redis.queue["job-1"] = time.time() * 1000 - 1000
+    assert (await job_snapshot(redis, "job-1"))["status"] == "queued"
+
+    async def worker():
+        await asyncio.sleep(0.05)
+        redis.values[in_progress_key_prefix + "job-1"] = b"1"
+        redis.finish("job-1", {"decision": "ok"})
+        await publish_job_done(redis, "job-1")
+
+    started = time.perf_counter()
+    finisher = asyncio.create_task(worker())
+    snapshot = await wait_for_job(redis, "job-1", timeout=10)
+    await finisher
+
+    assert snapshot == {"job_id": "job-1", "status": "complete", "result": {"decision": "ok"}}
+    # Woken by the signal, well before the fallback poll interval
+    assert time.perf_counter() - started < 0.5
+    assert redis.channels[JOB_DONE_CHANNEL.format(job_id="job-1")] == []
+
+
+@pytest.mark.asyncio
+async def test_long_poll_times_out_and_reports_failures():
+    redis = FakeJobRedis()
+    redis.queue["slow"] = time.time() * 1000 - 1000
+    assert (await wait_for_job(redis, "slow", timeout=0.05))["status"] == "queued"
+
+    redis.finish("slow", RuntimeError("llm down"), success=False)
+    assert await wait_for_job(redis, "slow", timeout=1) == {
+        "job_id": "slow",
+        "status": "failed",
+        "error": "llm down",
+    }
+    assert (await job_snapshot(redis, "missing"))["status"] == "not_found"
+
+
+def test_status_endpoint_and_sse_stream():
+    redis = FakeJobRedis()
+    redis.finish("job-2", {"decision": "ok"})
+    app.dependency_overrides[get_redis] = lambda: redis
+    client = TestClient(app)
+    client.headers = {"X-API-Key": settings.API_KEY_SECRET}
+    try:
+        response = client.get("/api/v1/evaluate/job-2", params={"wait": 5})
+        assert response.json() == {
+            "job_id": "job-2",
+            "status": "complete",
+            "result": {"decision": "ok"},
+        }
+        assert client.get("/api/v1/evaluate/unknown").status_code == 404
+
+        with client.stream("GET", "/api/v1/evaluate/job-2/events") as stream:
+            body = "".join(stream.iter_text())
+        assert body.startswith("event: result\ndata: ")
+        assert '"status": "complete"' in body
+    finally:
+        app.dependency_overrides = {}
+
+
+def test_sync_mode_can_be_disabled():
+    redis = AsyncMock()
+    redis.enqueue_job.return_value.job_id = "job-3"
+    app.dependency_overrides[get_redis] = lambda: redis
+    client = TestClient(app)
+    client.headers = {"X-API-Key": settings.API_KEY_SECRET}
+    payload = {"user_id": "u1", "commitment": "c", "check_in": "ok"}
+    try:
+        with patch("src.api.v1.evaluation.settings.SYNC_EVALUATION_ENABLED", False):
+            response = client.post("/api/v1/evaluate", params={"sync": True}, json=payload)
+        assert response.json()["status_url"] == "/api/v1/evaluate/job-3"
+        redis.enqueue_job.assert_awaited_once()
+    finally:
+        app.dependency_overrides = {}
+
+
+def test_retried_submissions_reuse_the_original_job():
+    """Identical bodies (or a replayed Idempotency-Key) never enqueue a second evaluation."""
+    redis = FakeJobRedis()
+    app.dependency_overrides[get_redis] = lambda: redis
+    client = TestClient(app)
+    client.headers = {"X-API-Key": settings.API_KEY_SECRET}
+    payload = {"user_id": "u1", "commitment": "Ship API", "check_in": "Blocked on review"}
+    try:
+        first = client.post("/api/v1/evaluate", json=payload).json()
+        retry = client.post("/api/v1/evaluate", json=payload)
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert retry.json()["job_id"] == first["job_id"]
+        assert retry.json()["job_status"] == "queued"
+        assert len(redis.enqueued) == 1
+
+        # Once finished, retries are answered with the stored evaluation
+        redis.finish(first["job_id"], {"decision": "ok"})
+        replay = client.post("/api/v1/evaluate", json=payload).json()
+        assert replay["evaluation"] == {"decision": "ok"}
+
+        # A different check-in is new work
+        client.post("/api/v1/evaluate", json={**payload, "check_in": "Done"})
+        assert len(redis.enqueued) == 2
+
+        # Without a key, a different industry is also new work, never a key conflict
+        other = client.post("/api/v1/evaluate", json={**payload, "industry": "finance"})
+        assert other.status_code == 200
+        assert other.json()["status"] == "enqueued"
+        assert len(redis.enqueued) == 3
+
+        headers = {"Idempotency-Key": "retry-42"}
+        keyed = client.post("/api/v1/evaluate", json={**payload, "check_in": "A"}, headers=headers)
+        again = client.post("/api/v1/evaluate", json={**payload, "check_in": "A"}, headers=headers)
+        assert again.json()["job_id"] == keyed.json()["job_id"]
+        conflict = client.post(
+            "/api/v1/evaluate", json={**payload, "check_in": "B"}, headers=headers
+        )
+        assert conflict.status_code == 422
+        assert len(redis.enqueued) == 4
+    finally:
+        app.dependency_overrides = {}
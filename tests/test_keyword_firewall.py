@@ -0,0 +1,86 @@
+import random
+import re
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.agents.safety import SafetySupervisor
+from src.core.database import set_safety_rule
+from src.core.keywords import REDACTION_MASK, KeywordAutomaton
+from src.schemas.agents import ToneType
+
+
+def test_automaton_matches_whole_words_with_normalization():
+    automaton = KeywordAutomaton(["PIP", "Salary", "patient data", "case #"])
+    # Case, full-width (NFKC) and multi-word keywords
+    assert automaton.find("Your ＰＩＰ and SALARY review") == ["PIP", "Salary"]
+    assert automaton.find("Share the Patient  Data") == []
+    assert automaton.find("See patient data for case # 12") == ["patient data", "case #"]
+    # Substrings of longer words are not hits
+    assert automaton.find("Pipeline salaryman") == []
+
+
+def test_automaton_casefolds_length_changing_characters():
+    automaton = KeywordAutomaton(["strasse"])
+    assert automaton.find("Meet at the Straße office") == ["strasse"]
+    assert automaton.redact("Meet at the Straße office") == f"Meet at the {REDACTION_MASK} office"
+
+
+def test_automaton_overlapping_keywords_and_redaction():
+    automaton = KeywordAutomaton(["he", "she", "hers", "personal data", "data"])
+    assert automaton.find("she said hers") == ["she", "hers"]
+    assert automaton.find("ushers") == []
+    # Leftmost-longest spans win, so the mask never splits a keyword
+    assert automaton.redact("Send personal data now") == f"Send {REDACTION_MASK} now"
+
+
+def test_automaton_agrees_with_regex_oracle():
+    """Randomized cross-check against a whole-word regex over the same keywords."""
+    rng = random.Random(7)
+    alphabet = "abc "
+    for _ in range(200):
+        keywords = list(
+            {"".join(rng.choice("abc") for _ in range(rng.randint(1, 3))) for _ in range(4)}
+        )
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        oracle = {k for k in keywords if re.search(rf"(?<!\w){re.escape(k)}(?!\w)", text)}
+        assert set(KeywordAutomaton(keywords).find(text)) == oracle, (keywords, text)
+
+
+@pytest.mark.asyncio
+async def test_supervisor_blocks_locally_without_llm():
+    """A restricted topic is hard-blocked before any LLM call when the firewall is on."""
+    await set_safety_rule("generic", ["PIP", "Salary"], "HR boundaries.", is_verified=True)
+    supervisor = SafetySupervisor()
+    with (
+        patch("src.agents.safety.settings.SAFETY_LOCAL_FIREWALL_ENABLED", True),
+        patch.object(supervisor.provider, "chat_completion", new_callable=AsyncMock) as mock_chat,
+    ):
+        audit = await supervisor.audit_message(
+            "We need to discuss your PIP tomorrow.", ToneType.FIRM, "ctx", industry="generic"
+        )
+        assert audit.is_hard_blocked is True
+        assert "PIP" in audit.reasoning
+        mock_chat.assert_not_called()
+
+        # Clean messages still go to the LLM audit
+        await supervisor.audit_message(
+            "Can you share an update on the report?", ToneType.SUPPORTIVE, "ctx"
+        )
+        mock_chat.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_supervisor_redact_mode_suggests_local_correction():
+    await set_safety_rule("generic", ["PIP", "Salary"], "HR boundaries.", is_verified=True)
+    supervisor = SafetySupervisor()
+    with (
+        patch("src.agents.safety.settings.SAFETY_LOCAL_FIREWALL_ENABLED", True),
+        patch("src.agents.safety.settings.SAFETY_LOCAL_FIREWALL_MODE", "redact"),
+    ):
+        audit = await supervisor.audit_message(
+            "Your salary depends on this.", ToneType.FIRM, "ctx", industry="generic"
+        )
+    assert audit.is_safe is False
+    assert audit.is_hard_blocked is False
+    assert audit.suggested_correction == f"Your {REDACTION_MASK} depends on this."
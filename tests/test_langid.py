@@ -0,0 +1,66 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.agents.brain import CommitVigilBrain
+from src.core.langid import identify_language
+from src.core.persona import CULTURAL_PROMPTS
+from src.llm.mock import MockProvider
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Sorry, I forgot about the deadline, I will fix it tomorrow", "en"),
+        ("Ich war gestern krank und konnte die Aufgabe nicht beenden", "de"),
+        ("J'étais malade hier et je n'ai pas pu finir la tâche", "fr"),
+        ("Estuve enfermo ayer y no pude terminar la tarea", "es"),
+        ("Eu estava doente ontem e não consegui terminar a tarefa", "pt"),
+        ("Jag var sjuk igår och kunde inte avsluta uppgiften", "sv"),
+        ("昨日は体調が悪くてタスクを終えられませんでした", "ja"),
+        ("昨天我生病了，没能完成任务", "zh"),
+    ],
+)
+def test_identify_language_confident(text, expected):
+    code, confidence = identify_language(text)
+    assert code == expected
+    assert confidence >= 0.6
+
+
+def test_identify_language_short_text_is_uncertain():
+    _, confidence = identify_language("ok")
+    assert confidence < 0.6
+
+
+@pytest.fixture
+def counting_brain():
+    brain = CommitVigilBrain()
+    brain.provider = MockProvider()
+    brain.provider.chat_completion = AsyncMock(wraps=brain.provider.chat_completion)
+    return brain
+
+
+@pytest.mark.asyncio
+async def test_detect_language_skips_llm_when_confident(counting_brain):
+    lang = await counting_brain.detect_language(
+        "Eu estava doente ontem e não consegui terminar a tarefa"
+    )
+    assert lang == "pt-BR"
+    assert lang in CULTURAL_PROMPTS
+    counting_brain.provider.chat_completion.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_detect_language_uk_keywords_applied_locally(counting_brain):
+    lang = await counting_brain.detect_language(
+        "Cheers mate, sorry for the delay, I will have the report ready by the end of the day"
+    )
+    assert lang == "en-UK"
+    counting_brain.provider.chat_completion.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_detect_language_falls_back_to_llm_when_uncertain(counting_brain):
+    lang = await counting_brain.detect_language("ok")
+    assert lang == "en"
+    counting_brain.provider.chat_completion.assert_called_once()
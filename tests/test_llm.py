@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 import pytest
 
 from src.core.config import settings
 from src.llm.factory import LLMFactory
 from src.llm.groq import GroqProvider
+from src.llm.http import build_http_client
 from src.llm.mock import MockProvider
 from src.llm.openai import OpenAIProvider
 from src.schemas.agents import ExcuseAnalysis
@@ -42,3 +45,31 @@ async def test_mock_provider_chat_completion():
         response_model=ExcuseAnalysis, messages=[], model="any-model"
     )
     assert isinstance(response, ExcuseAnalysis)
+
+
+@pytest.mark.asyncio
+async def test_llm_factory_returns_shared_pooled_provider():
+    settings.OPENAI_API_KEY = "dummy_key"
+    settings.LLM_PROVIDER = "openai"
+
+    first = LLMFactory.get_provider()
+    second = LLMFactory.get_provider()
+    assert first is second
+    assert first.http_client is not None
+    assert not first.http_client.is_closed
+
+    await LLMFactory.close_all()
+    assert first.http_client.is_closed
+    # A fresh pool is built after shutdown
+    assert LLMFactory.get_provider() is not first
+    await LLMFactory.close_all()
+
+
+def test_build_http_client_falls_back_without_h2():
+    with (
+        patch("src.llm.http.settings.LLM_HTTP2_ENABLED", True),
+        patch("src.llm.http.httpx.AsyncClient") as mock_client,
+    ):
+        mock_client.side_effect = [ImportError("h2 missing"), "http1-client"]
+        assert build_http_client() == "http1-client"
+        assert "http2" not in mock_client.call_args.kwargs
@@ -0,0 +1,157 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.cache import TTLCache
+from src.core.state import state
+from src.llm.cache import CachedProvider
+from src.llm.factory import LLMFactory
+from src.llm.mock import MockProvider
+from src.schemas.agents import ExcuseAnalysis, LanguageResponse
+
+MESSAGES = [
+    {"role": "system", "content": "Analyze the excuse."},
+    {"role": "user", "content": "I was   sick\nyesterday"},
+]
+
+
+@pytest.fixture
+def counting_provider():
+    inner = MockProvider()
+    inner.chat_completion = AsyncMock(wraps=inner.chat_completion)  # type: ignore[method-assign]
+    return inner
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    original = state.get("redis")
+    state["redis"] = None
+    yield
+    state["redis"] = original
+
+
+def test_ttl_cache_lru_eviction_and_expiry():
+    cache = TTLCache(max_entries=2, default_ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" is now most recent
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.set("expired", 4, ttl=0)
+    assert cache.get("expired") is None
+
+
+@pytest.mark.asyncio
+async def test_cached_provider_serves_identical_requests_locally(counting_provider):
+    provider = CachedProvider(counting_provider, cache=TTLCache())
+
+    first = await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+    # Whitespace-only differences normalize to the same key
+    reformatted = [MESSAGES[0], {"role": "user", "content": "I was sick yesterday"}]
+    second = await provider.chat_completion(ExcuseAnalysis, reformatted, "gpt-4o")
+
+    assert first == second
+    assert first is not second  # Callers get private copies
+    counting_provider.chat_completion.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_provider_key_includes_model_and_schema(counting_provider):
+    provider = CachedProvider(counting_provider, cache=TTLCache())
+
+    await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+    await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o-mini")
+    await provider.chat_completion(LanguageResponse, MESSAGES, "gpt-4o")
+
+    assert counting_provider.chat_completion.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_provider_redis_tier(counting_provider):
+    mock_redis = AsyncMock()
+    mock_redis.get.return_value = None
+    state["redis"] = mock_redis
+
+    provider = CachedProvider(counting_provider, cache=TTLCache())
+    result = await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+    mock_redis.setex.assert_called_once()
+    _, ttl, payload = mock_redis.setex.call_args.args
+    assert ttl == 600
+
+    # A fresh process (empty L1) is served from Redis
+    mock_redis.get.return_value = payload
+    cold_provider = CachedProvider(counting_provider, cache=TTLCache())
+    cached = await cold_provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+
+    assert cached == result
+    counting_provider.chat_completion.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_provider_bypasses_disabled_models(counting_provider):
+    provider = CachedProvider(counting_provider, cache=TTLCache())
+
+    with patch.dict("src.llm.cache.settings.LLM_CACHE_MODEL_TTLS", {"ExcuseAnalysis": 0}):
+        await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+        await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+
+    assert counting_provider.chat_completion.call_count == 2
+
+
+def test_factory_wraps_paid_providers_when_enabled():
+    with patch("src.llm.factory.settings") as mock_settings:
+        mock_settings.LLM_CACHE_ENABLED = True
+        mock_settings.LLM_PROVIDER = "openai"
+        mock_settings.OPENAI_API_KEY = "sk-test"
+        assert isinstance(LLMFactory.get_provider(), CachedProvider)
+
+        mock_settings.LLM_PROVIDER = "mock"
+        assert isinstance(LLMFactory.get_provider(), MockProvider)
+
+
+def test_cache_key_names_the_backend_behind_resilience_wrappers():
+    from src.llm.circuit import CircuitBreakerProvider
+    from src.llm.governor import GovernedProvider
+    from src.llm.groq import GroqProvider
+    from src.llm.openai import OpenAIProvider
+
+    openai, groq = OpenAIProvider(api_key="sk-test"), GroqProvider(api_key="gsk-test")
+    wrapped = CachedProvider(
+        CircuitBreakerProvider(GovernedProvider(openai), provider_name="OpenAIProvider")
+    )
+    key = wrapped.cache_key(ExcuseAnalysis, MESSAGES, "gpt-4o")
+
+    assert wrapped.provider_name == "OpenAIProvider"
+    assert key == CachedProvider(openai).cache_key(ExcuseAnalysis, MESSAGES, "gpt-4o")
+    breaker_over_groq = CircuitBreakerProvider(GovernedProvider(groq), provider_name="GroqProvider")
+    assert key != CachedProvider(breaker_over_groq).cache_key(ExcuseAnalysis, MESSAGES, "gpt-4o")
+
+
+def test_factory_stack_keys_on_the_primary_backend():
+    """Cached(Hedged(Governed)) from the factory: OpenAI and Groq primaries never share keys."""
+    from src.llm import factory
+
+    toggles = {
+        "LLM_CACHE_ENABLED": True,
+        "LLM_GOVERNOR_ENABLED": True,
+        "LLM_HEDGE_ENABLED": True,
+        "LLM_CIRCUIT_ENABLED": False,
+        "OPENAI_API_KEY": "sk-test",
+        "GROQ_API_KEY": "gsk-test",
+    }
+    with patch.multiple(factory.settings, **toggles):
+        with patch.object(factory.settings, "LLM_HEDGE_PROVIDER", "groq"):
+            openai_first = LLMFactory.get_provider("openai")
+        with patch.object(factory.settings, "LLM_HEDGE_PROVIDER", "openai"):
+            groq_first = LLMFactory.get_provider("groq")
+
+    assert isinstance(openai_first, CachedProvider)
+    assert (openai_first.provider_name, groq_first.provider_name) == (
+        "OpenAIProvider",
+        "GroqProvider",
+    )
+    assert openai_first.cache_key(ExcuseAnalysis, MESSAGES, "m") != groq_first.cache_key(
+        ExcuseAnalysis, MESSAGES, "m"
+    )
@@ -0,0 +1,97 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.llm import circuit
+from src.llm.circuit import CircuitBreaker, CircuitBreakerProvider, CircuitOpenError
+from src.llm.mock import MockProvider
+from src.schemas.agents import (
+    AgentDecision,
+    BurnoutDetection,
+    ExcuseAnalysis,
+    ExcuseCategory,
+    SafetyAudit,
+)
+
+MESSAGES = [{"role": "user", "content": "I was sick in hospital"}]
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    circuit._breakers.clear()
+    yield
+    circuit._breakers.clear()
+
+
+@pytest.fixture
+def failing_provider():
+    provider = MockProvider()
+    provider.chat_completion = AsyncMock(side_effect=ConnectionError("upstream down"))  # type: ignore[method-assign]
+    return provider
+
+
+async def trip(provider: CircuitBreakerProvider, calls: int = 5) -> None:
+    for _ in range(calls):
+        with pytest.raises(ConnectionError):
+            await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_serves_degraded_heuristics(failing_provider):
+    provider = CircuitBreakerProvider(failing_provider)
+    await trip(provider)
+
+    excuse = await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+    burnout = await provider.chat_completion(BurnoutDetection, MESSAGES, "gpt-4o")
+
+    assert excuse.is_degraded
+    assert excuse.category == ExcuseCategory.LEGITIMATE
+    assert burnout.is_degraded
+    # No further provider round-trips once open
+    assert failing_provider.chat_completion.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_degraded_safety_audit_forces_human_review(failing_provider):
+    provider = CircuitBreakerProvider(failing_provider)
+    await trip(provider)
+
+    audit = await provider.chat_completion(SafetyAudit, MESSAGES, "gpt-4o")
+
+    assert audit.is_degraded
+    assert audit.requires_human_review
+    assert audit.supervisor_confidence == 0.0
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_without_fast_path(failing_provider):
+    provider = CircuitBreakerProvider(failing_provider)
+    await trip(provider)
+
+    with pytest.raises(CircuitOpenError):
+        await provider.chat_completion(AgentDecision, MESSAGES, "gpt-4o")
+
+
+def test_breaker_half_open_probe_closes_or_reopens(monkeypatch):
+    breaker = CircuitBreaker(failure_rate=0.5, min_calls=2, window=10, recovery_seconds=30)
+    breaker.record(failed=True)
+    breaker.record(failed=True)
+    assert breaker.state == "open"
+    assert not breaker.allow_request()
+
+    clock = breaker.opened_at + 31
+    monkeypatch.setattr(circuit.time, "monotonic", lambda: clock)
+    assert breaker.allow_request()  # The single probe
+    assert not breaker.allow_request()
+    breaker.record(failed=True)
+    assert breaker.state == "open"
+
+    clock += 31
+    assert breaker.allow_request()
+    breaker.record(failed=False)
+    assert breaker.state == "closed"
+
+
+def test_llm_facing_schema_hides_degraded_flag():
+    assert "is_degraded" not in ExcuseAnalysis.model_json_schema()["properties"]
+    assert "is_degraded" not in SafetyAudit.model_json_schema()["properties"]
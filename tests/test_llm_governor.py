@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+import pytest
+
+from src.core.ratelimit import TokenBucket
+from src.llm import governor
+from src.llm.governor import (
+    AdaptiveConcurrencyLimiter,
+    GovernedProvider,
+    estimate_tokens,
+    is_rate_limited,
+)
+from src.llm.mock import MockProvider
+from src.schemas.agents import LanguageResponse
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class SlowProvider(MockProvider):
+    def __init__(self, fail_with: Exception | None = None):
+        self.active = 0
+        self.peak = 0
+        self.fail_with = fail_with
+
+    async def chat_completion(self, response_model, messages, model):  # noqa: ARG002
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_with:
+                raise self.fail_with
+            return LanguageResponse(code="en")
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def fresh_controllers():
+    governor._controllers.clear()
+    yield
+    governor._controllers.clear()
+
+
+def test_estimate_tokens_and_rate_limit_detection():
+    messages = [{"role": "user", "content": "x" * 400}]
+    assert estimate_tokens(messages) == 100 + governor.COMPLETION_TOKEN_ALLOWANCE
+    assert is_rate_limited(RateLimitError())
+    assert not is_rate_limited(TimeoutError())
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_throttles_beyond_burst():
+    bucket = TokenBucket(rate=100, capacity=2)
+    start = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    # Burst of 2 is free; the remaining 2 refill at 100/s
+    assert time.monotonic() - start >= 0.015
+    assert not bucket.try_acquire(2)
+
+
+@pytest.mark.asyncio
+async def test_aimd_window_grows_and_halves():
+    limiter = AdaptiveConcurrencyLimiter(initial=4, minimum=1, maximum=8, latency_target_ms=100)
+    for _ in range(8):
+        await limiter.acquire()
+        await limiter.release(latency_ms=10)
+    assert limiter.limit > 5
+
+    await limiter.acquire()
+    await limiter.release(latency_ms=10, rate_limited=True)
+    assert limiter.limit < 3
+
+    await limiter.acquire()
+    before = limiter.limit
+    await limiter.release(latency_ms=500)
+    assert limiter.limit < before
+
+
+@pytest.mark.asyncio
+async def test_governed_provider_caps_concurrency(monkeypatch):
+    monkeypatch.setattr(governor.settings, "LLM_INITIAL_CONCURRENCY", 2)
+    monkeypatch.setattr(governor.settings, "LLM_MAX_CONCURRENCY", 2)
+    inner = SlowProvider()
+    provider = GovernedProvider(inner)
+
+    results = await asyncio.gather(
+        *[provider.chat_completion(LanguageResponse, [], "gpt-4o") for _ in range(6)]
+    )
+
+    assert len(results) == 6
+    assert inner.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_governed_provider_backs_off_on_429(monkeypatch):
+    monkeypatch.setattr(governor.settings, "LLM_INITIAL_CONCURRENCY", 8)
+    provider = GovernedProvider(SlowProvider(fail_with=RateLimitError()))
+
+    with pytest.raises(RateLimitError):
+        await provider.chat_completion(LanguageResponse, [], "gpt-4o")
+
+    controller = governor.get_admission_controller("SlowProvider", "gpt-4o")
+    assert controller.limiter.limit == 4
+    assert controller.limiter.in_flight == 0
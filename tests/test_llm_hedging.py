@@ -0,0 +1,87 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.llm import hedging
+from src.llm.hedging import HedgedProvider
+from src.llm.mock import MockProvider
+from src.schemas.agents import ExcuseAnalysis
+
+MESSAGES = [{"role": "user", "content": "I was sick yesterday"}]
+
+
+def spy(provider: MockProvider) -> MockProvider:
+    provider.chat_completion = AsyncMock(wraps=provider.chat_completion)  # type: ignore[method-assign]
+    return provider
+
+
+@pytest.fixture(autouse=True)
+def fresh_windows():
+    hedging._latency_windows.clear()
+    yield
+    hedging._latency_windows.clear()
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    primary = spy(MockProvider(latency_sampler=lambda: 0.001))
+    secondary = spy(MockProvider())
+    provider = HedgedProvider(primary, secondary, default_delay_ms=200)
+
+    result = await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+
+    assert isinstance(result, ExcuseAnalysis)
+    secondary.chat_completion.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_loses_to_secondary_and_is_cancelled():
+    primary = spy(MockProvider(latency_sampler=lambda: 1.0))
+    secondary = spy(MockProvider(latency_sampler=lambda: 0.01))
+    provider = HedgedProvider(primary, secondary, secondary_model="llama3", default_delay_ms=20)
+
+    start = time.perf_counter()
+    result = await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+
+    assert isinstance(result, ExcuseAnalysis)
+    assert time.perf_counter() - start < 0.5
+    assert secondary.chat_completion.call_args.args[2] == "llama3"
+    await asyncio.sleep(0)
+    # The cancelled primary still contributes a (lower-bound) latency sample
+    assert len(hedging._latency_windows[("MockProvider", "gpt-4o")]) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_fails_over_immediately():
+    primary = MockProvider()
+    primary.chat_completion = AsyncMock(side_effect=ConnectionError("reset"))  # type: ignore[method-assign]
+    provider = HedgedProvider(primary, MockProvider(), default_delay_ms=5000)
+
+    start = time.perf_counter()
+    result = await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+
+    assert isinstance(result, ExcuseAnalysis)
+    assert time.perf_counter() - start < 1
+
+
+def test_hedge_delay_tracks_observed_percentile():
+    provider = HedgedProvider(MockProvider(), MockProvider(), percentile=90, default_delay_ms=2000)
+    assert provider.hedge_delay("gpt-4o") == 2.0
+
+    hedging._latency_windows[("MockProvider", "gpt-4o")] = hedging.deque(
+        [float(ms) for ms in range(1, 101)]
+    )
+    assert provider.hedge_delay("gpt-4o") == pytest.approx(0.091)
+
+
+@pytest.mark.asyncio
+async def test_latency_is_tracked_under_the_backend_behind_the_governor():
+    from src.llm.governor import GovernedProvider
+
+    provider = HedgedProvider(GovernedProvider(MockProvider()), MockProvider())
+    await provider.chat_completion(ExcuseAnalysis, MESSAGES, "gpt-4o")
+
+    assert provider.provider_name == "MockProvider"
+    assert list(hedging._latency_windows) == [("MockProvider", "gpt-4o")]
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from src.core.pipeline import PipelineGraph
+
+
+@pytest.mark.asyncio
+async def test_independent_nodes_overlap():
+    """Nodes without dependencies run concurrently; dependents get upstream results."""
+    gate = asyncio.Event()
+    running = set()
+
+    async def slow(tag):
+        running.add(tag)
+        await gate.wait()
+        return tag
+
+    async def analysis():
+        return await slow("analysis")
+
+    async def context():
+        return await slow("context")
+
+    async def rules(context):
+        return f"rules:{context}"
+
+    async with PipelineGraph("test") as graph:
+        graph.add("analysis", analysis).add("context", context)
+        graph.add("rules", rules, deps=("context",))
+        graph.start()
+        await asyncio.sleep(0)
+        assert running == {"analysis", "context"}
+        gate.set()
+        assert await graph.result("rules") == "rules:context"
+        assert await graph.result("analysis") == "analysis"
+    assert set(graph.timings) == {"analysis", "context", "rules"}
+
+
+@pytest.mark.asyncio
+async def test_failed_dependency_fails_downstream():
+    async def broken():
+        raise TimeoutError("slow LLM")
+
+    async def downstream(broken):
+        return broken
+
+    async with PipelineGraph("test") as graph:
+        graph.add("broken", broken).add("downstream", downstream, deps=("broken",))
+        with pytest.raises(TimeoutError):
+            await graph.result("downstream")
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_unawaited_nodes():
+    cancelled = asyncio.Event()
+
+    async def forever():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def quick():
+        return 1
+
+    async with PipelineGraph("test") as graph:
+        graph.add("forever", forever).add("quick", quick)
+        assert await graph.result("quick") == 1
+    assert cancelled.is_set()
+
+
+def test_unknown_dependency_rejected():
+    async def node():
+        return None
+
+    with pytest.raises(ValueError, match="unknown node"):
+        PipelineGraph("test").add("rules", node, deps=("context",))
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from src.core.policy import (
+    GLOBAL_SAFETY_BASELINE,
+    STRICT_PRIVACY_NOTE,
+    compile_safety_policy,
+)
+from src.schemas.agents import SafetyRule, ToneType
+
+
+def _rule(**overrides) -> SafetyRule:
+    fields = {
+        "id": 1,
+        "industry": "healthcare",
+        "department": "*",
+        "hr_keywords": ["HIPAA", "patient data", "PHI", "HIPAA"],
+        "semantic_rules": "Redact patient identifiers.",
+        "is_verified": True,
+        "updated_at": datetime(2026, 1, 1),
+    }
+    fields.update(overrides)
+    return SafetyRule(**fields)
+
+
+def test_policy_compiled_once_per_rule_revision():
+    """The same rule revision reuses one policy; an update produces a new version."""
+    rule = _rule()
+    policy = compile_safety_policy(rule, "Healthcare")
+    assert compile_safety_policy(_rule(), "healthcare") is policy
+
+    updated = compile_safety_policy(
+        _rule(semantic_rules="Stricter.", updated_at=rule.updated_at + timedelta(days=1)),
+        "healthcare",
+    )
+    assert updated is not policy
+    assert updated.version != policy.version
+
+
+def test_policy_merges_rules_and_baseline():
+    """Keywords are de-duplicated in order and the baseline is always enforced."""
+    policy = compile_safety_policy(_rule(), "healthcare")
+    assert policy.keywords == ("HIPAA", "patient data", "PHI")
+    assert policy.semantic_rules.endswith(f"MANDATORY BASELINE: {GLOBAL_SAFETY_BASELINE}")
+    assert policy.force_human_review is False
+    assert "Healthcare Ethics" in policy.system_prompt
+
+    unverified = compile_safety_policy(_rule(is_verified=False), "healthcare")
+    assert unverified.force_human_review is True
+    assert "UNVERIFIED" in unverified.semantic_rules
+
+    fallback = compile_safety_policy(None, "mining")
+    assert fallback.keywords == ()
+    assert not fallback.matcher
+    assert fallback.find_restricted("anything") == []
+
+
+def test_policy_matcher_is_whole_word_and_case_insensitive():
+    policy = compile_safety_policy(_rule(), "healthcare")
+    assert policy.find_restricted("Please check the Patient Data and hipaa forms") == [
+        "patient data",
+        "HIPAA",
+    ]
+    # "PHI" inside another word is not a match
+    assert policy.find_restricted("Our PHILOSOPHY is simple") == []
+
+
+def test_policy_render_only_fills_in_message_data():
+    policy = compile_safety_policy(_rule(), "healthcare")
+    prompt = policy.render_prompt("Ship it today.", ToneType.FIRM, "ctx", 0.9)
+    assert prompt.startswith(policy.prompt_prefix)
+    assert "RESTRICTED TOPICS: HIPAA, patient data, PHI" in prompt
+    assert "<proposed_message>\nShip it today.\n</proposed_message>" in prompt
+    assert "MANAGER_ACCEPTANCE_RATE: 0.9" in prompt
+
+
+def test_policy_context_layer_is_cached_and_versioned():
+    """Context-profile rules produce a derived policy, reused for the same profile rules."""
+    policy = compile_safety_policy(_rule(), "healthcare")
+    assert policy.with_context(None) is policy
+
+    profile = SimpleNamespace(
+        department="hr",
+        dynamic_safety_rules=[
+            SimpleNamespace(rule_name="NoNames", reasoning="Anonymize", target_tokens=["roster"])
+        ],
+    )
+    layered = policy.with_context(profile)
+    assert layered is policy.with_context(profile)
+    assert layered.version != policy.version
+    assert "salary" in layered.keywords
+    assert "roster" in layered.keywords
+    assert STRICT_PRIVACY_NOTE in layered.semantic_rules
+    assert "[NoNames]: Anonymize" in layered.semantic_rules
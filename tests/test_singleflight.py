@@ -0,0 +1,194 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.agents.brain import CommitVigilBrain
+from src.core.singleflight import RedisSingleFlight, SingleFlight
+from src.core.state import state
+from src.schemas.agents import CulturalPersona
+
+
+class FakeLockRedis:
+    """Minimal SET NX / compare-and-delete semantics for lock tests."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    async def set(self, key, value, nx=False, px=None):  # noqa: ARG002
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def delete(self, key):
+        return int(self.store.pop(key, None) is not None)
+
+    async def eval(self, _script, _numkeys, key, token):
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+
+@pytest.mark.asyncio
+async def test_singleflight_coalesces_concurrent_calls():
+    group = SingleFlight()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*[group.do("k", compute) for _ in range(10)])
+
+    assert results == ["value"] * 10
+    assert calls == 1
+
+    # Completed flights are not cached: the next call recomputes
+    await group.do("k", compute)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_singleflight_propagates_leader_exception():
+    group = SingleFlight()
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise ValueError("db down")
+
+    results = await asyncio.gather(group.do("k", boom), group.do("k", boom), return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_leader_timeout_hands_over_to_follower():
+    """A leader cut off by its own budget must not cancel the callers waiting on it."""
+    group = SingleFlight()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "value"
+
+    leader = asyncio.create_task(asyncio.wait_for(group.do("k", compute), timeout=0.01))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(group.do("k", compute))
+
+    with pytest.raises(TimeoutError):
+        await leader
+    assert await follower == "value"
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_singleflight_serializes_across_processes():
+    """Two groups (simulating two workers) share one Redis lock."""
+    original = state.get("redis")
+    state["redis"] = FakeLockRedis()
+    active = 0
+    max_active = 0
+
+    async def critical_section():
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+        return "done"
+
+    try:
+        worker_a = RedisSingleFlight(lock_ttl_seconds=5, poll_interval_seconds=0.005)
+        worker_b = RedisSingleFlight(lock_ttl_seconds=5, poll_interval_seconds=0.005)
+        results = await asyncio.gather(
+            worker_a.do("persona_draft:nl", critical_section),
+            worker_b.do("persona_draft:nl", critical_section),
+        )
+    finally:
+        state["redis"] = original
+
+    assert results == ["done", "done"]
+    assert max_active == 1
+    assert state.get("redis") is original
+
+
+@pytest.mark.asyncio
+async def test_redis_singleflight_followers_reuse_leader_result():
+    """Followers in other processes take the published JSON result instead of recomputing."""
+    redis = FakeLockRedis()
+    original = state.get("redis")
+    state["redis"] = redis
+    calls = 0
+
+    async def draft():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return CulturalPersona(code="nl", name="Dutch Professional", instruction="Be direct.")
+
+    try:
+        worker_a = RedisSingleFlight(lock_ttl_seconds=5, poll_interval_seconds=0.005)
+        worker_b = RedisSingleFlight(lock_ttl_seconds=5, poll_interval_seconds=0.005)
+        results = await asyncio.gather(
+            worker_a.do("persona_draft:nl", draft, model=CulturalPersona),
+            worker_b.do("persona_draft:nl", draft, model=CulturalPersona),
+        )
+    finally:
+        state["redis"] = original
+
+    assert [(p.code, p.instruction) for p in results] == [("nl", "Be direct.")] * 2
+    assert calls == 1
+    published = json.loads(redis.store["singleflight:result:persona_draft:nl"])
+    assert published["code"] == "nl"
+
+
+@pytest.mark.asyncio
+async def test_redis_singleflight_without_model_publishes_nothing():
+    """Untyped results are never shared: the next lock holder re-runs its (re-checking) call."""
+    redis = FakeLockRedis()
+    original = state.get("redis")
+    state["redis"] = redis
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        return {"code": "nl"}
+
+    try:
+        group = RedisSingleFlight(lock_ttl_seconds=5, poll_interval_seconds=0.005)
+        assert await group.do("k", compute) == {"code": "nl"}
+    finally:
+        state["redis"] = original
+
+    assert redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_persona_drafting_runs_once():
+    """A burst of check-ins for an unknown culture drafts the persona only once."""
+    original = state.get("redis")
+    state["redis"] = None
+    with patch("src.agents.brain.get_cultural_persona", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = None
+        brain = CommitVigilBrain()
+
+        async def slow_draft(lang):
+            await asyncio.sleep(0.01)
+            return AsyncMock(code=lang)
+
+        brain.draft_new_persona = AsyncMock(side_effect=slow_draft)  # type: ignore[method-assign]
+        try:
+            personas = await asyncio.gather(*[brain.get_or_create_persona("nl") for _ in range(5)])
+        finally:
+            state["redis"] = original
+
+    assert len({id(p) for p in personas}) == 1
+    brain.draft_new_persona.assert_called_once_with("nl")
@@ -1,8 +1,11 @@
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.core.slack import SlackConnector
+from src.core.slack import SlackConnector, SlackDeliveryQueue
+from src.core.state import state
 
 
 @pytest.mark.asyncio
@@ -47,3 +50,132 @@ async def test_slack_failure():
                 mock_logger.error.assert_called_once_with(
                     "slack_notification_failed", error="HTTP Error"
                 )
+
+
+WEBHOOKS = {
+    "a": "http://hooks.test/a",
+    "b": "http://hooks.test/b",
+    "down": "http://hooks.test/down",
+}
+
+
+@pytest.fixture
+def slack_stub():
+    """Local webhook stub: records payloads, replies with queued statuses (default 200)."""
+    import httpx
+
+    requests: list[tuple[str, dict]] = []
+    replies: list[httpx.Response] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((str(request.url), json.loads(request.content)))
+        return replies.pop(0) if replies else httpx.Response(200, text="ok")
+
+    previous = SlackConnector._client
+    SlackConnector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    yield requests, replies
+    SlackConnector._client = previous
+
+
+@pytest.mark.asyncio
+async def test_delivery_queue_batches_and_honors_retry_after(slack_stub):
+    """Queued mentions for one webhook go out as one payload, re-sent after a 429."""
+    import httpx
+
+    requests, replies = slack_stub
+    replies.append(httpx.Response(429, headers={"Retry-After": "0"}))
+    queue = SlackDeliveryQueue(rate_per_second=100, webhooks=WEBHOOKS)
+    await queue.start()
+    for user in ("U1", "U2", "U3"):
+        await queue.enqueue(f"<@{user}> ping", webhook="a")
+    await queue.drain()
+    await queue.stop()
+
+    expected = {"text": "<@U1> ping\n<@U2> ping\n<@U3> ping"}
+    assert requests == [("http://hooks.test/a", expected)] * 2
+    assert queue.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_delivery_queue_paces_each_webhook_and_drops_after_max_attempts(slack_stub):
+    import httpx
+
+    requests, replies = slack_stub
+    queue = SlackDeliveryQueue(
+        rate_per_second=10, batch_max_messages=1, max_attempts=2, webhooks=WEBHOOKS
+    )
+    with patch("src.core.slack.asyncio.sleep", new_callable=AsyncMock):
+        replies.extend([httpx.Response(503), httpx.Response(503)])
+        await queue.enqueue("lost", webhook="down")
+        await queue.drain()
+    assert len(requests) == 2  # Retried once, then dropped
+
+    requests.clear()
+    started = asyncio.get_running_loop().time()
+    for i in range(3):
+        await queue.enqueue(f"a{i}", webhook="a")
+        await queue.enqueue(f"b{i}", webhook="b")
+    await queue.drain()
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert [payload["text"] for url, payload in requests if url.endswith("/a")] == [
+        "a0",
+        "a1",
+        "a2",
+    ]
+    assert len(requests) == 6
+    # Buckets are per webhook: both run at 10/s side by side (~0.2s), not 6 sends in series
+    assert 0.15 <= elapsed < 0.45
+
+
+@pytest.mark.asyncio
+async def test_send_notification_uses_queue_when_running(slack_stub):
+    requests, _replies = slack_stub
+    with (
+        patch("src.core.slack.settings.SLACK_WEBHOOK_URL", "http://hooks.test/a"),
+        patch("src.core.slack.slack_outbox", SlackDeliveryQueue(rate_per_second=100)) as outbox,
+    ):
+        await outbox.start()
+        await SlackConnector.send_notification("hello", slack_id="U9")
+        await outbox.drain()
+        await outbox.stop()
+    assert requests == [("http://hooks.test/a", {"text": "<@U9> hello"})]
+
+
+@pytest.mark.asyncio
+async def test_journal_keeps_urls_out_and_survives_a_stopped_process(slack_stub, stream_redis):
+    """
+    Journaled messages name a webhook alias, never its URL; messages a stopped process
+    left undelivered are claimed and sent by another one.
+    """
+    requests, _replies = slack_stub
+    with (
+        patch.object(state, "redis", stream_redis),
+        patch("src.core.slack.settings.SLACK_WEBHOOK_URL", "http://hooks.test/secret"),
+    ):
+        stopped = SlackDeliveryQueue(rate_per_second=100)
+        await stopped.start()
+        with patch.object(stopped, "_push"):  # Read, but the process dies before sending
+            await stopped.enqueue("orphaned")
+        stopped._recovery.cancel()
+        assert "secret" not in str(stream_redis.entries)
+
+        survivor = SlackDeliveryQueue(rate_per_second=100)
+        await survivor.start()
+        await survivor.drain()
+        await survivor.stop()
+
+    assert requests == [("http://hooks.test/secret", {"text": "orphaned"})]
+    assert stream_redis.entries == {}
+    assert stream_redis.pel == {}
+
+
+@pytest.mark.asyncio
+async def test_unsendable_webhook_is_dropped_without_killing_the_sender(slack_stub):
+    requests, _replies = slack_stub
+    queue = SlackDeliveryQueue(rate_per_second=100, webhooks={"bad": "http://[::1"})
+    await queue.enqueue("never", webhook="bad")
+    await queue.enqueue("unknown alias", webhook="missing")
+    await queue.drain()
+    assert queue.pending == 0
+    assert requests == []
@@ -2,6 +2,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.agents.brain import CommitVigilBrain
 from src.schemas.agents import (
     AgentDecision,
     BurnoutDetection,
@@ -11,15 +12,22 @@ from src.schemas.agents import (
     RiskAssessment,
     RiskLevel,
     ToneType,
+    UserHistory,
+)
+from src.worker import (
+    process_commitment_eval,
+    run_evaluation_batch,
+    send_follow_up,
+    shutdown,
+    startup,
 )
-from src.worker import process_commitment_eval, send_follow_up, shutdown, startup
 
 
 @pytest.mark.asyncio
 async def test_send_follow_up():
     """Test the send_follow_up wrapper function."""
     with patch("src.worker.SlackConnector.send_notification", new_callable=AsyncMock) as mock_send:
-        await send_follow_up("user1", "hello", slack_id="U123")
+        await send_follow_up({}, "user1", "hello", slack_id="U123")
         mock_send.assert_called_once_with("hello", slack_id="U123")
 
 
@@ -53,20 +61,30 @@ async def test_process_commitment_eval_low_risk():
     with (
         patch("src.worker.CommitVigilBrain", return_value=mock_brain_instance),
         patch(
-            "src.worker.get_user_reliability",
+            "src.worker.load_user_context",
             new_callable=AsyncMock,
-            return_value=(95.0, "U123", 0),
-        ),
+            return_value=UserHistory(
+                user_id="user1",
+                reliability_score=95.0,
+                slack_id="U123",
+                consecutive_firm_interventions=0,
+            ),
+        ) as mock_load,
         patch("src.worker.update_user_reliability", new_callable=AsyncMock) as mock_update,
-        patch("src.worker.scheduler") as mock_scheduler,
+        patch("src.worker.request_follow_up", new_callable=AsyncMock) as mock_schedule,
     ):
         ctx: dict[str, str] = {}
         await process_commitment_eval(ctx, "user1", "task1", "status1")
 
+        mock_load.assert_awaited_once_with("user1")
+        # The loaded row is threaded into the brain instead of being re-read
+        call_kwargs = mock_brain_instance.evaluate_participation.call_args.kwargs
+        assert call_kwargs["user_history"] is mock_load.return_value
+        assert call_kwargs["reliability_score"] == 95.0
         mock_update.assert_called_once_with(
             "user1", was_failure=False, tone_used=ToneType.SUPPORTIVE
         )
-        mock_scheduler.add_job.assert_not_called()
+        mock_schedule.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -96,18 +114,23 @@ async def test_process_commitment_eval_high_risk():
     with (
         patch("src.worker.CommitVigilBrain", return_value=mock_brain_instance),
         patch(
-            "src.worker.get_user_reliability",
+            "src.worker.load_user_context",
             new_callable=AsyncMock,
-            return_value=(50.0, "U123", 1),
+            return_value=UserHistory(
+                user_id="user1",
+                reliability_score=50.0,
+                slack_id="U123",
+                consecutive_firm_interventions=1,
+            ),
         ),
         patch("src.worker.update_user_reliability", new_callable=AsyncMock) as mock_update,
-        patch("src.worker.scheduler") as mock_scheduler,
+        patch("src.worker.request_follow_up", new_callable=AsyncMock) as mock_schedule,
     ):
         ctx: dict[str, str] = {}
         await process_commitment_eval(ctx, "user1", "task1", "status1")
 
         mock_update.assert_called_once_with("user1", was_failure=True, tone_used=ToneType.FIRM)
-        mock_scheduler.add_job.assert_called_once()
+        mock_schedule.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -115,11 +138,147 @@ async def test_worker_lifecycle():
     """Test worker startup and shutdown logic."""
     with (
         patch("src.worker.init_db", new_callable=AsyncMock) as mock_init,
-        patch("src.worker.scheduler") as mock_scheduler,
+        patch("src.worker.migrate_legacy_follow_ups", new_callable=AsyncMock) as mock_migrate,
     ):
-        await startup({})
+        ctx: dict = {}
+        await startup(ctx)
         mock_init.assert_called_once()
-        mock_scheduler.start.assert_called_once()
+        mock_migrate.assert_not_called()  # Opt-in only
+        assert isinstance(ctx["brain"], CommitVigilBrain)
+
+        await shutdown(ctx)
+        assert "brain" not in ctx
+
+
+@pytest.mark.asyncio
+async def test_process_commitment_eval_reuses_worker_brain():
+    """Jobs use the brain built at startup instead of constructing their own."""
+    mock_brain_instance = MagicMock()
+    mock_brain_instance.evaluate_participation = AsyncMock(side_effect=RuntimeError("stop"))
+
+    with (
+        patch("src.worker.CommitVigilBrain") as mock_brain_cls,
+        patch("src.worker.load_user_context", new_callable=AsyncMock, return_value=None),
+    ):
+        with pytest.raises(RuntimeError, match="stop"):
+            await process_commitment_eval({"brain": mock_brain_instance}, "user1", "t", "s")
+        mock_brain_cls.assert_not_called()
+        mock_brain_instance.evaluate_participation.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_evaluation_batch_shares_reads_and_writes():
+    """One history read and one reliability write per batch; failures stay isolated."""
+    high_risk = PipelineEvaluation(
+        decision=AgentDecision(
+            action="warned", tone=ToneType.FIRM, message="hurry", analysis_summary="sum"
+        ),
+        excuse=ExcuseAnalysis(
+            category=ExcuseCategory.DEFLECTION, confidence_score=0.8, reasoning="logic"
+        ),
+        risk=RiskAssessment(
+            risk_score=0.8,
+            level=RiskLevel.HIGH,
+            predicted_latency_days=2,
+            mitigation_strategy="nudge",
+        ),
+        burnout=BurnoutDetection(is_at_risk=False, sentiment_indicators=[], recommendation="rest"),
+    )
+
+    async def evaluate_participation(user_id, **_kwargs):
+        if user_id == "broken":
+            raise RuntimeError("llm down")
+        return high_risk
+
+    brain = MagicMock()
+    brain.evaluate_participation = AsyncMock(side_effect=evaluate_participation)
+    brain.get_or_create_persona = AsyncMock()
+    brain.detect_language_locally.return_value = "en"
+    requests = [
+        {"user_id": user_id, "commitment": "c", "check_in": "s", "industry": "generic"}
+        for user_id in ("u1", "u2", "broken")
+    ]
+
+    with (
+        patch(
+            "src.worker.load_user_contexts",
+            new_callable=AsyncMock,
+            return_value={"u1": UserHistory(user_id="u1", slack_id="U1")},
+        ) as mock_load,
+        patch("src.worker.resolve_safety_rules", new_callable=AsyncMock) as mock_rules,
+        patch("src.worker.update_user_reliability_many", new_callable=AsyncMock) as mock_write,
+        patch("src.worker.request_follow_up", new_callable=AsyncMock) as mock_schedule,
+    ):
+        results = await run_evaluation_batch(brain, requests)
+
+    mock_load.assert_awaited_once_with(["u1", "u2", "broken"])
+    # Persona and rules are fetched once for the shared language/industry group
+    brain.get_or_create_persona.assert_awaited_once_with("en")
+    mock_rules.assert_awaited_once_with("generic", "*")
+    assert results[:2] == [high_risk, high_risk]
+    assert isinstance(results[2], RuntimeError)
+    mock_write.assert_awaited_once_with([("u1", True, ToneType.FIRM), ("u2", True, ToneType.FIRM)])
+    assert mock_schedule.await_count == 2
+    assert mock_schedule.await_args_list[0].args[2] == "U1"
+
+
+@pytest.mark.asyncio
+async def test_evaluation_batch_isolates_bulk_write_failures():
+    """A failed bulk write falls back per row and never fails completed evaluations."""
+    evaluation = PipelineEvaluation(
+        decision=AgentDecision(
+            action="n", tone=ToneType.NEUTRAL, message="m", analysis_summary="s"
+        ),
+        excuse=ExcuseAnalysis(
+            category=ExcuseCategory.LEGITIMATE, confidence_score=1, reasoning="r"
+        ),
+        risk=RiskAssessment(
+            risk_score=0.1, level=RiskLevel.LOW, predicted_latency_days=0, mitigation_strategy="n"
+        ),
+        burnout=BurnoutDetection(is_at_risk=False, sentiment_indicators=[], recommendation="r"),
+    )
+    brain = MagicMock()
+    brain.evaluate_participation = AsyncMock(return_value=evaluation)
+    brain.get_or_create_persona = AsyncMock()
+    brain.detect_language_locally.return_value = None
+    locked = UserHistory(
+        user_id="locked", is_context_verified=True, industry_type="finance", department="audit"
+    )
+    requests = [
+        {"user_id": "locked", "commitment": "c", "check_in": "s", "industry": "generic"},
+        {"user_id": "sensed", "commitment": "c", "check_in": "s", "industry": "AUTO"},
+    ]
+
+    with (
+        patch(
+            "src.worker.load_user_contexts", new_callable=AsyncMock, return_value={"locked": locked}
+        ),
+        patch("src.worker.resolve_safety_rules", new_callable=AsyncMock) as mock_rules,
+        patch(
+            "src.worker.update_user_reliability_many",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("deadlock"),
+        ),
+        patch("src.worker.update_user_reliability", new_callable=AsyncMock) as mock_single,
+    ):
+        results = await run_evaluation_batch(brain, requests)
+
+    assert results == [evaluation, evaluation]
+    # Warm-up uses the scope each evaluation will resolve; AUTO is left to context sensing
+    mock_rules.assert_awaited_once_with("finance", "audit")
+    assert [call.args[0] for call in mock_single.await_args_list] == ["locked", "sensed"]
+
+
+def test_only_evaluation_results_are_kept_for_replays():
+    from arq.worker import Function
+
+    from src.core.config import settings
+    from src.worker import WorkerSettings
 
-        await shutdown({})
-        mock_scheduler.shutdown.assert_called_once()
+    assert not hasattr(WorkerSettings, "keep_result")
+    keep = {
+        (f.name, f.keep_result_s) if isinstance(f, Function) else (f.__name__, None)
+        for f in WorkerSettings.functions
+    }
+    assert ("process_commitment_eval", settings.EVALUATION_RESULT_TTL_SECONDS) in keep
+    assert ("send_follow_up", None) in keep